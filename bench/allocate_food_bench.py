@@ -0,0 +1,60 @@
+"""
+Food allocation benchmark: legacy per-unit loop vs Environment allocation modes.
+
+Populations follow configs/stress_large.yaml (2000) and configs/stress_extreme.yaml
+(10000); food piles span ordinary to farming-inflated generations.
+
+Usage:
+  py bench/allocate_food_bench.py
+"""
+from __future__ import annotations
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lifeos.environment import Environment, EnvironmentConfig  # noqa: E402
+
+POPULATIONS = (2000, 10000)
+FOOD_UNITS = (1000, 5000, 20000)
+
+
+def _legacy_allocate(rng: random.Random, ids, weights, units: int):
+    """The original allocation: one choices() call per food unit."""
+    alloc = {i: 0 for i in ids}
+    for _ in range(units):
+        alloc[rng.choices(ids, weights=weights, k=1)[0]] += 1
+    return alloc
+
+
+def _time(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run(populations=POPULATIONS, food_units=FOOD_UNITS, seed: int = 42):
+    results = []
+    wrng = random.Random(seed)
+    for pop in populations:
+        ids = list(range(pop))
+        weights = [1.0 + wrng.random() for _ in ids]
+        for units in food_units:
+            row = {"population": pop, "food": units}
+            row["legacy_s"] = _time(lambda: _legacy_allocate(random.Random(seed), ids, weights, units), repeat=1)
+            for mode in ("loop", "multinomial"):
+                env = Environment(EnvironmentConfig(rng_seed=seed, allocation_mode=mode))
+                row[f"{mode}_s"] = _time(lambda: env.draw_allocation(weights, units))
+            row["speedup_multinomial"] = round(row["legacy_s"] / max(row["multinomial_s"], 1e-12), 1)
+            results.append(row)
+    return {"allocate_food": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,70 @@
+"""
+Crossover throughput: per-couple `ReproductionModel.mate` vs batched `mate_batch`
+(uniform, 2-point and linkage-map crossover) at increasing genome lengths.
+
+Reports children per second for one cohort of COHORT children per length.
+
+Usage:
+  py bench/crossover_bench.py
+"""
+from __future__ import annotations
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lifeos.genome import Genome, Locus  # noqa: E402
+from lifeos.reproduction import ReproductionModel  # noqa: E402
+
+GENOME_LENGTHS = (8, 32, 128, 512)
+COHORT = 5000
+POPULATION = 1000
+
+
+def _time(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run(lengths=GENOME_LENGTHS, cohort: int = COHORT, seed: int = 42):
+    results = []
+    for n_loci in lengths:
+        loci = [Locus(name=f"g{i}", type="float") for i in range(n_loci)]
+        rng = random.Random(seed)
+        genomes = [Genome.random_init(loci, rng) for _ in range(POPULATION)]
+        genes = np.array([g.codes() for g in genomes])
+        np_rng = np.random.default_rng(seed)
+        pa = np_rng.integers(0, POPULATION, cohort)
+        pb = np_rng.integers(0, POPULATION, cohort)
+        pairs = list(zip(pa.tolist(), pb.tolist()))
+
+        row = {"loci": n_loci, "children": cohort}
+        model = ReproductionModel()
+        secs = _time(lambda: [model.mate(genomes[a], genomes[b], rng) for a, b in pairs], repeat=1)
+        row["mate_loop_per_s"] = round(cohort / secs)
+        models = {
+            "uniform": model,
+            "k_point": ReproductionModel(mode="k_point", points=2),
+            "linkage": ReproductionModel(mode="linkage", linkage=[0.05] * (n_loci - 1)),
+        }
+        for name, m in models.items():
+            secs = _time(lambda: m.mate_batch(genes, pa, pb, np_rng))
+            row[f"batch_{name}_per_s"] = round(cohort / secs)
+        secs = _time(lambda: model.mate_cohort([genomes[a] for a in pa], [genomes[b] for b in pb], np_rng))
+        row["cohort_uniform_per_s"] = round(cohort / secs)
+        row["speedup_batch_uniform"] = round(row["batch_uniform_per_s"] / row["mate_loop_per_s"], 1)
+        results.append(row)
+    return {"crossover": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
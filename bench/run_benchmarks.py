@@ -0,0 +1,284 @@
+"""
+Microbenchmarks of the engine hot paths at the population sizes of
+configs/sample_*.yaml and configs/stress_*.yaml (each size with its config's
+loci and mutation rate):
+
+  allocate_food     Environment.allocate_food over the whole population
+  pair_adults       AdamEveWorld._pair_unpaired_adults with everyone unpaired
+  mate              ReproductionModel.mate, one child per individual
+  mutate            MutationModel.mutate, every individual
+  decode            TraitDecoder.decode, every individual (cache off)
+  world_step        World.step_generation (one generation per call)
+  adam_eve_step     AdamEveWorld.step_generation of generation 4 of a fresh world of
+                    population_size / 2 founder couples (generations 1-3 run untimed),
+                    with food and oxygen for population_size agents
+
+For each (benchmark, config) it reports ops/sec (individuals per second at
+the median call; generations per second for adam_eve_step), per-call latency
+percentiles (per generation for the step benchmarks) and the tracemalloc peak
+of one call, and writes everything as JSON so runs can be compared between
+commits (--compare). Every adam_eve_step sample times the same generation of
+an identically seeded world; its population before each timed step is
+recorded per sample.
+
+Usage:
+  py bench/run_benchmarks.py [--only mate,decode] [--max-size 2000] [--repeat 7] [--out results.json]
+  py bench/run_benchmarks.py --compare old.json new.json
+"""
+from __future__ import annotations
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from lifeos.adam_eve_engine import AdamEveWorld  # noqa: E402
+from lifeos.ensemble import loci_from_config  # noqa: E402
+from lifeos.genome import GenomeSchema, MutationModel, random_init  # noqa: E402
+from lifeos.multiverse_engine import World  # noqa: E402
+from lifeos.reproduction import ReproductionModel  # noqa: E402
+from lifeos.traits import TraitDecoder  # noqa: E402
+
+CONFIG_GLOBS = ("sample_*.yaml", "stress_*.yaml")
+SEED = 42
+WARM_GENERATIONS = 3  # adam_eve_step: untimed generations before the timed one
+
+# a benchmark maps (population size, config) to (setup, call, ops per call);
+# setup() runs untimed before every call and its result is passed to call().
+# A call may return its population size, which is then reported per sample.
+Bench = Callable[[int, Dict[str, Any]], Tuple[Callable[[], Any], Callable[[Any], Any], int]]
+
+
+# -------------------------
+# Configs
+# -------------------------
+def load_sizes(config_dir: Path = ROOT / "configs") -> List[Dict[str, Any]]:
+    """One entry per config with a population_size: name, size, loci, mutation rate."""
+    out = []
+    for pattern in CONFIG_GLOBS:
+        for path in sorted(config_dir.glob(pattern)):
+            cfg = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+            if "population_size" not in cfg:
+                continue
+            out.append({
+                "config": path.stem,
+                "size": int(cfg["population_size"]),
+                "loci": loci_from_config(cfg),
+                "mutation_rate": float((cfg.get("mutation") or {}).get("per_locus_rate", 0.01)),
+            })
+    return sorted(out, key=lambda c: c["size"])
+
+
+def _genomes(n: int, cfg: Dict[str, Any]):
+    return random_init(GenomeSchema.of(cfg["loci"]), n, random.Random(SEED))
+
+
+def _adam_eve(n: int, cfg: Dict[str, Any], **kwargs) -> AdamEveWorld:
+    kwargs.setdefault("generations", 1)
+    world = AdamEveWorld(loci=cfg["loci"], num_couples=max(1, n // 2), seed=SEED,
+                         mutation_rate=cfg["mutation_rate"], **kwargs)
+    world.initialize_founders()
+    return world
+
+
+# -------------------------
+# Hot paths
+# -------------------------
+def bench_allocate_food(n, cfg):
+    world = _adam_eve(n, cfg)
+    env = world.environment
+
+    def setup():
+        env.food = len(world.population)  # one unit per agent, as in a replenished generation
+
+    return setup, lambda _: env.allocate_food(world.population, world.state), len(world.population)
+
+
+def bench_pair_adults(n, cfg):
+    def setup():
+        world = AdamEveWorld(loci=cfg["loci"], num_couples=0, generations=1, seed=SEED)
+        for g in _genomes(n, cfg):
+            ind = world._new_individual(g)
+            world.state[ind.id].phase = world.pair_at_phase
+            world.population.append(ind)
+        world.index.rebuild(world.population)
+        return world
+
+    return setup, lambda world: world._pair_unpaired_adults(1), n
+
+
+def bench_mate(n, cfg):
+    genomes = _genomes(n, cfg)
+    model = ReproductionModel()
+    rng = random.Random(SEED)
+    pairs = [(genomes[i], genomes[(i + 1) % n]) for i in range(n)]
+    return (lambda: None), lambda _: [model.mate(a, b, rng) for a, b in pairs], n
+
+
+def bench_mutate(n, cfg):
+    genomes = _genomes(n, cfg)
+    model = MutationModel(per_locus_rate=cfg["mutation_rate"])
+    rng = random.Random(SEED)
+    return (lambda: None), lambda _: [model.mutate(g, rng) for g in genomes], n
+
+
+def bench_decode(n, cfg):
+    genomes = _genomes(n, cfg)
+    decoder = TraitDecoder(cfg["loci"], cache=False)
+    return (lambda: None), lambda _: [decoder.decode(g) for g in genomes], n
+
+
+def bench_world_step(n, cfg):
+    world = World(name="bench", loci=cfg["loci"], population_size=n, generations=1, seed=SEED,
+                  mutation_rate=cfg["mutation_rate"])
+    world.initialize()
+    gen = iter(range(1, 1 << 30))
+    return (lambda: next(gen)), world.step_generation, n
+
+
+def bench_adam_eve_step(n, cfg):
+    def setup():
+        # a fresh world per sample, warmed to the same generation, so every sample times the same work;
+        # food and oxygen for n agents hold the population at the config's size
+        world = _adam_eve(n, cfg, generations=WARM_GENERATIONS + 1,
+                          env_cfg={"base_food_per_gen": n, "base_oxygen_per_gen": n})
+        for g in range(1, WARM_GENERATIONS + 1):
+            world.step_generation(g)
+        return world
+
+    def call(world):
+        size = len(world.population)
+        g = WARM_GENERATIONS + 1
+        world.step_generation(g)
+        world.compute_metrics(g)
+        return size
+
+    return setup, call, 1  # the population changes size, so ops are generations
+
+
+BENCHMARKS: Dict[str, Bench] = {
+    "allocate_food": bench_allocate_food,
+    "pair_adults": bench_pair_adults,
+    "mate": bench_mate,
+    "mutate": bench_mutate,
+    "decode": bench_decode,
+    "world_step": bench_world_step,
+    "adam_eve_step": bench_adam_eve_step,
+}
+
+
+# -------------------------
+# Runner
+# -------------------------
+def measure(bench: Bench, n: int, cfg: Dict[str, Any], repeat: int) -> Dict[str, Any]:
+    setup, call, ops = bench(n, cfg)
+    times = []
+    sizes = []
+    for _ in range(repeat):
+        state = setup()
+        t0 = time.perf_counter_ns()
+        size = call(state)
+        times.append((time.perf_counter_ns() - t0) / 1e6)
+        if isinstance(size, int):
+            sizes.append(size)
+
+    # peak memory of one more call, traced separately so tracing does not skew the timings
+    state = setup()
+    tracemalloc.start()
+    call(state)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    ms = np.asarray(times)
+    out = {
+        "ops": ops,
+        "ops_per_s": round(ops / (float(np.median(ms)) / 1e3)) if ms.any() else None,
+        "latency_ms": {"p50": round(float(np.percentile(ms, 50)), 4),
+                       "p90": round(float(np.percentile(ms, 90)), 4),
+                       "p99": round(float(np.percentile(ms, 99)), 4),
+                       "mean": round(float(ms.mean()), 4)},
+        "peak_kb": round(peak / 1024, 1),
+    }
+    if sizes:
+        out["population"] = sizes
+    return out
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(only=None, max_size=None, repeat: int = 7) -> Dict[str, Any]:
+    configs = [c for c in load_sizes() if max_size is None or c["size"] <= max_size]
+    results = []
+    for name, bench in BENCHMARKS.items():
+        if only and name not in only:
+            continue
+        for cfg in configs:
+            row = {"bench": name, "config": cfg["config"], "size": cfg["size"]}
+            row.update(measure(bench, cfg["size"], cfg, repeat))
+            results.append(row)
+            print(f"{name:14s} {cfg['config']:15s} n={cfg['size']:<6d} {row['ops_per_s'] or 0:>12,} ops/s  "
+                  f"p50 {row['latency_ms']['p50']:.2f}ms  p99 {row['latency_ms']['p99']:.2f}ms  "
+                  f"peak {row['peak_kb']:.0f}KB", file=sys.stderr)
+    return {
+        "meta": {"commit": _commit(), "python": platform.python_version(), "numpy": np.__version__,
+                 "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "repeat": repeat},
+        "results": results,
+    }
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """ops/sec ratio new / old for every (bench, config) present in both runs."""
+    before = {(r["bench"], r["config"]): r for r in old["results"]}
+    rows = []
+    for r in new["results"]:
+        o = before.get((r["bench"], r["config"]))
+        if o and o["ops_per_s"] and r["ops_per_s"]:
+            rows.append({"bench": r["bench"], "config": r["config"], "size": r["size"],
+                         "old_ops_per_s": o["ops_per_s"], "new_ops_per_s": r["ops_per_s"],
+                         "speedup": round(r["ops_per_s"] / o["ops_per_s"], 2)})
+    return rows
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--only", default=None, help=f"Comma-separated subset of: {', '.join(BENCHMARKS)}")
+    ap.add_argument("--max-size", type=int, default=None, help="Skip configs with a larger population_size")
+    ap.add_argument("--repeat", type=int, default=7, help="Timed calls per benchmark and size (default: 7)")
+    ap.add_argument("--out", default=None, help="Write JSON results here (default: stdout)")
+    ap.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two result files and exit")
+    args = ap.parse_args()
+
+    if args.compare:
+        old, new = (json.loads(Path(p).read_text(encoding="utf-8")) for p in args.compare)
+        print(json.dumps(compare(old, new), indent=2))
+        return
+
+    only = set(args.only.split(",")) if args.only else None
+    result = run(only=only, max_size=args.max_size, repeat=args.repeat)
+    text = json.dumps(result, indent=2)
+    if args.out:
+        Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.out).write_text(text, encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
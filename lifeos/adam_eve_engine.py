@@ -3,14 +3,23 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
-import csv, json, random
+import json, random
 
-from .genome import Locus, Genome, MutationModel
+import numpy as np
+
+from .genome import Locus, Genome, GenomeSchema, MutationModel, random_init
 from .reproduction import ReproductionModel
 from .lineage import LineageTracker, Individual
-from .adam_eve_memory import RingMemory, SharedLedger
+from .archive import LineageArchive
+from .event_log import EventLogWriter
+from .adam_eve_memory import RingMemory, SharedLedger, MemoryStore, MEMORY_EVENTS
 from .environment import Environment, EnvironmentConfig
-from .sentient_mk6 import SentientMind, MindConfig  # <-- NEW
+from .matching import match_pairs
+from .population import PopulationIndex, CoupleRegistry, ColumnarPopulation, NO_ID
+from .metrics import MetricsCollector, CSVMetricsSink, PhaseTimer, open_sink
+from .stats import RunningStats
+from .sentient_mk6 import SentientMind, MindConfig, MindBatch  # <-- NEW
+from .rng import CounterRNG, FOUNDERS, REPRODUCTION, MIND, PAIRING, CAPS
 
 # Optional PSAI policy (loaded only if selected)
 try:
@@ -26,17 +35,63 @@ except Exception:
 class PersonState:
     # Age/life-cycle
     phase: int = 0
+    born: int = 0  # generation of birth (0 for founders)
     # Social / family
     partner_id: Optional[int] = None
     couple_id: Optional[int] = None
     children_count: int = 0
     # Physiology / memory
     energy: float = 50.0
-    memory: RingMemory = field(default_factory=lambda: RingMemory(capacity=8))
+    memory: Optional[RingMemory] = field(default_factory=lambda: RingMemory(capacity=8))  # None with a MemoryStore
     # Cognition
     mind: Optional[SentientMind] = None  # <-- NEW
 
 
+def _column(name: str, cast, optional_id: bool = False) -> property:
+    def fget(self):
+        v = getattr(self._cols, name)[self._slot]
+        if optional_id and v == NO_ID:
+            return None
+        return cast(v)
+
+    def fset(self, value):
+        getattr(self._cols, name)[self._slot] = NO_ID if value is None else value
+
+    return property(fget, fset)
+
+
+class ColumnarState:
+    """
+    PersonState view over a ColumnarPopulation slot (backend="columnar").
+    Numeric fields live in the shared arrays; memory and mind stay per agent.
+    """
+    __slots__ = ("_cols", "_slot", "memory", "mind")
+
+    phase = _column("phase", int)
+    born = _column("born", int)
+    partner_id = _column("partner_id", int, optional_id=True)
+    couple_id = _column("couple_id", int, optional_id=True)
+    children_count = _column("children_count", int)
+    energy = _column("energy", float)
+
+    def __init__(self, cols: ColumnarPopulation, slot: int, with_memory: bool = True):
+        self._cols = cols
+        self._slot = slot
+        self.memory: Optional[RingMemory] = RingMemory(capacity=8) if with_memory else None
+        self.mind: Optional[SentientMind] = None
+
+
+BACKENDS = ("objects", "columnar")
+EVENT_LOGS = ("memory", "jsonl", "off")
+FOUNDER_INITS = ("stream", "bulk")
+MEMORY_BACKENDS = ("ring", "columnar")
+MIND_MODES = ("agent", "batch")
+REPRO_MODES = ("couple", "cohort")
+RNG_MODES = ("mt", "counter")
+# timed phases of step_generation, in order (timings=True)
+STEP_PHASES = ("age", "pair", "minds", "reproduce", "env", "compact")
+
+
 # ---------------------
 # Adam & Eve World
 # ---------------------
@@ -68,8 +123,39 @@ class AdamEveWorld:
         policy: str = "baseline",                 # "baseline" or "psai"
         env_cfg: Optional[dict] = None,           # environment config dict
         out_dir: Optional[Path] = None,
+        metrics_sink: str = "csv",                # "csv", "columnar" or "sqlite"
+        metrics_flush_every: Optional[int] = None,  # rows buffered per flush (sink default if None)
+        backend: str = "objects",                 # "objects" (PersonState) or "columnar" (NumPy arrays)
+        mind_mode: str = "agent",                 # "agent" (SentientMind per agent) or "batch" (MindBatch)
+        rng_mode: str = "mt",                     # "mt" (one seeded stream) or "counter" (Philox streams)
+        compact_every: Optional[int] = None,      # archive dead agents every N generations (None => keep all)
+        archive_path: Optional[Path] = None,      # lineage archive file (default: <out_dir>/lineage_archive.bin)
+        event_log: str = "memory",                # "memory" (reproduction_events.json), "jsonl" (streamed) or "off"
+        event_log_background: bool = False,       # jsonl only: write on a background thread
+        memory_backend: str = "ring",             # "ring" (RingMemory per agent) or "columnar" (MemoryStore)
+        repro_mode: str = "couple",               # "couple" (mate per couple) or "cohort" (batched crossover + mutation)
+        founder_init: str = "stream",             # "stream" (one random_init per founder) or "bulk" (one matrix draw)
+        timings: bool = False,                    # add per-phase wall times (t_<phase>_ms) to the metrics rows
     ):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend!r}")
+        if mind_mode not in MIND_MODES:
+            raise ValueError(f"Unknown mind_mode: {mind_mode!r}")
+        if mind_mode == "batch" and backend != "columnar":
+            raise ValueError('mind_mode="batch" requires backend="columnar"')
+        if rng_mode not in RNG_MODES:
+            raise ValueError(f"Unknown rng_mode: {rng_mode!r}")
+        if event_log not in EVENT_LOGS:
+            raise ValueError(f"Unknown event_log: {event_log!r}")
+        if memory_backend not in MEMORY_BACKENDS:
+            raise ValueError(f"Unknown memory_backend: {memory_backend!r}")
+        if repro_mode not in REPRO_MODES:
+            raise ValueError(f"Unknown repro_mode: {repro_mode!r}")
+        if founder_init not in FOUNDER_INITS:
+            raise ValueError(f"Unknown founder_init: {founder_init!r}")
         self.rng = random.Random(int(seed))
+        # counter-based streams keyed by (seed, purpose, agent id, generation)
+        self.streams: Optional[CounterRNG] = CounterRNG(int(seed)) if rng_mode == "counter" else None
         self.loci = loci
         self.num_couples = int(num_couples)
         self.generations = int(generations)
@@ -86,13 +172,37 @@ class AdamEveWorld:
 
         self.decoder_mutation = MutationModel(per_locus_rate=float(mutation_rate))
         self.repro = ReproductionModel(crossover_rate=0.5)
+        # repro_mode="cohort": a generation's children are crossed over and mutated in batched calls
+        self.repro_mode = repro_mode
+        self.founder_init = founder_init
+        self.seed = int(seed)
+        self._np_rngs: Dict[int, np.random.Generator] = {}   # rng_mode="mt": one NumPy generator per purpose
         self.lineage = LineageTracker()
+        self.compact_every: Optional[int] = int(compact_every) if compact_every else None
+        self.archive_path: Optional[Path] = Path(archive_path) if archive_path else None
+        self._dead: Dict[int, int] = {}                      # id -> death generation, awaiting compaction
         self.out_dir: Optional[Path] = out_dir
+        self.metrics_sink = metrics_sink
+        self.metrics_flush_every = metrics_flush_every
+        # timings=True: step_generation charges each numbered phase to a PhaseTimer
+        self.timer: Optional[PhaseTimer] = PhaseTimer(list(STEP_PHASES)) if timings else None
 
         self.population: List[Individual] = []
-        self.state: Dict[int, PersonState] = {}              # id -> PersonState
-        self.couple_cap: Dict[int, Optional[int]] = {}       # couple_id -> cap or None for unlimited
-        self.couple_members: Dict[int, Tuple[int, int]] = {} # couple_id -> (idA, idB)
+        self.index = PopulationIndex(self.population)        # id -> slot in self.population
+        self.state: Dict[int, PersonState] = {}              # id -> PersonState (or ColumnarState)
+        self.backend = backend
+        self.columns: Optional[ColumnarPopulation] = ColumnarPopulation() if backend == "columnar" else None
+
+        # Batched minds keep their state (curiosity) as a population column
+        self.minds: Optional[MindBatch] = None
+        if mind_mode == "batch":
+            self.minds = MindBatch(seed=int(seed) ^ 0x5EED_0B7A)
+            self.columns.add_column("curiosity", np.float64, 0.5)
+        # memory_backend="columnar": every agent's last-K events live in one MemoryStore
+        self.memory_store: Optional[MemoryStore] = MemoryStore(k=8) if memory_backend == "columnar" else None
+        self.couples = CoupleRegistry()
+        self.couple_cap: Dict[int, Optional[int]] = self.couples.caps         # couple_id -> cap or None for unlimited
+        self.couple_members: Dict[int, Tuple[int, int]] = self.couples.members # couple_id -> (idA, idB)
         self._next_id = 0
 
         # Shared memory ledger (global KB-scale)
@@ -100,6 +210,15 @@ class AdamEveWorld:
 
         # audit trail of births/deaths (do NOT log farming here to keep tests stable)
         self.reproduction_events: List[Dict] = []
+        # event_log="jsonl": events stream to <out_dir>/reproduction_events.jsonl during run();
+        # "off": events are only counted (metrics), never kept or written
+        self.event_log = event_log
+        self.event_log_background = bool(event_log_background)
+        self.event_writer: Optional[EventLogWriter] = None
+        # per-generation birth/death counters, updated as events are recorded
+        self.collector = MetricsCollector()
+        # energy distribution of the living at the last compute_metrics call
+        self.energy_stats: Optional[RunningStats] = None
 
         # optional: load trait specs (names only)
         self.available_traits: List[str] = self._load_trait_names(self.traits_dir) if self.traits_dir else []
@@ -121,17 +240,44 @@ class AdamEveWorld:
             base_metabolic_cost = float(ecfg.get("base_metabolic_cost", 1.0)),
             birth_cost = float(ecfg.get("birth_cost", 2.0)),
             rng_seed = int(ecfg.get("rng_seed", int(seed))),
+            allocation_mode = str(ecfg.get("allocation_mode", "loop")),
+            rng_mode = str(ecfg.get("rng_mode", rng_mode)),
         )
         self.environment = Environment(env_conf)
 
     # ---------- utils ----------
-    def _new_individual(self, genome: Genome, parents: Optional[List[int]] = None) -> Individual:
+    def _np_stream(self, purpose: int, generation: int = 0) -> np.random.Generator:
+        """NumPy generator for batched draws: one per purpose ("mt"), or keyed by generation ("counter")."""
+        if self.streams is not None:
+            return self.streams.numpy_generator(purpose, 0, generation)
+        rng = self._np_rngs.get(purpose)
+        if rng is None:
+            rng = self._np_rngs[purpose] = np.random.default_rng([self.seed % (1 << 64), purpose])
+        return rng
+
+    def _stream(self, purpose: int, agent_id: int = 0, generation: int = 0):
+        """The world rng ("mt"), or the counter-based stream for these coordinates ("counter")."""
+        if self.streams is None:
+            return self.rng
+        return self.streams.stream(purpose, agent_id, generation)
+
+    def _new_individual(self, genome: Genome, parents: Optional[List[int]] = None, born: int = 0) -> Individual:
         ind = Individual(id=self._next_id, genome=genome, parents=parents)
         self._next_id += 1
         self.lineage.add_individual(ind)
-        st = PersonState()
-        # wire the mind
-        st.mind = SentientMind(agent_id=ind.id, cfg=MindConfig(rng_seed=self.rng.randint(1, 10_000_000)))
+        with_memory = self.memory_store is None
+        if self.columns is not None:
+            st = ColumnarState(self.columns, self.columns.add(ind.id), with_memory=with_memory)
+        else:
+            st = PersonState() if with_memory else PersonState(memory=None)
+        if not with_memory:
+            self.memory_store.add(ind.id)
+        # wire the mind (batched minds live in self.minds instead)
+        if self.minds is None and self.streams is not None:
+            st.mind = SentientMind(agent_id=ind.id, cfg=MindConfig(), rng=self.streams.stream(MIND, ind.id))
+        elif self.minds is None:
+            st.mind = SentientMind(agent_id=ind.id, cfg=MindConfig(rng_seed=self.rng.randint(1, 10_000_000)))
+        st.born = born
         self.state[ind.id] = st
         return ind
 
@@ -142,121 +288,210 @@ class AdamEveWorld:
                 names.append(p.stem)
         return sorted(set(names))
 
-    def _are_full_siblings(self, a: Individual, b: Individual) -> bool:
-        pa = set(a.parents or [])
-        pb = set(b.parents or [])
-        return len(pa) == 2 and pa == pb
-
-    def _couple_cap_value(self) -> Optional[int]:
+    def _couple_cap_value(self, member_id: int = 0) -> Optional[int]:
         lo, hi = self.children_cap_range
         if hi >= 9999:
             return None  # unlimited
-        return self.rng.randint(lo, hi)
+        return self._stream(CAPS, agent_id=member_id).randint(lo, hi)
+
+    def _record_event(self, event: Dict):
+        if self.event_writer is not None:
+            self.event_writer.write(event)
+        elif self.event_log == "memory":
+            self.reproduction_events.append(event)
+        self.collector.record(event["generation"], event["event"])
+
+    def _set_population(self, population: List[Individual]):
+        self.population = population
+        self.index.rebuild(population)
+
+    def _remember(self, gen: int, event: str, ids: List[int], others: List[int]):
+        """Record `event` in the memory of each of `ids` (counterpart id from `others`)."""
+        if self.memory_store is not None:
+            self.memory_store.remember_many(ids, gen, event, others)
+            return
+        key = MEMORY_EVENTS[event][1]
+        for agent_id, other in zip(ids, others):
+            self.state[agent_id].memory.remember(gen, {"event": event, key: other})
+
+    def _mate_cohort(self, gen: int, cohort: List[Tuple[Individual, Individual, Individual]]):
+        """Cross over and mutate all of this generation's children in two batched calls."""
+        np_rng = self._np_stream(REPRODUCTION, generation=gen)
+        genomes = self.repro.mate_cohort([a.genome for a, _, _ in cohort], [b.genome for _, b, _ in cohort], np_rng)
+        genomes = self.decoder_mutation.mutate_cohort(genomes, np_rng)
+        for (_, _, child), genome in zip(cohort, genomes):
+            child.genome = genome
+
+    def _note_deaths(self, ids, gen: int):
+        """Remember who died when, for the next compaction (no-op when compaction is off)."""
+        if self.compact_every is not None:
+            for did in ids:
+                self._dead[did] = gen
+
+    def _register_couple(self, a: int, b: int) -> int:
+        cid = self.couples.register(a, b, self._couple_cap_value(a))
+        for me, other in ((a, b), (b, a)):
+            st = self.state[me]
+            st.partner_id = other
+            st.couple_id = cid
+        return cid
+
+    # ---------- columnar fast paths ----------
+    def _age_columnar(self, gen: int):
+        cols = self.columns
+        slots = cols.live_slots()  # aligned with self.population
+        if gen > 0:
+            cols.phase[slots] += 1
+        if self.lifespan_phases is None:
+            return
+        keep = cols.phase[slots] < self.lifespan_phases
+        if keep.all():
+            return
+        cols.alive[slots[~keep]] = False
+        self._note_deaths(cols.ids[slots[~keep]].tolist(), gen)
+        pop = self.population
+        self._set_population([pop[i] for i in np.flatnonzero(keep).tolist()])
+
+    def _reproduction_candidates_columnar(self) -> List[Individual]:
+        cols = self.columns
+        slots = cols.live_slots()
+        threshold = self.pair_at_phase if self.reproduction_phase is None else self.reproduction_phase
+        mask = (cols.phase[slots] >= threshold) & (cols.partner_id[slots] != NO_ID) & (cols.couple_id[slots] != NO_ID)
+        pop = self.population
+        return [pop[i] for i in np.flatnonzero(mask).tolist()]
+
+    # ---------- minds ----------
+    def _decide_minds_agents(self, gen: int) -> int:
+        """Phase 2.5 for mind_mode="agent": ask each SentientMind, returns farmed food."""
+        total_farm_food = 0
+        for ind in self.population:
+            st = self.state[ind.id]
+            if st.mind is None:
+                continue
+            env_snap = {"food": self.environment.food, "oxygen": self.environment.oxygen, "population": len(self.population)}
+            actions = st.mind.decide_actions(gen, st.energy, env_snap)
+            for act in actions:
+                if act.get("type") == "farm":
+                    effort = float(act.get("effort", 0.0))
+                    if effort <= 0:
+                        continue
+                    # apply energy cost
+                    st.energy -= effort * self.FARM_ENERGY_COST_PER_EFFORT
+                    # “create” food
+                    created = int(round(effort * self.FARM_YIELD_PER_EFFORT))
+                    if created > 0:
+                        total_farm_food += created
+                        # log to shared ledger only (keep reproduction_events clean)
+                        self.shared_ledger.add({"gen": gen, "event": "farm", "id": ind.id, "effort": round(effort, 3), "yield": created})
+                        if st.mind:
+                            st.mind.observe(gen, {"event": "farm", "effort": round(effort, 3), "yield": created})
+        return total_farm_food
+
+    def _decide_minds_batch(self, gen: int) -> int:
+        """Phase 2.5 for mind_mode="batch": one MindBatch pass, farm cost and yield applied in bulk."""
+        cols = self.columns
+        slots = cols.live_slots()
+        if len(slots) == 0:
+            return 0
+        env_snap = {"food": self.environment.food, "oxygen": self.environment.oxygen, "population": len(self.population)}
+        if self.streams is not None:
+            self.minds.rng = self.streams.numpy_generator(MIND, generation=gen)
+        curiosity = cols.curiosity[slots]
+        decisions = self.minds.decide(gen, cols.energy[slots], env_snap, curiosity=curiosity)
+        cols.curiosity[slots] = curiosity
+
+        effort = decisions.farm_effort
+        cols.energy[slots] -= effort * self.FARM_ENERGY_COST_PER_EFFORT
+        created = np.rint(effort * self.FARM_YIELD_PER_EFFORT).astype(np.int64)
+
+        # log to shared ledger only (keep reproduction_events clean)
+        yielded = np.flatnonzero(created > 0)
+        for aid, eff, got in zip(cols.ids[slots[yielded]].tolist(), effort[yielded].tolist(), created[yielded].tolist()):
+            self.shared_ledger.add({"gen": gen, "event": "farm", "id": aid, "effort": eff, "yield": got})
+        return int(created.sum())
 
     # ---------- init founders ----------
     def initialize_founders(self):
-        for cidx in range(self.num_couples):
-            g1 = Genome.random_init(self.loci, self.rng)
-            g2 = Genome.random_init(self.loci, self.rng)
+        bulk = None
+        if self.founder_init == "bulk":
+            # every founder genome in one (2 * num_couples, loci) matrix draw
+            bulk = iter(random_init(GenomeSchema.of(self.loci), 2 * self.num_couples, self._np_stream(FOUNDERS)))
+        for _ in range(self.num_couples):
+            if bulk is not None:
+                g1, g2 = next(bulk), next(bulk)
+            else:
+                g1 = Genome.random_init(self.loci, self._stream(FOUNDERS, agent_id=self._next_id))
+                g2 = Genome.random_init(self.loci, self._stream(FOUNDERS, agent_id=self._next_id + 1))
             a = self._new_individual(g1, parents=None)
             b = self._new_individual(g2, parents=None)
-            couple_id = cidx
-            self.state[a.id].partner_id = b.id
-            self.state[b.id].partner_id = a.id
-            self.state[a.id].couple_id = couple_id
-            self.state[b.id].couple_id = couple_id
-            cap = self._couple_cap_value()
-            self.couple_cap[couple_id] = cap
-            self.couple_members[couple_id] = (a.id, b.id)
+            self._register_couple(a.id, b.id)
             self.population.extend([a, b])
+            self.index.extend([a, b])
 
             # memory / log
-            self.state[a.id].memory.remember(0, {"event": "founder", "partner": b.id})
-            self.state[b.id].memory.remember(0, {"event": "founder", "partner": a.id})
+            self._remember(0, "founder", [a.id, b.id], [b.id, a.id])
             self.shared_ledger.add({"gen": 0, "event": "founder_pair", "ids": [a.id, b.id]})
 
     # ---------- pairing ----------
     def _pair_unpaired_adults(self, gen: int):
         pool = [ind for ind in self.population
                 if self.state[ind.id].partner_id is None and self.state[ind.id].phase >= self.pair_at_phase]
-        self.rng.shuffle(pool)
 
-        matched: set[int] = set()
-        for focal in pool:
-            if focal.id in matched:
-                continue
-            candidates = [c for c in pool if c.id not in matched and c.id != focal.id]
-            # incest block: prevent full-sibling pairs
-            candidates = [c for c in candidates if not self._are_full_siblings(focal, c)]
-            if not candidates:
-                continue
-
-            if self.policy:
-                partner = self.policy.choose_partner(focal, candidates)  # external PSAI chooser if present
-            else:
-                partner = self.rng.choice(candidates)
-
-            new_cid = max(self.couple_cap.keys(), default=self.num_couples - 1) + 1
-            self.state[focal.id].partner_id = partner.id
-            self.state[partner.id].partner_id = focal.id
-            self.state[focal.id].couple_id = new_cid
-            self.state[partner.id].couple_id = new_cid
-            cap = self._couple_cap_value()
-            self.couple_cap[new_cid] = cap
-            self.couple_members[new_cid] = (focal.id, partner.id)
-            matched.update([focal.id, partner.id])
+        # Indexed pool: O(1) removal, full-sibling block via parent-pair index.
+        # The PSAI chooser (if present) scores the pool once per round.
+        for focal, partner in match_pairs(pool, self._stream(PAIRING, generation=gen), chooser=self.policy):
+            self._register_couple(focal.id, partner.id)
 
             # memory / log
-            self.state[focal.id].memory.remember(gen, {"event": "paired", "partner": partner.id})
-            self.state[partner.id].memory.remember(gen, {"event": "paired", "partner": focal.id})
+            self._remember(gen, "paired", [focal.id, partner.id], [partner.id, focal.id])
             self.shared_ledger.add({"gen": gen, "event": "pair", "ids": [focal.id, partner.id]})
 
     # ---------- step ----------
     def step_generation(self, gen: int):
         births: List[Individual] = []
+        timer = self.timer
+        if timer is not None:
+            timer.start()
 
         # 1) Age and remove dead by lifespan cap (if any)
-        survivors: List[Individual] = []
-        for ind in self.population:
-            st = self.state[ind.id]
-            st.phase += 1 if gen > 0 else 0  # generation 0 is initial snapshot
-            if self.lifespan_phases is None or st.phase < self.lifespan_phases:
-                survivors.append(ind)
-        self.population = survivors
+        if self.columns is not None:
+            self._age_columnar(gen)
+        else:
+            survivors: List[Individual] = []
+            for ind in self.population:
+                st = self.state[ind.id]
+                st.phase += 1 if gen > 0 else 0  # generation 0 is initial snapshot
+                if self.lifespan_phases is None or st.phase < self.lifespan_phases:
+                    survivors.append(ind)
+            if len(survivors) < len(self.population):
+                alive = {ind.id for ind in survivors}
+                self._note_deaths([ind.id for ind in self.population if ind.id not in alive], gen)
+            self._set_population(survivors)
+        if timer is not None:
+            timer.lap("age")
 
         # 2) Pair newly eligible adults (loyal thereafter)
         self._pair_unpaired_adults(gen)
+        if timer is not None:
+            timer.lap("pair")
 
         # 2.5) Let minds decide proactive actions (e.g., FARM) BEFORE food is allocated
         # Convert effort into food & apply energy cost
-        total_farm_food = 0
-        for ind in self.population:
-            st = self.state[ind.id]
-            if st.mind is None:
-                continue
-            env_snap = {"food": self.environment.food, "oxygen": self.environment.oxygen, "population": len(self.population)}
-            actions = st.mind.decide_actions(gen, st.energy, env_snap)
-            for act in actions:
-                if act.get("type") == "farm":
-                    effort = float(act.get("effort", 0.0))
-                    if effort <= 0:
-                        continue
-                    # apply energy cost
-                    st.energy -= effort * self.FARM_ENERGY_COST_PER_EFFORT
-                    # “create” food
-                    created = int(round(effort * self.FARM_YIELD_PER_EFFORT))
-                    if created > 0:
-                        total_farm_food += created
-                        # log to shared ledger only (keep reproduction_events clean)
-                        self.shared_ledger.add({"gen": gen, "event": "farm", "id": ind.id, "effort": round(effort, 3), "yield": created})
-                        if st.mind:
-                            st.mind.observe(gen, {"event": "farm", "effort": round(effort, 3), "yield": created})
+        if self.minds is not None:
+            total_farm_food = self._decide_minds_batch(gen)
+        else:
+            total_farm_food = self._decide_minds_agents(gen)
         if total_farm_food > 0:
             self.environment.food += total_farm_food  # minds generated extra food before allocation
+        if timer is not None:
+            timer.lap("minds")
 
         # 3) Reproduction (at most once per couple per generation)
         repro_pairs_seen: set[int] = set()
-        for ind in self.population:
+        cohort: Optional[List[Tuple[Individual, Individual, Individual]]] = [] if self.repro_mode == "cohort" else None
+        # columnar backend pre-filters phase/partner eligibility in one array pass
+        candidates = self._reproduction_candidates_columnar() if self.columns is not None else self.population
+        for ind in candidates:
             st = self.state[ind.id]
 
             # NEW RULE:
@@ -282,25 +517,29 @@ class AdamEveWorld:
                 continue  # loyalty check
 
             # cap check (None => unlimited)
-            total_children = self.state[ind.id].children_count + self.state[pid].children_count
-            cap = self.couple_cap.get(cid, None)
-            if cap is not None and total_children >= cap:
+            if self.couples.at_cap(cid):
                 continue
 
             # Partner object
-            other = next((x for x in self.population if x.id == pid), None)
+            other = self.index.get(pid)
             if other is None:
                 continue
 
-            # child creation
-            child_genome = self.repro.mate(ind.genome, other.genome, self.rng)
-            child_genome = self.decoder_mutation.mutate(child_genome, self.rng)
-            child = self._new_individual(child_genome, parents=[ind.id, other.id])
+            # child creation (cohort mode: the genome is filled in after the loop)
+            if cohort is not None:
+                child = self._new_individual(None, parents=[ind.id, other.id], born=gen)
+                cohort.append((ind, other, child))
+            else:
+                rng = self._stream(REPRODUCTION, agent_id=ind.id, generation=gen)
+                child_genome = self.repro.mate(ind.genome, other.genome, rng)
+                child_genome = self.decoder_mutation.mutate(child_genome, rng)
+                child = self._new_individual(child_genome, parents=[ind.id, other.id], born=gen)
             births.append(child)
 
             # update couple children counts
             self.state[ind.id].children_count += 1
             self.state[pid].children_count += 1
+            self.couples.record_birth(cid)
             repro_pairs_seen.add(cid)
 
             # birth energy cost (parents)
@@ -309,7 +548,7 @@ class AdamEveWorld:
             self.state[pid].energy -= bc
 
             # audit + memory
-            self.reproduction_events.append({
+            self._record_event({
                 "generation": gen,
                 "event": "birth",
                 "parents": (ind.id, pid),
@@ -317,44 +556,110 @@ class AdamEveWorld:
                 "child_id": child.id,
                 "phase": st.phase,
             })
-            self.state[ind.id].memory.remember(gen, {"event": "birth", "child": child.id})
-            self.state[pid].memory.remember(gen, {"event": "birth", "child": child.id})
+            self._remember(gen, "birth", [ind.id, pid], [child.id, child.id])
             self.shared_ledger.add({"gen": gen, "event": "birth", "parents": [ind.id, pid], "child": child.id})
 
+        if cohort:
+            self._mate_cohort(gen, cohort)
+
         # 4) Add births now so newborns can be fed by the environment this generation
         self.population.extend(births)
+        self.index.extend(births)
+        if timer is not None:
+            timer.lap("reproduce")
 
         # 5) Environment tick: allocate food, apply metabolic costs, compute environmental deaths
-        env_summary = self.environment.tick(gen, self.population, self.state, policy_adapter=self.policy)
+        if self.columns is not None:
+            env_summary = self.environment.tick_columnar(gen, self.population, self.columns, self.state,
+                                                         policy_adapter=self.policy)
+        else:
+            env_summary = self.environment.tick(gen, self.population, self.state, policy_adapter=self.policy)
 
         # Apply environment deaths
         dead_ids = set(env_summary.get("deaths", []))
         if dead_ids:
-            self.population = [ind for ind in self.population if ind.id not in dead_ids]
+            self._set_population([ind for ind in self.population if ind.id not in dead_ids])
+            if self.columns is not None:
+                self.columns.kill(dead_ids)
+            self._note_deaths(dead_ids, gen)
             for did in dead_ids:
-                self.reproduction_events.append({
+                self._record_event({
                     "generation": gen,
                     "event": "death_env",
                     "id": did,
                     "reason": "env"
                 })
+        if timer is not None:
+            timer.lap("env")
+
+        # 6) Periodically move the dead out of memory
+        if self.compact_every is not None and gen % self.compact_every == 0:
+            self.compact()
+        if timer is not None:
+            timer.lap("compact")
+
+    # ---------- compaction ----------
+    def compact(self) -> int:
+        """
+        Archive agents that died since the last compaction and drop their live
+        state (PersonState, mind, memory, genome, columnar slot, and couples whose
+        members are both gone). Lineage queries fall through to the archive.
+        Returns the number of agents archived.
+        """
+        if not self._dead:
+            return 0
+        if self.lineage.archive is None:
+            path = self.archive_path
+            if path is None and self.out_dir is not None:
+                path = Path(self.out_dir) / "lineage_archive.bin"
+            self.lineage.archive = LineageArchive(self.loci, path=path)
+
+        for did in sorted(self._dead):
+            st = self.state.pop(did)
+            self.lineage.archive_individual(did, st.born, self._dead[did])
+            cid = st.couple_id
+            if cid is not None and cid in self.couples:
+                if not any(m in self.index for m in self.couples.members[cid]):
+                    self.couples.discard(cid)
+        archived = len(self._dead)
+        self._dead.clear()
+
+        if self.memory_store is not None:
+            self.memory_store.compact(ind.id for ind in self.population)
+        if self.columns is not None:
+            self.columns.compact()
+            slot_of = self.columns.slot_of
+            for ind in self.population:
+                self.state[ind.id]._slot = slot_of[ind.id]
+        return archived
 
     # ---------- metrics ----------
     def compute_metrics(self, generation: int) -> Dict[str, object]:
         alive = len(self.population)
-        pairs = sum(1 for ind in self.population if self.state[ind.id].partner_id is not None) // 2
-        births_this_gen = sum(1 for e in self.reproduction_events
-                              if e.get("event") == "birth" and e.get("generation") == generation)
-        deaths_env_this_gen = sum(1 for e in self.reproduction_events
-                                  if e.get("event") == "death_env" and e.get("generation") == generation)
-        avg_energy = (sum(self.state[ind.id].energy for ind in self.population) / max(1, alive)) if alive else 0.0
+        # one pass over the living; event counts come from the collector
+        energy = RunningStats()
+        if self.columns is not None:
+            slots = self.columns.live_slots()
+            paired = int(np.count_nonzero(self.columns.partner_id[slots] != NO_ID))
+            energy.add_array(self.columns.energy[slots])
+        else:
+            paired = 0
+            for ind in self.population:
+                st = self.state[ind.id]
+                if st.partner_id is not None:
+                    paired += 1
+                energy.add(st.energy)
+        self.energy_stats = energy
+        pairs = paired // 2
+        births_this_gen = self.collector.count(generation, "birth")
+        deaths_env_this_gen = self.collector.count(generation, "death_env")
+        avg_energy = energy.average if alive else 0.0
 
         # Environment levels
         food_left = getattr(getattr(self, "environment", None), "food", None)
         oxygen_left = getattr(getattr(self, "environment", None), "oxygen", None)
 
-        # Shared pool usage (KB)
-        used_bytes = len(str(self.shared_ledger.events).encode("utf-8"))
+        # Shared pool usage (KB) is tracked by the ledger itself
         return {
             "generation": generation,
             "alive": alive,
@@ -370,25 +675,43 @@ class AdamEveWorld:
 
     # ---------- I/O ----------
     def write_metrics_row(self, csv_path: Path, row: Dict[str, object]):
-        new = not csv_path.exists()
-        csv_path.parent.mkdir(parents=True, exist_ok=True)
-        with csv_path.open("a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=list(row.keys()))
-            if new:
-                writer.writeheader()
-            writer.writerow(row)
+        with CSVMetricsSink(csv_path, flush_every=1) as sink:
+            sink.write(row)
 
     def dump_lineage(self, path: Path):
         path.parent.mkdir(parents=True, exist_ok=True)
-        data = {int(k): v.parents for k, v in self.lineage.individuals.items()}
+        data = self.lineage.parents_map()
         path.write_text(json.dumps(data, indent=2), encoding="utf-8")
 
     # ---------- run ----------
-    def run(self, out_dir: Path):
-        self.out_dir = out_dir
-        out_dir.mkdir(parents=True, exist_ok=True)
-        metrics_csv = out_dir / "metrics.csv"
-
+    def iter_generations(self):
+        """
+        Create the founders, then yield the metrics row of each generation
+        (0..N) as it is simulated. With event_log="jsonl" the events stream to
+        <out_dir>/reproduction_events.jsonl (that needs `out_dir` to be set).
+        The event log and the shared ledger are closed when the iteration
+        ends or is abandoned.
+        """
+        try:
+            yield from self._generations()
+        finally:
+            self.shared_ledger.close()
+
+    def _generations(self):
+        if self.event_log == "jsonl":
+            if self.out_dir is None:
+                raise ValueError('event_log="jsonl" needs an out_dir (pass out_dir= or use run())')
+            Path(self.out_dir).mkdir(parents=True, exist_ok=True)
+            self.event_writer = EventLogWriter(Path(self.out_dir) / "reproduction_events.jsonl",
+                                               background=self.event_log_background)
+        try:
+            yield from self._simulate()
+        finally:
+            if self.event_writer is not None:
+                self.event_writer.close()
+                self.event_writer = None
+
+    def _simulate(self):
         # minimal loci fallback if user didn't wire custom loci
         if not self.loci:
             self.loci = [
@@ -401,18 +724,41 @@ class AdamEveWorld:
         self.initialize_founders()
 
         # g=0 snapshot
-        self.write_metrics_row(metrics_csv, self.compute_metrics(0))
+        yield self._metrics_row(0)
 
         # iterate generations
         for g in range(1, self.generations + 1):
             self.step_generation(g)
-            self.write_metrics_row(metrics_csv, self.compute_metrics(g))
+            yield self._metrics_row(g)
+
+    def _metrics_row(self, generation: int) -> Dict[str, object]:
+        """compute_metrics, plus the phase timings of the last step when timings are on."""
+        row = self.compute_metrics(generation)
+        if self.timer is not None:
+            row.update(self.timer.row())
+        return row
+
+    def run(self, out_dir: Path):
+        self.out_dir = out_dir
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        try:
+            self._run_outputs(out_dir)
+        finally:
+            self.shared_ledger.close()
+
+    def _run_outputs(self, out_dir: Path):
+        with open_sink(self.metrics_sink, out_dir, flush_every=self.metrics_flush_every) as sink:
+            for row in self._generations():
+                sink.write(row)
 
         # lineage & audit
+        if self.lineage.archive is not None:
+            self.lineage.archive.flush()
         self.dump_lineage(out_dir / "lineage.json")
-        (out_dir / "reproduction_events.json").write_text(
-            json.dumps(self.reproduction_events, indent=2), encoding="utf-8"
-        )
+        if self.event_log == "memory":
+            with (out_dir / "reproduction_events.json").open("w", encoding="utf-8") as f:
+                json.dump(self.reproduction_events, f, indent=2)  # streamed, no full-document string
         # small trait catalogue (if any)
         (out_dir / "traits_loaded.json").write_text(
             json.dumps(self.available_traits, indent=2), encoding="utf-8"
@@ -1,5 +1,12 @@
 from collections import deque
-from typing import Any, Dict, List
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+import json
+import mmap
+import struct
+
+import numpy as np
 
 
 class RingMemory:
@@ -13,14 +20,280 @@ class RingMemory:
     def recall(self) -> List[Dict[str, Any]]:
         return list(self.data)
 
+
+# -------------------------
+# Population-wide memory
+# -------------------------
+NO_ID = -1
+
+# event name -> (code, key of the counterpart id in the RingMemory dict)
+MEMORY_EVENTS = {
+    "founder": (1, "partner"),
+    "paired": (2, "partner"),
+    "birth": (3, "child"),
+}
+_MEMORY_NAMES = {code: (name, key) for name, (code, key) in MEMORY_EVENTS.items()}
+PARTNER_CODES = (MEMORY_EVENTS["founder"][0], MEMORY_EVENTS["paired"][0])
+BIRTH_CODE = MEMORY_EVENTS["birth"][0]
+
+
+class MemoryStore:
+    """
+    Every agent's last-K remembered events in shared typed arrays: a
+    (slots, K) ring per field (generation, event code, counterpart id) plus a
+    per-agent write head and count. Replaces one RingMemory deque of dicts per
+    agent; queries over many agents are array operations.
+    """
+
+    def __init__(self, k: int = 8, capacity: int = 64):
+        self.k = int(k)
+        self.capacity = max(1, int(capacity))
+        self.size = 0
+        self.slot_of: Dict[int, int] = {}
+        self._alloc(self.capacity)
+
+    def _alloc(self, cap: int):
+        self.gen = np.zeros((cap, self.k), dtype=np.int32)
+        self.code = np.zeros((cap, self.k), dtype=np.int8)
+        self.other = np.full((cap, self.k), NO_ID, dtype=np.int64)
+        self.head = np.zeros(cap, dtype=np.int64)
+        self.count = np.zeros(cap, dtype=np.int64)
+
+    def _resize(self, cap: int, keep: np.ndarray):
+        old = (self.gen, self.code, self.other, self.head, self.count)
+        self._alloc(cap)
+        n = len(keep)
+        for new, arr in zip((self.gen, self.code, self.other, self.head, self.count), old):
+            new[:n] = arr[keep]
+        self.capacity = cap
+
+    def add(self, agent_id: int) -> int:
+        """Give a new agent an empty ring and return its slot."""
+        if self.size >= self.capacity:
+            self._resize(self.capacity * 2, np.arange(self.size))
+        slot = self.size
+        self.size += 1
+        self.slot_of[agent_id] = slot
+        return slot
+
+    def compact(self, live_ids: Iterable[int]):
+        """Keep only `live_ids` (in that order), dropping everyone else's memory."""
+        live_ids = list(live_ids)
+        keep = np.array([self.slot_of[i] for i in live_ids], dtype=np.int64)
+        cap = self.capacity
+        while cap > 64 and 4 * len(keep) <= cap:
+            cap //= 2
+        self._resize(cap, keep)
+        self.size = len(keep)
+        self.slot_of = {agent_id: i for i, agent_id in enumerate(live_ids)}
+
+    def _slots(self, agent_ids) -> np.ndarray:
+        return np.array([self.slot_of[i] for i in agent_ids], dtype=np.int64)
+
+    # ---------- writing ----------
+    def remember(self, agent_id: int, gen: int, event: str, other: int):
+        self.remember_many([agent_id], gen, event, [other])
+
+    def remember_many(self, agent_ids, gen: int, event: str, others):
+        """One event of the same kind for many agents (each agent at most once per call)."""
+        slots = self._slots(agent_ids)
+        pos = self.head[slots]
+        self.gen[slots, pos] = gen
+        self.code[slots, pos] = MEMORY_EVENTS[event][0]
+        self.other[slots, pos] = np.asarray(others, dtype=np.int64)
+        self.head[slots] = (pos + 1) % self.k
+        self.count[slots] = np.minimum(self.count[slots] + 1, self.k)
+
+    # ---------- queries ----------
+    def _ages(self, slots: np.ndarray) -> np.ndarray:
+        """(n, K) age of each ring cell (0 = newest); cells never written get age K."""
+        pos = np.arange(self.k)
+        ages = (self.head[slots, None] - 1 - pos) % self.k
+        ages[ages >= self.count[slots, None]] = self.k
+        return ages
+
+    def recent_partner(self, agent_ids) -> np.ndarray:
+        """Most recently remembered partner of each agent (NO_ID if none)."""
+        slots = self._slots(agent_ids)
+        ages = self._ages(slots)
+        ages[~np.isin(self.code[slots], PARTNER_CODES)] = self.k
+        newest = ages.argmin(axis=1)
+        found = ages[np.arange(len(slots)), newest] < self.k
+        return np.where(found, self.other[slots, newest], NO_ID)
+
+    def recent_births(self, agent_ids, since_gen: int = 0) -> np.ndarray:
+        """Number of remembered births at generation >= `since_gen`, per agent."""
+        slots = self._slots(agent_ids)
+        hit = (self._ages(slots) < self.k) & (self.code[slots] == BIRTH_CODE) & (self.gen[slots] >= since_gen)
+        return hit.sum(axis=1)
+
+    def recall(self, agent_id: int) -> List[Dict[str, Any]]:
+        """One agent's memory as RingMemory-style dicts, oldest first."""
+        slot = self.slot_of[agent_id]
+        out = []
+        for age in range(int(self.count[slot]) - 1, -1, -1):
+            pos = (self.head[slot] - 1 - age) % self.k
+            name, key = _MEMORY_NAMES[int(self.code[slot, pos])]
+            out.append({"gen": int(self.gen[slot, pos]), "event": name, key: int(self.other[slot, pos])})
+        return out
+
+    def __contains__(self, agent_id: int) -> bool:
+        return agent_id in self.slot_of
+
+    def __len__(self) -> int:
+        return self.size
+
+
+# -------------------------
+# Shared ledger
+# -------------------------
+# One packed record per event: code, gen, three integer slots, two float slots.
+_RECORD = struct.Struct("<Hxxiqqqdd")
+RECORD_SIZE = _RECORD.size  # 48 bytes
+
+# event name -> (code, layout). Layouts map the event dict onto the record slots:
+#   "pair":  ids=[a, b]                        -> i0, i1
+#   "farm":  id, effort, yield                 -> i0, f0, i1
+#   "birth": parents=[a, b], child             -> i0, i1, i2
+# Any other event is a GENERIC_CODE record: i0 holds the length of its JSON
+# payload, which fills the following ceil(length / RECORD_SIZE) ring slots.
+GENERIC_CODE = 0
+LEDGER_EVENTS = {
+    "founder_pair": (1, "pair"),
+    "pair": (2, "pair"),
+    "farm": (3, "farm"),
+    "birth": (4, "birth"),
+}
+_EVENT_NAMES = {code: (name, layout) for name, (code, layout) in LEDGER_EVENTS.items()}
+_LAYOUT_FIELDS = {
+    "pair": "gen and ids=[a, b]",
+    "farm": "gen, id, effort and yield",
+    "birth": "gen, parents=[a, b] and child",
+}
+
+
 class SharedLedger:
-    def __init__(self, cap_bytes: int = 16 * 1024):
+    """
+    Fixed-size ring of packed binary event records in an mmap (anonymous, or
+    file-backed when `path` is given). When full, the oldest records are
+    overwritten, so the ledger always holds the most recent events;
+    `used_bytes` is exact (ring slots held x RECORD_SIZE). Events are decoded
+    back to dicts only on export (`events`) or query (`recent`).
+
+    The engine's events (LEDGER_EVENTS) take one slot each. Any other event is
+    stored as its JSON encoding in consecutive slots, so it round-trips as JSON
+    does (tuples come back as lists) and counts against the same capacity.
+    """
+
+    def __init__(self, cap_bytes: int = 16 * 1024, path: Optional[Path] = None):
         self.capacity_bytes = cap_bytes   # <-- rename to capacity_bytes
-        self.used_bytes = 0
-        self.events: List[dict] = []
+        self.slots = max(1, cap_bytes // RECORD_SIZE)
+        size = self.slots * RECORD_SIZE
+        self.path = Path(path) if path is not None else None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("wb") as f:
+                f.truncate(size)
+            self._file = self.path.open("r+b")
+            self._buf = mmap.mmap(self._file.fileno(), size)
+        else:
+            self._file = None
+            self._buf = mmap.mmap(-1, size)
+        self._head = 0      # next slot to write
+        self._used = 0      # slots held
+        self._starts: deque = deque()  # first slot of each held record, oldest first
+        self.count = 0      # records currently held
+        self.evicted = 0    # records overwritten since creation
+
+    @property
+    def used_bytes(self) -> int:
+        return self._used * RECORD_SIZE
 
     def add(self, event: dict):
-        event_size = len(str(event).encode("utf-8"))
-        if self.used_bytes + event_size <= self.capacity_bytes:
-            self.events.append(event)
-            self.used_bytes += event_size
+        name = event.get("event")
+        spec = LEDGER_EVENTS.get(name)
+        payload = b""
+        try:
+            if spec is None:
+                gen = event.get("gen", 0)
+                payload = json.dumps(event, separators=(",", ":")).encode("utf-8")
+                header = _RECORD.pack(GENERIC_CODE, gen if type(gen) is int else 0, len(payload), 0, 0, 0.0, 0.0)
+            else:
+                code, layout = spec
+                i0 = i1 = i2 = 0
+                f0 = 0.0
+                if layout == "pair":
+                    i0, i1 = event["ids"]
+                elif layout == "farm":
+                    i0, f0, i1 = event["id"], event["effort"], event["yield"]
+                else:
+                    (i0, i1), i2 = event["parents"], event["child"]
+                header = _RECORD.pack(code, event["gen"], i0, i1, i2, f0, 0.0)
+        except (KeyError, TypeError, ValueError, struct.error) as exc:
+            need = _LAYOUT_FIELDS[spec[1]] if spec is not None else "JSON-serializable values"
+            raise ValueError(f"Bad ledger event {name!r} (needs {need}): {exc!r}") from None
+
+        span = 1 + -(-len(payload) // RECORD_SIZE)
+        if span > self.slots:
+            raise ValueError(f"Ledger event {name!r} needs {span * RECORD_SIZE} bytes, "
+                             f"more than the ledger's {self.slots * RECORD_SIZE}")
+        while self.slots - self._used < span:
+            self._evict_oldest()
+        start = self._head
+        self._write_slot(start, header)
+        for j in range(1, span):
+            chunk = payload[(j - 1) * RECORD_SIZE:j * RECORD_SIZE]
+            self._write_slot((start + j) % self.slots, chunk.ljust(RECORD_SIZE, b"\0"))
+        self._head = (start + span) % self.slots
+        self._used += span
+        self._starts.append(start)
+        self.count += 1
+
+    def _write_slot(self, slot: int, data: bytes) -> None:
+        self._buf[slot * RECORD_SIZE:(slot + 1) * RECORD_SIZE] = data
+
+    def _span(self, start: int) -> int:
+        code, _, length = struct.unpack_from("<Hxxiq", self._buf, start * RECORD_SIZE)
+        return 1 + -(-length // RECORD_SIZE) if code == GENERIC_CODE else 1
+
+    def _evict_oldest(self) -> None:
+        self._used -= self._span(self._starts.popleft())
+        self.count -= 1
+        self.evicted += 1
+
+    def _decode(self, start: int) -> dict:
+        code, gen, i0, i1, i2, f0, _ = _RECORD.unpack_from(self._buf, start * RECORD_SIZE)
+        if code == GENERIC_CODE:
+            slots = [(start + j) % self.slots for j in range(1, self._span(start))]
+            payload = b"".join(self._buf[s * RECORD_SIZE:(s + 1) * RECORD_SIZE] for s in slots)
+            return json.loads(payload[:i0].decode("utf-8"))
+        name, layout = _EVENT_NAMES[code]
+        if layout == "pair":
+            return {"gen": gen, "event": name, "ids": [i0, i1]}
+        if layout == "farm":
+            return {"gen": gen, "event": name, "id": i0, "effort": f0, "yield": i1}
+        return {"gen": gen, "event": name, "parents": [i0, i1], "child": i2}
+
+    def recent(self, n: int) -> List[dict]:
+        """The last `n` events, oldest first."""
+        n = max(0, min(int(n), self.count))
+        return [self._decode(start) for start in islice(self._starts, self.count - n, None)]
+
+    @property
+    def events(self) -> List[dict]:
+        """Every held event as a dict, oldest first (the shared_memory.json export)."""
+        return self.recent(self.count)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def closed(self) -> bool:
+        return self._buf.closed
+
+    def close(self):
+        """Release the mmap (and its file); safe to call more than once."""
+        if not self._buf.closed:
+            self._buf.close()
+        if self._file is not None and not self._file.closed:
+            self._file.close()
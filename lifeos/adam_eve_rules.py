@@ -3,6 +3,8 @@ from __future__ import annotations
 import math
 from typing import Dict, List, Tuple, Any
 
+import numpy as np
+
 PHI = (1.0 + 5 ** 0.5) / 2.0  # golden ratio
 
 
@@ -91,12 +93,19 @@ def golden_sleep(base_ms: int, generation: int) -> int:
 # -------------------------
 # Memory-Driven Extensions
 # -------------------------
-def memory_recent_partner(indiv_state: Any) -> int | None:
+def memory_recent_partner(indiv_state: Any, store: Any = None, agent_id: int | None = None) -> int | None:
     """
     Look into an individual's RingMemory to recall their most recent partner.
+    With a MemoryStore (`store` + `agent_id`) the lookup reads its arrays instead.
     Returns partner_id or None if no record.
     """
-    return indiv_state.memory.recall("partner", None)
+    if store is not None:
+        pid = int(store.recent_partner([agent_id])[0])
+        return None if pid < 0 else pid
+    for event in reversed(indiv_state.memory.recall()):
+        if "partner" in event:
+            return event["partner"]
+    return None
 
 
 def ledger_recent_events(shared_ledger: Any, n: int = 5) -> List[Dict[str, Any]]:
@@ -106,10 +115,19 @@ def ledger_recent_events(shared_ledger: Any, n: int = 5) -> List[Dict[str, Any]]
     return shared_ledger.recent(n)
 
 
-def avoid_repeat_pairing(indiv_state: Any, candidate_id: int) -> bool:
+def avoid_repeat_pairing(indiv_state: Any, candidate_id: int,
+                         store: Any = None, agent_id: int | None = None) -> bool:
     """
     Example rule: check memory to avoid re-pairing with the same candidate
     multiple times in quick succession.
     """
-    last_partner = memory_recent_partner(indiv_state)
+    last_partner = memory_recent_partner(indiv_state, store=store, agent_id=agent_id)
     return last_partner != candidate_id
+
+
+def avoid_repeat_pairing_batch(store: Any, agent_ids: List[int], candidate_ids: List[int]):
+    """
+    avoid_repeat_pairing for many (agent, candidate) pairs at once over a
+    MemoryStore. Returns a boolean array.
+    """
+    return store.recent_partner(agent_ids) != np.asarray(candidate_ids)
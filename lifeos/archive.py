@@ -0,0 +1,147 @@
+"""
+Append-only archive of dead individuals.
+
+Each archived agent is one fixed-width little-endian record:
+
+    id (q) | parent_a (q) | parent_b (q) | birth_gen (i) | death_gen (i) | genome (L x d)
+
+Missing parents are stored as -1. Genome values are packed as float64 codes:
+floats as-is, ints as exact integers, enums as the index into `Locus.enum`.
+Records go to an on-disk segment when a path is given (kept in memory
+otherwise), and the per-agent memory left behind is an 8-byte slot in an
+id -> record position table plus the agent's id in its parents' children index.
+"""
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+import struct
+
+import numpy as np
+
+from .genome import Genome, Locus
+
+MAGIC = b"LOSA"
+VERSION = 1
+_HEADER = struct.Struct("<4sHH")  # magic, version, number of loci
+_META = struct.Struct("<qqqii")
+_NO_PARENT = -1
+
+
+@dataclass
+class ArchiveRecord:
+    id: int
+    parents: Optional[List[int]]
+    birth_gen: int
+    death_gen: int
+    genome: Genome
+
+
+class LineageArchive:
+    """Fixed-width, append-only store of dead agents, queryable by id."""
+
+    def __init__(self, loci: Sequence[Locus], path: Optional[Path] = None, flush_bytes: int = 1 << 16):
+        self.loci = list(loci)
+        self._genome = struct.Struct(f"<{len(self.loci)}d")
+        self.record_size = _META.size + self._genome.size
+        self.path = Path(path) if path is not None else None
+        self.flush_bytes = int(flush_bytes)
+
+        self._pos = array("q")        # agent id -> record index (-1 = not archived)
+        self._children: Dict[int, array] = {}  # parent id -> archived child ids, archive order
+        self._count = 0
+        self._pending = bytearray()   # records not yet written to disk (all of them without a path)
+        self._flushed = 0             # records already on disk
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("wb") as f:
+                f.write(_HEADER.pack(MAGIC, VERSION, len(self.loci)))
+
+    # ---------- genome packing ----------
+    def _pack_genome(self, genome: Genome) -> bytes:
+        return self._genome.pack(*genome.codes())
+
+    def _unpack_genome(self, raw: bytes) -> Genome:
+        return Genome.from_codes(self.loci, self._genome.unpack(raw))
+
+    # ---------- writing ----------
+    def append(self, ind, birth_gen: int, death_gen: int) -> None:
+        """Archive a dead individual (`ind` is a lineage Individual with a Genome)."""
+        parents = list(ind.parents or [])
+        pa = parents[0] if len(parents) > 0 else _NO_PARENT
+        pb = parents[1] if len(parents) > 1 else _NO_PARENT
+        self._pending += _META.pack(ind.id, pa, pb, int(birth_gen), int(death_gen))
+        self._pending += self._pack_genome(ind.genome)
+
+        if ind.id >= len(self._pos):
+            self._pos.extend([-1] * (ind.id + 1 - len(self._pos)))
+        self._pos[ind.id] = self._count
+        for p in (pa,) if pb == pa else (pa, pb):
+            if p != _NO_PARENT:
+                self._children.setdefault(p, array("q")).append(ind.id)
+        self._count += 1
+        if self.path is not None and len(self._pending) >= self.flush_bytes:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.path is None or not self._pending:
+            return
+        with self.path.open("ab") as f:
+            f.write(self._pending)
+        self._flushed = self._count
+        self._pending = bytearray()
+
+    # ---------- reading ----------
+    def _raw(self, index: int) -> bytes:
+        size = self.record_size
+        if index >= self._flushed:
+            off = (index - self._flushed) * size
+            return bytes(self._pending[off:off + size])
+        with self.path.open("rb") as f:
+            f.seek(_HEADER.size + index * size)
+            return f.read(size)
+
+    def _decode(self, raw: bytes) -> ArchiveRecord:
+        aid, pa, pb, born, died = _META.unpack_from(raw)
+        parents = [p for p in (pa, pb) if p != _NO_PARENT] or None
+        return ArchiveRecord(aid, parents, born, died, self._unpack_genome(raw[_META.size:]))
+
+    def get(self, agent_id: int) -> Optional[ArchiveRecord]:
+        if not 0 <= agent_id < len(self._pos) or self._pos[agent_id] < 0:
+            return None
+        return self._decode(self._raw(self._pos[agent_id]))
+
+    def children(self, parent_id: int) -> List[int]:
+        """Ids of the archived children of `parent_id`, in archive order."""
+        kids = self._children.get(parent_id)
+        return kids.tolist() if kids is not None else []
+
+    def __contains__(self, agent_id: int) -> bool:
+        return 0 <= agent_id < len(self._pos) and self._pos[agent_id] >= 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def records(self) -> Iterator[ArchiveRecord]:
+        """All records in archive order (streamed from disk, then the pending buffer)."""
+        size = self.record_size
+        if self.path is not None and self._flushed:
+            with self.path.open("rb") as f:
+                f.seek(_HEADER.size)
+                for _ in range(self._flushed):
+                    yield self._decode(f.read(size))
+        for off in range(0, len(self._pending), size):
+            yield self._decode(bytes(self._pending[off:off + size]))
+
+    def to_numpy(self) -> np.ndarray:
+        """Structured array view of every record (memory-mapped when on disk)."""
+        self.flush()
+        dtype = np.dtype([("id", "<i8"), ("parent_a", "<i8"), ("parent_b", "<i8"),
+                          ("birth_gen", "<i4"), ("death_gen", "<i4"),
+                          ("genome", "<f8", (len(self.loci),))])
+        if self.path is None:
+            return np.frombuffer(bytes(self._pending), dtype=dtype)
+        if self._count == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(self.path, dtype=dtype, mode="r", offset=_HEADER.size, shape=(self._count,))
@@ -0,0 +1,247 @@
+"""
+Seed ensembles for the Adam & Eve engine.
+
+`run_ensemble` runs one AdamEveWorld configuration under many seeds, serially
+or in a process pool. Metric rows go into one combined sink with a `seed`
+column, and per-generation mean / standard deviation / confidence bands are
+accumulated online (Welford), so nothing is re-read from per-replicate files
+afterwards. Serial replicates stream each row into the sink as its generation
+finishes. A pooled replicate returns its rows in one list when it is done, so
+the parent holds generations + 1 rows per finished replicate until they are
+written.
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import csv
+import time
+import warnings
+
+from .genome import Locus
+from .metrics import open_sink
+from .stats import RunningStats, Z_95
+
+
+# -------------------------
+# Config parsing
+# -------------------------
+def loci_from_config(cfg: Dict[str, Any]) -> List[Locus]:
+    loci = []
+    for l in (cfg.get("genome") or {}).get("loci", []):
+        loci.append(Locus(name=l["name"], type=l["type"], min=l.get("min", 0.0),
+                          max=l.get("max", 1.0), enum=l.get("enum")))
+    return loci
+
+
+def world_kwargs_from_config(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    AdamEveWorld keyword arguments (everything but the seed) from a
+    configs/adam_eve*.yaml mapping. Understands the flat layout
+    (num_couples, lifespan_phases, children_cap_min/max, ...) and the older
+    nested `population:` layout of configs/adam_eve.yaml. An empty config
+    (None, as yaml.safe_load returns for an empty file) gives the defaults.
+    """
+    cfg = cfg or {}
+    pop = cfg.get("population") or {}
+    mem = cfg.get("memory") or {}
+    kwargs: Dict[str, Any] = {
+        "loci": loci_from_config(cfg),
+        "generations": int(cfg.get("generations", 60)),
+        "num_couples": int(cfg.get("num_couples", pop.get("initial_couples", 12))),
+        "mutation_rate": float((cfg.get("mutation") or {}).get("per_locus_rate", 0.01)),
+        "pair_at_phase": int(cfg.get("pair_at_phase", 1)),
+        "policy": str(cfg.get("policy", "baseline")),
+    }
+    lifespan = cfg.get("lifespan_phases", pop.get("lifespan_generations", 4))
+    kwargs["lifespan_phases"] = None if lifespan is None else int(lifespan)
+
+    if "reproduction_phase" in cfg:
+        repro = cfg["reproduction_phase"]
+    else:
+        repro = (cfg.get("reproduction") or {}).get("allowed_generations", 1)
+    kwargs["reproduction_phase"] = _phase_from_config(repro, kwargs["lifespan_phases"])
+
+    if "children_cap_min" in cfg or "children_cap_max" in cfg:
+        lo = int(cfg.get("children_cap_min", 4))
+        kwargs["children_cap_range"] = (lo, int(cfg.get("children_cap_max", max(lo, 8))))
+    elif "max_children_per_pair" in pop:
+        cap = int(pop["max_children_per_pair"])
+        kwargs["children_cap_range"] = (cap, cap)
+
+    if "per_individual_kb" in mem:
+        kwargs["per_individual_kb"] = int(mem["per_individual_kb"])
+    if "shared_pool_kb" in mem:
+        kwargs["shared_pool_kb"] = int(mem["shared_pool_kb"])
+    elif "shared_bytes" in mem:
+        kwargs["shared_pool_kb"] = max(1, int(mem["shared_bytes"]) // 1024)
+
+    if cfg.get("environment"):
+        kwargs["env_cfg"] = dict(cfg["environment"])
+    if cfg.get("timings"):
+        kwargs["timings"] = True
+    return kwargs
+
+
+def _phase_from_config(value: Any, lifespan: Optional[int]) -> Optional[int]:
+    """
+    The engine's reproduction_phase for a config value: a phase, or a list of
+    phases. The engine allows every phase >= reproduction_phase up to the
+    lifespan cap, so a list maps exactly only when it is that whole range;
+    other lists are widened to "from their first phase on", with a warning.
+    """
+    if not isinstance(value, (list, tuple)):
+        return None if value is None else int(value)
+    phases = sorted({int(p) for p in value})
+    if not phases:
+        return None
+    first = phases[0]
+    if lifespan is None or phases != list(range(first, lifespan)):
+        warnings.warn(f"reproduction phases {phases} cannot be expressed by the engine; "
+                      f"reproduction is allowed at every phase >= {first}", stacklevel=3)
+    return first
+
+
+def replicate_seeds(base_seed: int, replicates: int) -> List[int]:
+    """`replicates` seeds derived from the config seed (the first one is the config seed itself)."""
+    return [(int(base_seed) + i * 1009) & 0x7FFFFFFF for i in range(int(replicates))]
+
+
+# -------------------------
+# Online summary
+# -------------------------
+class EnsembleSummary:
+    """RunningStats per (generation, metric), fed one metrics row at a time."""
+
+    def __init__(self, z: float = Z_95):
+        self.z = z
+        self.stats: Dict[int, Dict[str, RunningStats]] = {}
+        self.metrics: List[str] = []
+
+    def add_row(self, row: Dict[str, Any]) -> None:
+        per_gen = self.stats.setdefault(int(row["generation"]), {})
+        for key, value in row.items():
+            if key in ("generation", "seed") or not isinstance(value, (int, float)) or isinstance(value, bool):
+                continue
+            if key not in self.metrics:
+                self.metrics.append(key)
+            per_gen.setdefault(key, RunningStats()).add(float(value))
+
+    def rows(self) -> Iterable[Dict[str, Any]]:
+        for gen in sorted(self.stats):
+            out: Dict[str, Any] = {"generation": gen}
+            for key in self.metrics:
+                st = self.stats[gen].get(key)
+                if st is None:
+                    continue
+                lo, hi = st.band(self.z)
+                out.update({f"{key}_mean": round(st.mean, 6), f"{key}_std": round(st.std, 6),
+                            f"{key}_lo": round(lo, 6), f"{key}_hi": round(hi, 6)})
+            out["replicates"] = max(st.n for st in self.stats[gen].values()) if self.stats[gen] else 0
+            yield out
+
+    def write_csv(self, path: Path) -> None:
+        rows = list(self.rows())
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fieldnames: List[str] = []
+        for row in rows:
+            fieldnames.extend(k for k in row if k not in fieldnames)
+        with path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+# -------------------------
+# Runner
+# -------------------------
+class EnsembleError(RuntimeError):
+    """Some replicates failed; the others were written and summarised."""
+
+    def __init__(self, failures: Dict[int, BaseException]):
+        self.failures = failures
+        detail = "; ".join(f"seed {seed}: {exc!r}" for seed, exc in failures.items())
+        super().__init__(f"{len(failures)} replicate(s) failed: {detail}")
+
+
+def replicate_kwargs(world_kwargs: Dict[str, Any], seed: int) -> Dict[str, Any]:
+    """
+    AdamEveWorld keyword arguments of replicate `seed`. A fixed environment
+    `rng_seed` from the config is combined with the replicate seed, so each
+    replicate gets its own food/oxygen noise and allocation stream (without
+    one, the environment is seeded from the world seed anyway).
+    """
+    # the ensemble only reads metric rows: don't keep every birth/death event in memory
+    kwargs = {"event_log": "off", **world_kwargs}
+    env = kwargs.get("env_cfg")
+    if env and env.get("rng_seed") is not None:
+        kwargs["env_cfg"] = {**env, "rng_seed": (int(env["rng_seed"]) * 1_000_003 + int(seed)) & 0x7FFFFFFF}
+    return kwargs
+
+
+def _replicate_rows(world_kwargs: Dict[str, Any], seed: int) -> Iterator[Dict[str, Any]]:
+    """Metric rows of one seed, yielded as each generation is simulated."""
+    from .adam_eve_engine import AdamEveWorld
+
+    world = AdamEveWorld(seed=seed, **replicate_kwargs(world_kwargs, seed))
+    yield from world.iter_generations()
+
+
+def _run_replicate(world_kwargs: Dict[str, Any], seed: int) -> Tuple[List[Dict[str, Any]], float]:
+    """Run one seed and return its metric rows and wall time (process-pool entry point)."""
+    t0 = time.perf_counter()
+    rows = list(_replicate_rows(world_kwargs, seed))
+    return rows, time.perf_counter() - t0
+
+
+def run_ensemble(
+    world_kwargs: Dict[str, Any],
+    seeds: Sequence[int],
+    out_dir: Path,
+    workers: int = 1,
+    metrics_sink: str = "columnar",
+    z: float = Z_95,
+) -> Dict[str, Any]:
+    """
+    Run `seeds` replicates of one configuration and write, under `out_dir`:
+      - ensemble_metrics.<ext>: every replicate's rows with a `seed` column,
+      - ensemble_summary.csv: per-generation mean/std/lo/hi of each metric.
+    Replicates are consumed in seed order as they finish, so results do not
+    depend on scheduling. With workers=1 rows are written as they are
+    generated, so a replicate that fails keeps the rows it produced before
+    failing. Returns {"summary": EnsembleSummary, "wall_times": {seed: s}}.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    summary = EnsembleSummary(z=z)
+    wall_times: Dict[int, float] = {}
+    failures: Dict[int, BaseException] = {}
+
+    with open_sink(metrics_sink, out_dir, name="ensemble_metrics") as sink:
+        def consume(seed: int, rows: Iterable[Dict[str, Any]]) -> None:
+            for row in rows:
+                sink.write({"seed": seed, **row})
+                summary.add_row(row)
+
+        if workers > 1 and len(seeds) > 1:
+            with ProcessPoolExecutor(max_workers=min(int(workers), len(seeds))) as pool:
+                futures = [(seed, pool.submit(_run_replicate, world_kwargs, seed)) for seed in seeds]
+                for seed, fut in futures:
+                    try:
+                        rows, wall_times[seed] = fut.result()
+                        consume(seed, rows)
+                    except Exception as exc:
+                        failures[seed] = exc
+        else:
+            for seed in seeds:
+                t0 = time.perf_counter()
+                try:
+                    consume(seed, _replicate_rows(world_kwargs, seed))
+                    wall_times[seed] = time.perf_counter() - t0
+                except Exception as exc:
+                    failures[seed] = exc
+
+    summary.write_csv(out_dir / "ensemble_summary.csv")
+    if failures:
+        raise EnsembleError(failures) from next(iter(failures.values()))
+    return {"summary": summary, "wall_times": wall_times}
@@ -1,9 +1,17 @@
 # lifeos/environment.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence
 import random
 
+import numpy as np
+
+from .rng import CounterRNG, ENVIRONMENT
+
+ALLOCATION_MODES = ("loop", "multinomial")
+RNG_MODES = ("mt", "counter")
+
 
 @dataclass
 class EnvironmentConfig:
@@ -16,16 +24,48 @@ class EnvironmentConfig:
     birth_cost: float = 2.0
     rng_seed: Optional[int] = None
     farming_bonus: int = 20  # NEW farming yield
+    allocation_mode: str = "loop"  # "loop" (per-unit draws) | "multinomial" (one batched draw)
+    rng_mode: str = "mt"  # "mt" (one seeded stream per run) | "counter" (one stream per generation)
 
 
 class Environment:
+    """
+    Global food/oxygen environment.
+
+    Food allocation modes (``cfg.allocation_mode``):
+    - "loop": one weighted draw per food unit from ``self.rng``. Reproduces the
+      historical allocation stream exactly for a given ``rng_seed``.
+    - "multinomial": the whole pile is split with a single multinomial draw over
+      the same per-agent weights, taken from a dedicated NumPy generator seeded
+      with ``rng_seed``. Same distribution as "loop", but not the same draws.
+
+    In both modes ``self.rng`` is only consumed by replenishment noise and the
+    "loop" draws, so a fixed ``rng_seed`` yields identical food/oxygen levels and
+    identical allocations for identical inputs within a mode.
+
+    With ``cfg.rng_mode == "counter"`` both generators are replaced every
+    generation by counter-based streams keyed by (rng_seed, generation), so a
+    generation's draws do not depend on what earlier generations consumed.
+    """
+
     def __init__(self, cfg: EnvironmentConfig):
+        if cfg.allocation_mode not in ALLOCATION_MODES:
+            raise ValueError(f"Unknown allocation_mode: {cfg.allocation_mode!r}")
+        if cfg.rng_mode not in RNG_MODES:
+            raise ValueError(f"Unknown rng_mode: {cfg.rng_mode!r}")
         self.cfg = cfg
         self.rng = random.Random(cfg.rng_seed)
+        self.np_rng = np.random.default_rng(cfg.rng_seed)
+        self.streams: Optional[CounterRNG] = None
+        if cfg.rng_mode == "counter":
+            self.streams = CounterRNG(cfg.rng_seed if cfg.rng_seed is not None else random.getrandbits(64))
         self.food = cfg.base_food_per_gen
         self.oxygen = cfg.base_oxygen_per_gen
 
     def replenish(self, generation: int):
+        if self.streams is not None:
+            self.rng = self.streams.stream(ENVIRONMENT, generation=generation)
+            self.np_rng = self.streams.numpy_generator(ENVIRONMENT, generation=generation)
         noise = 1.0 + self.rng.uniform(-self.cfg.food_replenish_noise, self.cfg.food_replenish_noise)
         self.food = max(0, int(round(self.cfg.base_food_per_gen * noise)))
         self.oxygen = max(0, self.cfg.base_oxygen_per_gen - self.cfg.oxygen_decay_per_gen * generation)
@@ -56,12 +96,29 @@ class Environment:
         if total_score > 0:
             ids = list(scores.keys())
             weights = [scores[i] for i in ids]
-            for _ in range(self.food):
-                pick = self.rng.choices(ids, weights=weights, k=1)[0]
-                alloc[pick] += 1
+            for pick, got in zip(ids, self.draw_allocation(weights, self.food)):
+                alloc[pick] += got
         self.food = 0
         return alloc
 
+    def draw_allocation(self, weights: Sequence[float], units: int) -> List[int]:
+        """Split `units` food units over agents proportionally to `weights`; returns per-agent counts."""
+        n = len(weights)
+        if n == 0 or units <= 0:
+            return [0] * n
+        if self.cfg.allocation_mode == "multinomial":
+            w = np.asarray(weights, dtype=np.float64)
+            return self.np_rng.multinomial(int(units), w / w.sum()).tolist()
+
+        # "loop": one uniform per unit, bisected into the cumulative weights.
+        # Same draws as calling choices(..., k=1) once per unit, without
+        # re-accumulating the weights every time.
+        counts = [0] * n
+        cum_weights = list(accumulate(weights))
+        for pick in self.rng.choices(range(n), cum_weights=cum_weights, k=int(units)):
+            counts[pick] += 1
+        return counts
+
     def tick(self, generation: int, population: List, state_map: Dict[int, object], policy_adapter=None) -> Dict[str, object]:
         self.replenish(generation)
         allocations = self.allocate_food(population, state_map, policy_adapter)
@@ -92,3 +149,46 @@ class Environment:
             "food_left": self.food,
             "oxygen_left": self.oxygen,
         }
+
+    def tick_columnar(self, generation: int, population: List, columns, state_map: Dict[int, object],
+                      policy_adapter=None) -> Dict[str, object]:
+        """
+        `tick` for a ColumnarPopulation whose live slots line up with `population`.
+        Scoring (without a policy adapter), metabolic cost and death detection run
+        as array operations; draws and results match `tick` exactly.
+        """
+        self.replenish(generation)
+        slots = columns.live_slots()
+        energy = columns.energy
+
+        got = np.zeros(len(slots), dtype=np.int64)
+        if len(slots) and self.food > 0:
+            if policy_adapter:
+                alloc = self.allocate_food(population, state_map, policy_adapter)
+                got = np.fromiter((alloc.get(ind.id, 0) for ind in population), dtype=np.int64, count=len(slots))
+            else:
+                scores = 1.0 + np.maximum(0.0, 50.0 - energy[slots]) / 50.0
+                got = np.asarray(self.draw_allocation(scores.tolist(), self.food), dtype=np.int64)
+                self.food = 0
+
+        energy[slots] += got * self.cfg.energy_per_food_unit
+        energy[slots] -= self.cfg.base_metabolic_cost
+        current = energy[slots]
+        ids = columns.ids[slots]
+        deaths: List[int] = ids[current <= 0].tolist()
+
+        n = len(slots)
+        if self.oxygen < n:
+            shortage = 1.0 - (self.oxygen / max(1, float(n)))
+            to_kill = min(n, int(round(shortage * n)))
+            order = np.argsort(current, kind="stable")
+            deaths.extend(ids[order[:to_kill]].tolist())
+
+        return {
+            "generation": generation,
+            "allocated_food_total": int(got.sum()),
+            "allocations": dict(zip(ids.tolist(), got.tolist())),
+            "deaths": deaths,
+            "food_left": self.food,
+            "oxygen_left": self.oxygen,
+        }
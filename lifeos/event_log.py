@@ -0,0 +1,152 @@
+"""
+Streaming event log: compact JSON Lines written as events happen.
+
+`EventLogWriter` keeps at most `buffer_events` encoded events in memory and
+appends them to the log when the buffer fills (or on `flush()` / `close()`).
+With `background=True` the file writes happen on a worker thread behind a
+bounded queue, so the simulation only pays for encoding.
+
+Alongside `<name>.jsonl` the writer keeps a small offset index
+(`<name>.jsonl.idx`, JSON `{generation: byte offset}`) recording where each
+generation's events start, which lets `iter_events` jump straight to one
+generation instead of reading the whole log.
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+import json
+import queue
+import threading
+
+INDEX_SUFFIX = ".idx"
+_STOP = object()
+
+
+def index_path(path: Path) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+class EventLogWriter:
+    """
+    Append-only JSONL event log with bounded buffering.
+
+    Events must carry a "generation" key and arrive in non-decreasing
+    generation order (as the engines produce them) for the offset index.
+    """
+
+    def __init__(self, path: Path, buffer_events: int = 1024, background: bool = False, max_pending: int = 8):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.buffer_events = max(1, int(buffer_events))
+        self._fh = self.path.open("wb")
+        self._buffer: List[bytes] = []
+        self._offset = 0                       # bytes written, queued or buffered so far
+        self._index: Dict[int, int] = {}       # generation -> offset of its first event
+        self._last_gen: Optional[int] = None
+        self.count = 0
+        self.closed = False
+
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        if background:
+            # bounded: a slow disk blocks the producer instead of growing memory
+            self._queue = queue.Queue(maxsize=max(1, int(max_pending)))
+            self._thread = threading.Thread(target=self._drain, name="event-log-writer", daemon=True)
+            self._thread.start()
+
+    # ---------- writing ----------
+    def write(self, event: Dict[str, Any]) -> None:
+        line = json.dumps(event, separators=(",", ":")).encode("utf-8") + b"\n"
+        gen = event.get("generation")
+        if gen is not None and gen != self._last_gen:
+            self._index.setdefault(int(gen), self._offset)
+            self._last_gen = gen
+        self._buffer.append(line)
+        self._offset += len(line)
+        self.count += 1
+        if len(self._buffer) >= self.buffer_events:
+            self.flush()
+
+    def flush(self) -> None:
+        """Hand buffered events to the file (or the background writer)."""
+        if not self._buffer:
+            return
+        chunk = b"".join(self._buffer)
+        self._buffer = []
+        if self._queue is not None:
+            self._raise_worker_error()
+            self._queue.put(chunk)
+        else:
+            self._fh.write(chunk)
+
+    def _drain(self) -> None:
+        while True:
+            chunk = self._queue.get()
+            if chunk is _STOP:
+                return
+            try:
+                self._fh.write(chunk)
+            except BaseException as exc:  # surfaced on the producer side
+                self._error = exc
+
+    def _raise_worker_error(self) -> None:
+        if self._error is not None:
+            raise RuntimeError(f"event log writer failed: {self._error}") from self._error
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.flush()
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._fh.close()
+        self.closed = True
+        self._raise_worker_error()
+        index_path(self.path).write_text(json.dumps(self._index), encoding="utf-8")
+
+    def __enter__(self) -> "EventLogWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+# ---------- reading ----------
+def load_index(path: Path) -> Dict[int, int]:
+    idx = index_path(path)
+    if not idx.exists():
+        return {}
+    return {int(k): int(v) for k, v in json.loads(idx.read_text(encoding="utf-8")).items()}
+
+
+def iter_events(path: Path, generation: Optional[int] = None, event: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream events from a JSONL log, optionally only one generation and/or one
+    event type. With an index, a generation filter seeks to that generation and
+    stops at the next one; memory use is one line at a time either way.
+    """
+    offset = 0
+    indexed = False
+    if generation is not None:
+        index = load_index(path)
+        if index:
+            if generation not in index:
+                return
+            offset, indexed = index[generation], True
+
+    with Path(path).open("rb") as f:
+        f.seek(offset)
+        for line in f:
+            if not line.strip():
+                continue
+            ev = json.loads(line)
+            if generation is not None and ev.get("generation") != generation:
+                if indexed:
+                    return
+                continue
+            if event is not None and ev.get("event") != event:
+                continue
+            yield ev
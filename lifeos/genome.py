@@ -1,11 +1,31 @@
 """
 Genome engine: typed loci, bounded values, and mutation model.
+
+A `GenomeSchema` is compiled once per loci list: per-locus kind, bounds, enum
+code tables, samplers and value <-> code converters. Genomes created by the
+engine (`random_init`, crossover, mutation) store their values packed as one
+float64 code per locus in an `array('d')` (floats as-is, ints exactly, enums as
+the index into `Locus.enum`); `Genome.values` is then a list-like view that
+decodes on read and encodes on write. Genomes built from an explicit values
+list keep that list as their storage.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Any, Optional
+from array import array
+from collections.abc import Sequence as _SequenceABC
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 import random
 
+import numpy as np
+
+# Shared unseeded generator for calls made without an explicit rng. Creating a
+# fresh random.Random() per call would read OS entropy every time.
+_fallback_rng = random.Random()
+
+FLOAT, INT, ENUM = 0, 1, 2
+_KINDS = {"float": FLOAT, "int": INT, "enum": ENUM}
+_EXACT_INT = 1 << 53  # ints beyond this do not survive a float64 code
+
 
 @dataclass
 class Locus:
@@ -16,88 +36,514 @@ class Locus:
     enum: Optional[List[str]] = None
 
 
-@dataclass
+class GenomeSchema:
+    """
+    A loci list compiled for fast per-locus work: no `loc.type` string
+    comparisons on the hot paths. Use `GenomeSchema.of(loci)` to share one
+    schema per loci list.
+    """
+
+    # compiled schemas by loci content (least recently used dropped first), and
+    # a memo of recently seen loci lists: id -> (list, its Locus objects at
+    # lookup time, schema); both hold at most _RECENT_MAX entries
+    _compiled: Dict[Tuple[Any, ...], "GenomeSchema"] = {}
+    _recent: Dict[int, Tuple[Sequence[Locus], Tuple[Locus, ...], "GenomeSchema"]] = {}
+    _RECENT_MAX = 256
+
+    def __init__(self, loci: Sequence[Locus]):
+        self.loci = loci
+        self.names: Tuple[str, ...] = tuple(loc.name for loc in loci)
+        self.kinds: Tuple[int, ...] = tuple(_KINDS.get(loc.type, -1) for loc in loci)
+        self.lo: Tuple[float, ...] = tuple(float(loc.min) for loc in loci)
+        self.hi: Tuple[float, ...] = tuple(float(loc.max) for loc in loci)
+        self.enums: Tuple[Optional[Tuple[Any, ...]], ...] = tuple(
+            tuple(loc.enum) if k == ENUM and loc.enum else None for loc, k in zip(loci, self.kinds))
+        # first index of each enum value (what list.index would return)
+        self.enum_codes: Tuple[Optional[Dict[Any, int]], ...] = tuple(
+            {v: c for c, v in reversed(list(enumerate(t)))} if t else None for t in self.enums)
+        # a locus is usable if it can be sampled: enums need values, unknown types are not
+        self.sampleable: Tuple[bool, ...] = tuple(
+            k in (FLOAT, INT) or (k == ENUM and t is not None) for k, t in zip(self.kinds, self.enums))
+        self.packable = all(self.sampleable)
+
+        # samplers draw exactly what the per-type branches always drew, so seeded runs are unchanged
+        self.samplers: Tuple[Optional[Callable[[random.Random], Any]], ...] = tuple(
+            self._value_sampler(i) for i in range(len(loci)))
+        self.code_samplers: Tuple[Optional[Callable[[random.Random], float]], ...] = tuple(
+            self._code_sampler(i) for i in range(len(loci)))
+        self.decoders: Tuple[Callable[[float], Any], ...] = tuple(
+            self._decoder(i) for i in range(len(loci)))
+
+    @classmethod
+    def of(cls, loci: Sequence[Locus]) -> "GenomeSchema":
+        """
+        The compiled schema of `loci`. Lists with equal loci share one
+        compilation; a list changed in place (loci added, removed or replaced)
+        is recompiled on its next lookup. Locus objects themselves are taken
+        as immutable once compiled.
+        """
+        entry = cls._recent.get(id(loci))
+        if entry is not None and entry[0] is loci:
+            members = tuple(loci)
+            if entry[1] == members:
+                return entry[2]
+        else:
+            members = tuple(loci)
+        key = tuple((loc.name, loc.type, loc.min, loc.max, tuple(loc.enum) if loc.enum is not None else None)
+                    for loc in members)
+        cache = cls._compiled
+        compiled = cache.pop(key, None)
+        if compiled is None:
+            compiled = cls(list(members))
+            if len(cache) >= cls._RECENT_MAX:
+                del cache[next(iter(cache))]  # drop the least recently used compilation
+        cache[key] = compiled
+        schema = compiled._bind(loci)
+        recent = cls._recent
+        if len(recent) >= cls._RECENT_MAX and id(loci) not in recent:
+            del recent[next(iter(recent))]  # drop the oldest entry
+        recent[id(loci)] = (loci, members, schema)
+        return schema
+
+    def _bind(self, loci: Sequence[Locus]) -> "GenomeSchema":
+        """This compilation with `loci` as its loci list (compiled tables are shared)."""
+        if loci is self.loci:
+            return self
+        bound = object.__new__(GenomeSchema)
+        bound.__dict__.update(self.__dict__)
+        bound.loci = loci
+        return bound
+
+    def __reduce__(self):
+        return (GenomeSchema.of, (self.loci,))
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    # ---------- compiled per-locus functions ----------
+    def _value_sampler(self, i: int):
+        kind, table = self.kinds[i], self.enums[i]
+        loc = self.loci[i]
+        if kind == FLOAT:
+            lo, hi = loc.min, loc.max
+            return lambda rng: rng.uniform(lo, hi)
+        if kind == INT:
+            a, b = int(loc.min), int(loc.max)
+            return lambda rng: rng.randint(a, b)
+        if table is not None:
+            return lambda rng: rng.choice(table)
+        return None
+
+    def _code_sampler(self, i: int):
+        kind, table = self.kinds[i], self.enums[i]
+        loc = self.loci[i]
+        if kind == FLOAT:
+            lo, hi = loc.min, loc.max
+            return lambda rng: rng.uniform(lo, hi)
+        if kind == INT:
+            a, b = int(loc.min), int(loc.max)
+            return lambda rng: float(rng.randint(a, b))
+        if table is not None:
+            codes = tuple(float(c) for c in range(len(table)))  # rng.choice over codes draws like over values
+            return lambda rng: rng.choice(codes)
+        return None
+
+    def _decoder(self, i: int):
+        kind, table = self.kinds[i], self.enums[i]
+        if kind == INT:
+            return int
+        if kind == ENUM and table is not None:
+            return lambda code: table[int(code)]
+        return float
+
+    # ---------- value <-> code ----------
+    def encode_value(self, i: int, value: Any) -> Optional[float]:
+        """The code of `value` at locus `i`, or None if the code would not decode back to it."""
+        kind = self.kinds[i]
+        if kind == FLOAT:
+            return value if type(value) is float else None
+        if kind == INT:
+            return float(value) if type(value) is int and -_EXACT_INT <= value <= _EXACT_INT else None
+        codes = self.enum_codes[i]
+        if codes is None:
+            return None
+        try:
+            code = codes.get(value)
+        except TypeError:  # unhashable
+            return None
+        return None if code is None else float(code)
+
+    def encode(self, values: Sequence[Any]) -> Optional[array]:
+        """Packed codes of `values`, or None if any value does not round-trip."""
+        if not self.packable or len(values) != len(self.kinds):
+            return None
+        out = array("d")
+        for i, v in enumerate(values):
+            code = self.encode_value(i, v)
+            if code is None:
+                return None
+            out.append(code)
+        return out
+
+    def loose_codes(self, values: Sequence[Any]) -> List[float]:
+        """float64 codes for storage: enums by index, anything else as float(value)."""
+        return [float(self.enum_codes[i][v]) if self.enum_codes[i] is not None else float(v)
+                for i, v in enumerate(values)]
+
+    def decode(self, codes: Sequence[float]) -> List[Any]:
+        return [dec(c) for dec, c in zip(self.decoders, codes)]
+
+    def random_codes(self, rng: random.Random) -> array:
+        return array("d", [sample(rng) for sample in self.code_samplers])
+
+    def sample_codes(self, i: int, k: int, rng: np.random.Generator) -> Optional[np.ndarray]:
+        """`k` fresh float64 codes for locus `i` from a NumPy generator (None if it cannot be sampled)."""
+        kind, loc = self.kinds[i], self.loci[i]
+        if kind == FLOAT:
+            return rng.uniform(loc.min, loc.max, k)
+        if kind == INT:
+            return rng.integers(int(loc.min), int(loc.max) + 1, k).astype(np.float64)
+        if self.enums[i] is not None:
+            return rng.integers(0, len(self.enums[i]), k).astype(np.float64)
+        return None
+
+    def random_matrix(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        """An (n, loci) code matrix filled column by column (one vectorized draw per locus)."""
+        out = np.empty((n, len(self.kinds)), dtype=np.float64)
+        for j in range(len(self.kinds)):
+            codes = self.sample_codes(j, n, rng)
+            if codes is None:
+                raise ValueError(f"Unsupported locus type: {self.loci[j].type}")
+            out[:, j] = codes
+        return out
+
+
+class GenomeValues(_SequenceABC):
+    """List-like view over a packed genome: decodes on read, writes go through `Genome.set_value`."""
+
+    __slots__ = ("_genome",)
+
+    def __init__(self, genome: "Genome"):
+        self._genome = genome
+
+    def __len__(self) -> int:
+        return len(self._genome._data)
+
+    def __getitem__(self, index):
+        g = self._genome
+        data = g._data
+        if type(data) is array and type(index) is int:
+            return g._schema.decoders[index](data[index])
+        if isinstance(data, list):  # unpacked since the view was handed out
+            return data[index]
+        return self.tolist()[index]  # slices
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        if index < 0:
+            index += len(self)
+        self._genome.set_value(index, value)
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def tolist(self) -> List[Any]:
+        data = self._genome._data
+        return list(data) if isinstance(data, list) else self._genome.schema.decode(data)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, GenomeValues)):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.tolist())
+
+
 class Genome:
-    loci: List[Locus]
-    values: List[Any] = field(default_factory=list)
+    """
+    Values of one individual over a loci list. `values` is a plain list for
+    genomes built from explicit values and a `GenomeValues` view for packed
+    ones; both index, iterate, compare and assign like a list.
+    """
+
+    __slots__ = ("loci", "_schema", "_data", "_view", "_refs", "_phenotype")
 
     def __init__(self, loci: Optional[List[Locus]] = None, values: Optional[List[Any]] = None, length: Optional[int] = None):
-        rng = random.Random()
+        rng = _fallback_rng
+        self._schema: Optional[GenomeSchema] = None
+        self._view: Optional[GenomeValues] = None
+        self._refs: Optional[List[int]] = None  # owner count of a values list shared via share()
+        self._phenotype = None  # (decoder, storage, Traits) cached by TraitDecoder.decode
         if loci is not None and values is not None:
             # Explicit loci + values constructor
             self.loci = loci
-            self.values = values
+            self._data = values
         elif loci is not None:
             # Random initialization from loci
             self.loci = loci
-            self.values = []
+            self._data = []
             for loc in loci:
                 if loc.type == "float":
-                    self.values.append(rng.uniform(loc.min, loc.max))
+                    self._data.append(rng.uniform(loc.min, loc.max))
                 elif loc.type == "int":
-                    self.values.append(rng.randint(int(loc.min), int(loc.max)))
+                    self._data.append(rng.randint(int(loc.min), int(loc.max)))
                 elif loc.type == "enum" and loc.enum:
-                    self.values.append(rng.choice(loc.enum))
+                    self._data.append(rng.choice(loc.enum))
         elif length is not None:
             # Backwards compatibility: generate float loci
             self.loci = [
                 Locus(name=f"gene_{i}", type="float", min=0.0, max=1.0)
                 for i in range(length)
             ]
-            self.values = [rng.uniform(0.0, 1.0) for _ in range(length)]
+            self._data = [rng.uniform(0.0, 1.0) for _ in range(length)]
         else:
             raise ValueError("Must supply loci+values, loci, or length")
 
+    @classmethod
+    def from_codes(cls, loci: List[Locus], codes) -> "Genome":
+        """A packed genome over `loci` from float64 codes (anything array('d') accepts)."""
+        g = cls(loci=loci, values=[])
+        g._schema = GenomeSchema.of(loci)
+        g._data = codes if isinstance(codes, array) and codes.typecode == "d" else array("d", codes)
+        return g
+
     @classmethod
     def random_init(cls, loci: List[Locus], rng: random.Random) -> "Genome":
-        vals = []
-        for loc in loci:
-            if loc.type == "float":
-                vals.append(rng.uniform(loc.min, loc.max))
-            elif loc.type == "int":
-                vals.append(rng.randint(int(loc.min), int(loc.max)))
-            elif loc.type == "enum" and loc.enum:
-                vals.append(rng.choice(loc.enum))
+        schema = GenomeSchema.of(loci)
+        if not schema.packable:
+            bad = next(loc for loc, ok in zip(loci, schema.sampleable) if not ok)
+            raise ValueError(f"Unsupported locus type: {bad.type}")
+        return cls.from_codes(loci, schema.random_codes(rng))
+
+    # ---------- storage ----------
+    @property
+    def schema(self) -> GenomeSchema:
+        schema = self._schema
+        if schema is None or schema.loci is not self.loci:
+            schema = self._schema = GenomeSchema.of(self.loci)
+        return schema
+
+    @property
+    def packed(self) -> bool:
+        return isinstance(self._data, array)
+
+    @property
+    def values(self):
+        data = self._data
+        if isinstance(data, list):
+            return data
+        view = self._view
+        if view is None:
+            view = self._view = GenomeValues(self)
+        return view
+
+    @values.setter
+    def values(self, values: List[Any]) -> None:
+        if self._refs is not None:  # stop sharing without copying what is being replaced
+            self._refs[0] -= 1
+            self._refs = None
+        self._data = values
+
+    @property
+    def code_array(self) -> Optional[array]:
+        """The packed storage itself (not a copy; read-only use), or None for list-backed genomes."""
+        data = self._data
+        return data if isinstance(data, array) else None
+
+    def codes(self) -> array:
+        """float64 code per locus (a copy; enums as indices, other values as float(value))."""
+        if isinstance(self._data, array):
+            return array("d", self._data)
+        return array("d", self.schema.loose_codes(self._data))
+
+    def _unpack(self) -> None:
+        """Switch to list storage (for a write whose value has no code)."""
+        self._data = self.schema.decode(self._data)
+        self._refs = None
+
+    # ---------- copy-on-write ----------
+    def share(self) -> "Genome":
+        """A genome with the same values that shares this one's storage until either side writes."""
+        if self._refs is None:
+            self._refs = [1]
+        self._refs[0] += 1
+        twin = Genome.__new__(Genome)  # every slot is set here, no need for __init__
+        twin.loci = self.loci
+        twin._data = self._data
+        twin._view = None
+        twin._refs = self._refs
+        twin._schema = self._schema
+        twin._phenotype = self._phenotype  # same storage, so a cached decode stays valid
+        return twin
+
+    def _own(self) -> None:
+        """Make the storage private before writing to it (copies only if still shared)."""
+        refs = self._refs
+        if refs is not None:
+            if refs[0] > 1:
+                refs[0] -= 1
+                data = self._data
+                self._data = list(data) if isinstance(data, list) else array("d", data)
+            self._refs = None
+
+    def set_value(self, index: int, value: Any) -> None:
+        """Write one locus value in place (copy-on-write for shared genomes)."""
+        self._own()
+        data = self._data
+        if isinstance(data, array):
+            code = self.schema.encode_value(index, value)
+            if code is None:
+                self._unpack()
+                self._data[index] = value
             else:
-                raise ValueError(f"Unsupported locus type: {loc.type}")
-        return cls(loci=loci, values=vals)
+                data[index] = code
+        else:
+            data[index] = value
+        self._phenotype = None
 
-    def mutate(self, rate: float = 0.01):
-        rng = random.Random()
-        for i, loc in enumerate(self.loci):
-            if rng.random() < rate:
-                if loc.type == "float":
-                    self.values[i] = rng.uniform(loc.min, loc.max)
-                elif loc.type == "int":
-                    self.values[i] = rng.randint(int(loc.min), int(loc.max))
-                elif loc.type == "enum" and loc.enum:
-                    self.values[i] = rng.choice(loc.enum)
+    def mutate(self, rate: float = 0.01, rng: Optional[random.Random] = None):
+        rng = rng or _fallback_rng
+        schema = self.schema
+        packed = isinstance(self._data, array)
+        samplers = schema.code_samplers if packed else schema.samplers
+        for i, sample in enumerate(samplers):
+            if rng.random() < rate and sample is not None:
+                self._own()
+                self._phenotype = None
+                self._data[i] = sample(rng)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Genome):
+            return NotImplemented
+        return self.loci == other.loci and list(self.values) == list(other.values)
+
+    __hash__ = None
 
     def __repr__(self):
-        return f"Genome(values={self.values})"
+        return f"Genome(values={list(self.values)})"
+
+
+# ---------- cohorts ----------
+def codes_matrix(genomes: Sequence[Genome]) -> np.ndarray:
+    """(len(genomes), loci) float64 code matrix of a cohort (packed storage is copied as raw bytes)."""
+    if not genomes:
+        return np.empty((0, 0), dtype=np.float64)
+    raw = b"".join((g.code_array if g.code_array is not None else g.codes()).tobytes() for g in genomes)
+    return np.frombuffer(raw, dtype=np.float64).reshape(len(genomes), -1)
+
+
+def genomes_from_matrix(loci: List[Locus], matrix: np.ndarray) -> List[Genome]:
+    """One packed Genome per row of a code matrix."""
+    n = len(matrix)
+    if n == 0:
+        return []
+    buf = np.ascontiguousarray(matrix, dtype=np.float64).tobytes()
+    step = len(buf) // n
+    out = []
+    for i in range(0, n * step, step):
+        codes = array("d")
+        codes.frombytes(buf[i:i + step])
+        out.append(Genome.from_codes(loci, codes))
+    return out
+
+
+def random_init(schema: GenomeSchema, n: int, rng) -> List[Genome]:
+    """
+    `n` random packed genomes in one step. With a NumPy Generator the codes are
+    drawn as one (n, loci) matrix, column by column; with a random.Random they
+    are the same draws, in the same order, as `n` calls of `Genome.random_init`.
+    """
+    if isinstance(rng, np.random.Generator):
+        return genomes_from_matrix(schema.loci, schema.random_matrix(n, rng))
+    if not schema.packable:
+        bad = next(loc for loc, ok in zip(schema.loci, schema.sampleable) if not ok)
+        raise ValueError(f"Unsupported locus type: {bad.type}")
+    samplers = schema.code_samplers
+    loci = schema.loci
+    return [Genome.from_codes(loci, array("d", [sample(rng) for sample in samplers])) for _ in range(n)]
 
 
 class MutationModel:
     """
     Simple per-locus mutation model.
+
+    `mutate` draws one uniform per locus (the seeded per-genome path).
+    `mutate_batch` / `mutate_cohort` mutate a whole cohort at once: the number
+    of mutations is drawn as Binomial(children x loci, rate) and only that many
+    (child, locus) positions are sampled, so the cost follows the number of
+    mutations rather than the cohort size.
     """
 
     def __init__(self, per_locus_rate: float = 0.01):
         self.per_locus_rate = per_locus_rate
 
     def mutate(self, genome: Genome, rng: Optional[random.Random] = None) -> Genome:
-        rng = rng or random.Random()
-        new_vals = []
-        for loc, val in zip(genome.loci, genome.values):
-            if rng.random() < self.per_locus_rate:
-                if loc.type == "float":
-                    new_vals.append(rng.uniform(loc.min, loc.max))
-                elif loc.type == "int":
-                    new_vals.append(rng.randint(int(loc.min), int(loc.max)))
-                elif loc.type == "enum" and loc.enum:
-                    new_vals.append(rng.choice(loc.enum))
-                else:
-                    new_vals.append(val)
-            else:
-                new_vals.append(val)
+        """A mutated copy of `genome`; when nothing mutates, a copy-on-write twin of it."""
+        rng = rng or _fallback_rng
+        rate = self.per_locus_rate
+        schema = genome.schema
+        data = genome._data
+        if isinstance(data, array):
+            new_codes = None
+            for i, sample in enumerate(schema.code_samplers):
+                if rng.random() < rate and sample is not None:
+                    if new_codes is None:
+                        new_codes = array("d", data)
+                    new_codes[i] = sample(rng)
+            return genome.share() if new_codes is None else Genome.from_codes(genome.loci, new_codes)
+        new_vals = list(data[:len(schema)])
+        for i, sample in enumerate(schema.samplers[:len(new_vals)]):
+            if rng.random() < rate and sample is not None:
+                new_vals[i] = sample(rng)
         return Genome(loci=genome.loci, values=new_vals)
+
+    # ---------- batch mutation ----------
+    def sample_mutations(self, n: int, loci: List[Locus], rng: np.random.Generator
+                         ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (rows, cols, codes) of the mutations of an n x len(loci) cohort, sorted
+        by row: a binomial count, then that many distinct positions.
+        """
+        width = len(loci)
+        total = n * width
+        rate = min(max(float(self.per_locus_rate), 0.0), 1.0)
+        k = int(rng.binomial(total, rate)) if total else 0
+        if not k:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0, dtype=np.float64)
+        flat = np.sort(rng.choice(total, size=k, replace=False))
+        rows, cols = np.divmod(flat, width)
+        codes = np.empty(k, dtype=np.float64)
+        keep = np.ones(k, dtype=bool)
+        schema = GenomeSchema.of(loci)
+        for j in np.unique(cols).tolist():
+            sel = cols == j
+            fresh = schema.sample_codes(j, int(np.count_nonzero(sel)), rng)
+            if fresh is None:
+                keep[sel] = False  # loci that cannot be sampled keep their value
+            else:
+                codes[sel] = fresh
+        return rows[keep], cols[keep], codes[keep]
+
+    def mutate_batch(self, genes: np.ndarray, loci: List[Locus], rng: np.random.Generator) -> np.ndarray:
+        """Mutate a genome matrix (rows = individuals, codes as in packed genomes) in place; returns the mutated rows."""
+        rows, cols, codes = self.sample_mutations(len(genes), loci, rng)
+        genes[rows, cols] = codes
+        return np.unique(rows)
+
+    def mutate_cohort(self, genomes: Sequence[Genome], rng: np.random.Generator) -> List[Genome]:
+        """
+        Mutated versions of `genomes`. Every result starts as a copy-on-write
+        twin of its input, so only genomes that actually mutate copy their values.
+        """
+        out = [g.share() for g in genomes]
+        if not out:
+            return out
+        schema = out[0].schema
+        rows, cols, codes = self.sample_mutations(len(out), out[0].loci, rng)
+        decoders = schema.decoders
+        for r, j, c in zip(rows.tolist(), cols.tolist(), codes.tolist()):
+            out[r].set_value(j, decoders[j](c))
+        return out
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 @dataclass
 class Individual:
@@ -8,16 +8,28 @@ class Individual:
     parents: Optional[List[int]] = None
 
 class LineageTracker:
-    def __init__(self):
+    def __init__(self, archive=None):
         self.individuals = {}
+        # Optional LineageArchive holding individuals moved out of memory
+        self.archive = archive
 
     def add_individual(self, individual: Individual):
         """Register a new individual in the lineage."""
         self.individuals[individual.id] = individual
 
+    def archive_individual(self, id: int, birth_gen: int, death_gen: int):
+        """Move an individual from memory into the archive."""
+        ind = self.individuals.pop(id)
+        self.archive.append(ind, birth_gen, death_gen)
+
     def get_individual(self, id: int) -> Optional[Individual]:
         """Retrieve an individual by ID."""
-        return self.individuals.get(id)
+        ind = self.individuals.get(id)
+        if ind is None and self.archive is not None:
+            rec = self.archive.get(id)
+            if rec is not None:
+                ind = Individual(id=rec.id, genome=rec.genome, parents=rec.parents)
+        return ind
 
     def get_parents(self, id: int) -> List[int]:
         """Get the parents of an individual."""
@@ -26,5 +38,16 @@ class LineageTracker:
 
     def get_children(self, parent_id: int) -> List[int]:
         """Find all children of a given parent."""
-        return [ind.id for ind in self.individuals.values()
-                if ind.parents and parent_id in ind.parents]
+        children = [ind.id for ind in self.individuals.values()
+                    if ind.parents and parent_id in ind.parents]
+        if self.archive is not None and len(self.archive):
+            children = sorted(self.archive.children(parent_id) + children)
+        return children
+
+    def parents_map(self) -> Dict[int, Optional[List[int]]]:
+        """id -> parents for every individual, archived ones included (ids ascending)."""
+        if self.archive is None or not len(self.archive):
+            return {int(k): v.parents for k, v in self.individuals.items()}
+        data = {rec.id: rec.parents for rec in self.archive.records()}
+        data.update((int(k), v.parents) for k, v in self.individuals.items())
+        return dict(sorted(data.items()))
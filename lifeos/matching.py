@@ -0,0 +1,206 @@
+"""
+Partner matching engine: an indexed pool of unmatched agents.
+
+The pool keeps agents in a flat list with an id -> position index, so a matched
+agent is removed in O(1) by swapping with the last slot. Full siblings are
+rejected through a parent-pair index (parent pair -> how many pool members share
+it) instead of comparing the focal agent with every candidate.
+
+`match_pairs` reproduces the historical random matching: the pool is shuffled,
+each still-unmatched focal agent draws one partner uniformly among the unmatched,
+non-sibling agents, and agents with no valid partner stay available to later
+focals. Only the way the uniform draw is taken differs, so pairings are
+equivalent in distribution but not draw-for-draw.
+"""
+from __future__ import annotations
+import random
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+ParentKey = Optional[FrozenSet[int]]
+
+# Below this share of eligible candidates, rejection sampling is replaced by a scan.
+_MIN_ACCEPT_RATIO = 0.25
+# Weighted draws give up on rejection sampling after this many misses and scan instead.
+_MAX_REJECTIONS = 64
+
+
+def parent_key(ind) -> ParentKey:
+    """Key shared by full siblings (two known, distinct parents), else None."""
+    pa = set(ind.parents or [])
+    return frozenset(pa) if len(pa) == 2 else None
+
+
+class MatchingPool:
+    """Unmatched agents with O(1) membership, removal and sibling counting."""
+
+    def __init__(self, agents: Sequence):
+        self._items: List = list(agents)
+        self._pos: Dict[int, int] = {a.id: i for i, a in enumerate(self._items)}
+        self._keys: Dict[int, ParentKey] = {}
+        self._sibling_count: Dict[FrozenSet[int], int] = {}
+        for a in self._items:
+            key = parent_key(a)
+            self._keys[a.id] = key
+            if key is not None:
+                self._sibling_count[key] = self._sibling_count.get(key, 0) + 1
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, agent_id: int) -> bool:
+        return agent_id in self._pos
+
+    def remove(self, agent_id: int) -> None:
+        idx = self._pos.pop(agent_id)
+        last = self._items.pop()
+        if last.id != agent_id:
+            self._items[idx] = last
+            self._pos[last.id] = idx
+        key = self._keys.pop(agent_id)
+        if key is not None:
+            self._sibling_count[key] -= 1
+
+    def compatible(self, focal, cand) -> bool:
+        if cand.id == focal.id:
+            return False
+        key = self._keys.get(focal.id)
+        return key is None or self._keys.get(cand.id) != key
+
+    def eligible_count(self, focal) -> int:
+        """Number of pool members `focal` (itself in the pool) may pair with."""
+        key = self._keys.get(focal.id)
+        siblings = self._sibling_count.get(key, 1) - 1 if key is not None else 0
+        return len(self._items) - 1 - siblings
+
+    def candidates(self, focal) -> List:
+        """Explicit candidate list, for choosers that need to see every option."""
+        return [c for c in self._items if self.compatible(focal, c)]
+
+    def draw(self, focal, rng: random.Random):
+        """Uniform draw among eligible partners of `focal`, or None if there are none."""
+        eligible = self.eligible_count(focal)
+        if eligible <= 0:
+            return None
+        if eligible < _MIN_ACCEPT_RATIO * len(self._items):
+            return rng.choice(self.candidates(focal))
+        while True:
+            cand = self._items[rng.randrange(len(self._items))]
+            if self.compatible(focal, cand):
+                return cand
+
+
+class WeightedMatchingPool(MatchingPool):
+    """
+    MatchingPool whose draws are proportional to fixed per-agent weights.
+
+    Weights live in a Fenwick tree over the initial pool order, so sampling and
+    removal are O(log n); sibling weight is tracked per parent pair. Weights
+    must be non-negative; a focal agent whose eligible partners all weigh zero
+    draws uniformly among them.
+    """
+
+    def __init__(self, agents: Sequence, weights: Sequence[float]):
+        super().__init__(agents)
+        if len(weights) != len(self._items):
+            raise ValueError("weights must match the number of agents")
+        self._order: List = list(self._items)
+        self._slot: Dict[int, int] = {a.id: i for i, a in enumerate(self._order)}
+        self._w: List[float] = [float(w) for w in weights]
+        if any(not w >= 0.0 for w in self._w):
+            raise ValueError("weights must be non-negative numbers")
+        self._tree: List[float] = [0.0] * (len(self._w) + 1)
+        for i, w in enumerate(self._w):
+            self._add(i, w)
+        self._total = sum(self._w)
+        self._sibling_weight: Dict[FrozenSet[int], float] = {}
+        for a, w in zip(self._order, self._w):
+            key = self._keys[a.id]
+            if key is not None:
+                self._sibling_weight[key] = self._sibling_weight.get(key, 0.0) + w
+
+    def _add(self, i: int, delta: float) -> None:
+        i += 1
+        n = len(self._tree)
+        while i < n:
+            self._tree[i] += delta
+            i += i & -i
+
+    def _find(self, target: float) -> int:
+        """Smallest slot whose prefix weight exceeds `target`."""
+        pos, step = 0, 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < len(self._tree) and self._tree[nxt] <= target:
+                pos = nxt
+                target -= self._tree[nxt]
+            step >>= 1
+        return min(pos, len(self._w) - 1)
+
+    def remove(self, agent_id: int) -> None:
+        key = self._keys.get(agent_id)
+        super().remove(agent_id)
+        slot = self._slot[agent_id]
+        w = self._w[slot]
+        self._w[slot] = 0.0
+        self._add(slot, -w)
+        self._total -= w
+        if key is not None:
+            self._sibling_weight[key] -= w
+
+    def eligible_weight(self, focal) -> float:
+        key = self._keys.get(focal.id)
+        own = self._w[self._slot[focal.id]]
+        siblings = self._sibling_weight.get(key, own) - own if key is not None else 0.0
+        return self._total - own - siblings
+
+    def draw(self, focal, rng: random.Random):
+        if self.eligible_count(focal) <= 0:
+            return None
+        eligible = self.eligible_weight(focal)
+        if eligible <= 0.0:
+            return super().draw(focal, rng)  # no weight to draw by: uniform among eligible partners
+        if eligible >= _MIN_ACCEPT_RATIO * self._total:
+            for _ in range(_MAX_REJECTIONS):
+                cand = self._order[self._find(rng.random() * self._total)]
+                if cand.id in self and self.compatible(focal, cand):
+                    return cand
+        cands = self.candidates(focal)
+        weights = [self._w[self._slot[c.id]] for c in cands]
+        if sum(weights) <= 0.0:  # the running totals only held rounding residue
+            return rng.choice(cands)
+        return rng.choices(cands, weights=weights, k=1)[0]
+
+
+def match_pairs(agents: Sequence, rng: random.Random, chooser=None) -> List[Tuple[object, object]]:
+    """
+    Pair up `agents` and return (focal, partner) tuples in matching order.
+
+    `chooser` is an optional partner-selection policy. Policies exposing the
+    batched `partner_weights(candidates) -> weights` hook are scored once per
+    call; policies with only `choose_partner(focal, candidates)` are asked per
+    focal agent with an explicit candidate list.
+    """
+    order = list(agents)
+    rng.shuffle(order)
+
+    batched = chooser is not None and hasattr(chooser, "partner_weights")
+    if batched:
+        pool: MatchingPool = WeightedMatchingPool(order, chooser.partner_weights(order))
+    else:
+        pool = MatchingPool(order)
+
+    pairs: List[Tuple[object, object]] = []
+    for focal in order:
+        if focal.id not in pool:
+            continue
+        if chooser is not None and not batched:
+            candidates = pool.candidates(focal)
+            partner = chooser.choose_partner(focal, candidates) if candidates else None
+        else:
+            partner = pool.draw(focal, rng)
+        if partner is None:
+            continue
+        pool.remove(focal.id)
+        pool.remove(partner.id)
+        pairs.append((focal, partner))
+    return pairs
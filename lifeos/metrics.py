@@ -1,7 +1,22 @@
 """
-Standardized metrics interface and CSV writing stubs.
+Standardized metrics interface, incremental counters and metrics sinks.
 """
-from typing import Dict, Any, List
+from collections import Counter
+from time import perf_counter_ns
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+import csv
+import sqlite3
+
+import numpy as np
+
+# Optional Parquet backend for the columnar sink
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except Exception:
+    pa = None
+    pq = None
 
 METRIC_SCHEMA = [
     "generation",
@@ -22,3 +37,227 @@ def compute_metrics(population_size: int, generation: int) -> Dict[str, Any]:
         "harmony_score": 0.0,
         "artifact_count": 0,
     }
+
+
+class MetricsCollector:
+    """
+    Incremental per-generation event counters.
+
+    Engines report events as they happen (`record`), so reading a generation's
+    totals (`count`) is O(1) instead of a scan over the whole event history.
+    """
+
+    def __init__(self):
+        self._per_gen: Dict[int, Counter] = {}
+        self.totals: Counter = Counter()
+
+    def record(self, generation: int, event: str, n: int = 1) -> None:
+        self._per_gen.setdefault(generation, Counter())[event] += n
+        self.totals[event] += n
+
+    def count(self, generation: int, event: str) -> int:
+        per_gen = self._per_gen.get(generation)
+        return per_gen[event] if per_gen else 0
+
+    def generation_counts(self, generation: int) -> Dict[str, int]:
+        return dict(self._per_gen.get(generation, {}))
+
+
+class PhaseTimer:
+    """
+    Wall time per phase of one generation step, in perf_counter_ns.
+
+    `start()` marks the beginning of a step and each `lap(phase)` charges the
+    time since the previous mark to `phase`. `row()` reports the totals as
+    t_<phase>_ms columns (every declared phase, so all rows share one header)
+    plus t_step_ms, and clears them for the next step. Engines keep the timer
+    as None when timings are off, which costs one comparison per phase.
+    """
+
+    def __init__(self, phases: List[str]):
+        self.phases = list(phases)
+        self.totals: Dict[str, int] = dict.fromkeys(self.phases, 0)
+        self._mark = perf_counter_ns()
+
+    def start(self) -> None:
+        self._mark = perf_counter_ns()
+
+    def lap(self, phase: str) -> None:
+        now = perf_counter_ns()
+        self.totals[phase] = self.totals.get(phase, 0) + now - self._mark
+        self._mark = now
+
+    def row(self) -> Dict[str, float]:
+        out = {f"t_{phase}_ms": round(ns / 1e6, 3) for phase, ns in self.totals.items()}
+        out["t_step_ms"] = round(sum(self.totals.values()) / 1e6, 3)
+        self.totals = dict.fromkeys(self.phases, 0)
+        return out
+
+
+# -------------------------
+# Metrics sinks
+# -------------------------
+class MetricsSink:
+    """
+    Destination for per-generation metric rows.
+
+    Rows are buffered and handed to `_write_rows` every `flush_every` rows and on
+    `close()`. Sinks are context managers, so a run closes (and flushes) its sink
+    even when it fails half-way.
+    """
+
+    suffix = ""
+
+    def __init__(self, path: Path, flush_every: int = 64):
+        self.path = Path(path)
+        self.flush_every = max(1, int(flush_every))
+        self._buffer: List[Dict[str, Any]] = []
+        self._fieldnames: Optional[List[str]] = None
+
+    def write(self, row: Dict[str, Any]) -> None:
+        if self._fieldnames is None:
+            self._fieldnames = list(row.keys())
+        self._buffer.append(row)
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_rows(self._buffer)
+            self._buffer = []
+
+    def close(self) -> None:
+        self.flush()
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def __enter__(self) -> "MetricsSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class CSVMetricsSink(MetricsSink):
+    """Appends to a CSV file (header written once, when the file is new)."""
+
+    suffix = ".csv"
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        new = not self.path.exists()
+        with self.path.open("a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=self._fieldnames)
+            if new:
+                writer.writeheader()
+            writer.writerows(rows)
+
+
+class ColumnarMetricsSink(MetricsSink):
+    """
+    Writes rows as columns: Parquet when pyarrow is installed (one row group
+    per flush through a single ParquetWriter), otherwise a NumPy `.npz`
+    archive (one array per column). Without pyarrow each flush is saved as a
+    chunk file in `<path>.parts/` and the chunks are merged into the archive on
+    close, so a flush costs only its own rows and none are kept in memory.
+    """
+
+    def __init__(self, path: Path, flush_every: int = 1024):
+        super().__init__(path, flush_every)
+        self.suffix = ".parquet" if pa is not None else ".npz"
+        if self.path.suffix != self.suffix:
+            self.path = self.path.with_suffix(self.suffix)
+        self._writer = None                 # pq.ParquetWriter, opened on the first flush
+        self._chunks: List[Path] = []       # .npz chunks awaiting the merge in close()
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        columns = {key: [row.get(key) for row in rows] for key in self._fieldnames}
+        if pa is not None:
+            table = pa.table(columns)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(str(self.path), table.schema)
+            else:
+                table = table.cast(self._writer.schema)
+            self._writer.write_table(table)
+            return
+        parts = self.path.with_name(self.path.name + ".parts")
+        parts.mkdir(parents=True, exist_ok=True)
+        chunk = parts / f"{len(self._chunks):06d}.npz"
+        np.savez(chunk, **{k: np.asarray(v) for k, v in columns.items()})
+        self._chunks.append(chunk)
+
+    def close(self) -> None:
+        super().close()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._chunks:
+            self._merge_chunks()
+
+    def _merge_chunks(self) -> None:
+        pieces: Dict[str, List[np.ndarray]] = {key: [] for key in self._fieldnames}
+        for chunk in self._chunks:
+            with np.load(chunk, allow_pickle=True) as data:
+                for key in self._fieldnames:
+                    pieces[key].append(data[key])
+        merged = {}
+        for key, arrays in pieces.items():
+            try:
+                merged[key] = np.concatenate(arrays)
+            except (TypeError, ValueError):  # chunks with incompatible dtypes (e.g. str and float)
+                merged[key] = np.concatenate([a.astype(object) for a in arrays])
+        np.savez(self.path, **merged)
+        for chunk in self._chunks:
+            chunk.unlink()
+        try:
+            self._chunks[0].parent.rmdir()
+        except OSError:
+            pass  # leftovers from another run; the merged archive is complete regardless
+        self._chunks = []
+
+
+class SQLiteMetricsSink(MetricsSink):
+    """Inserts rows into a `metrics` table of a SQLite database."""
+
+    suffix = ".sqlite"
+
+    def __init__(self, path: Path, flush_every: int = 64, table: str = "metrics"):
+        super().__init__(path, flush_every)
+        self.table = table
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        cols = ", ".join(f'"{k}"' for k in self._fieldnames)
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.execute(f'CREATE TABLE IF NOT EXISTS "{self.table}" ({cols})')
+        marks = ", ".join("?" for _ in self._fieldnames)
+        self._conn.executemany(
+            f'INSERT INTO "{self.table}" ({cols}) VALUES ({marks})',
+            [tuple(row.get(k) for k in self._fieldnames) for row in rows],
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        super().close()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+SINKS = {
+    "csv": CSVMetricsSink,
+    "columnar": ColumnarMetricsSink,
+    "sqlite": SQLiteMetricsSink,
+}
+
+
+def open_sink(kind: str, out_dir: Path, name: str = "metrics", flush_every: Optional[int] = None) -> MetricsSink:
+    """Create the metrics sink `kind` ("csv", "columnar" or "sqlite") for `out_dir/<name>.*`."""
+    try:
+        cls = SINKS[(kind or "csv").lower()]
+    except KeyError:
+        raise ValueError(f"Unknown metrics sink: {kind!r}") from None
+    kwargs = {} if flush_every is None else {"flush_every": flush_every}
+    return cls(Path(out_dir) / f"{name}{cls.suffix}", **kwargs)
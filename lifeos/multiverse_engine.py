@@ -1,17 +1,22 @@
 # lifeos/multiverse_engine.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
-import csv
 import json
 import random
+import time
 
-from .genome import Locus, Genome, MutationModel
+import numpy as np
+
+from .genome import Locus, Genome, GenomeSchema, MutationModel, random_init
 from .traits import TraitDecoder, Traits
 from .reproduction import ReproductionModel
 from .lineage import LineageTracker, Individual
-from .policy import Policy, Action
+from .policy import Policy, Action, EAT, REST, EXPLORE
+from .metrics import CSVMetricsSink, PhaseTimer, open_sink
+from .stats import PopulationStats
 
 # -------------------------
 # Policies (simple mapping)
@@ -22,6 +27,9 @@ class PolicyRational(Policy):
             return "eat"
         return "explore"
 
+    def decide_batch(self, size: np.ndarray, energy: np.ndarray) -> np.ndarray:
+        return np.where(energy < 30, EAT, EXPLORE)
+
 
 class PolicySpiritual(Policy):
     def decide(self, traits: Traits) -> Action:
@@ -30,6 +38,9 @@ class PolicySpiritual(Policy):
             return "rest"
         return "explore"
 
+    def decide_batch(self, size: np.ndarray, energy: np.ndarray) -> np.ndarray:
+        return np.where(energy < 50, REST, EXPLORE)
+
 
 def make_policy(name: str) -> Policy:
     name = (name or "rational").lower()
@@ -48,11 +59,15 @@ class Scenario:
     math_injection: bool = False
     money_system: bool = False
     policy: str = "rational"
+    engine: str = "objects"   # "objects" (World) or "vector" (VectorWorld)
 
 
 class World:
     """One world with a population that evolves over generations."""
 
+    # timed stages of step_generation, in order (timings=True)
+    step_phases = ("decode", "policy", "reproduce", "refill")
+
     def __init__(
         self,
         name: str,
@@ -63,18 +78,25 @@ class World:
         mutation_rate: float,
         policy_name: str = "rational",
         out_dir: Optional[Path] = None,
+        metrics_sink: str = "csv",
+        metrics_flush_every: Optional[int] = None,
+        timings: bool = False,           # add per-stage wall times (t_<stage>_ms) to the metrics rows
     ):
         self.name = name
         self.loci = loci
         self.population_size = population_size
         self.generations = generations
+        self.seed = seed
         self.rng = random.Random(seed)
-        self.decoder = TraitDecoder()
+        self.decoder = TraitDecoder(loci)
         self.mutation = MutationModel(per_locus_rate=mutation_rate)
         self.repro = ReproductionModel(crossover_rate=0.5)  # ✅ corrected
         self.policy = make_policy(policy_name)
         self.lineage = LineageTracker()
         self.out_dir = out_dir
+        self.metrics_sink = metrics_sink
+        self.metrics_flush_every = metrics_flush_every
+        self.timer: Optional[PhaseTimer] = PhaseTimer(list(self.step_phases)) if timings else None
         self.population: List[Individual] = []
         self._next_id = 0
 
@@ -86,17 +108,24 @@ class World:
         return ind
 
     def initialize(self):
-        for _ in range(self.population_size):
-            g = Genome.random_init(self.loci, self.rng)
-            ind = self._new_individual(g, parents=None)
-            self.population.append(ind)
+        # one bulk draw; the same values, in the same order, as one Genome.random_init per founder
+        for g in random_init(GenomeSchema.of(self.loci), self.population_size, self.rng):
+            self.population.append(self._new_individual(g, parents=None))
 
     # ---------- dynamics ----------
     def step_generation(self, gen: int):
+        timer = self.timer
+        if timer is not None:
+            timer.start()
+        decode = self.decoder.decode
+        phenotypes = [decode(ind.genome) for ind in self.population]
+        if timer is not None:
+            timer.lap("decode")
+
         updated: List[Individual] = []
-        for ind in self.population:
-            traits = self.decoder.decode(ind.genome)
-            act = self.policy.decide(traits)
+        decide = self.policy.decide
+        for ind, traits in zip(self.population, phenotypes):
+            act = decide(traits)
 
             # toy energy update
             if act == "eat":
@@ -106,14 +135,16 @@ class World:
             else:  # rest
                 new_energy = min(int(traits.energy) + 1, 100)
 
-            if len(ind.genome.values) >= 2 and isinstance(ind.genome.values[1], int):
-                new_vals = list(ind.genome.values)
-                new_vals[1] = new_energy
-                ind.genome = Genome(loci=ind.genome.loci, values=new_vals)
+            # energy is written in place (copy-on-write if the genome is shared with a clone)
+            values = ind.genome.values
+            if len(values) >= 2 and isinstance(values[1], int):
+                ind.genome.set_value(1, new_energy)
 
             updated.append(ind)
 
         self.population = updated
+        if timer is not None:
+            timer.lap("policy")
 
         # reproduction
         self.rng.shuffle(self.population)
@@ -124,16 +155,15 @@ class World:
             child_genome = self.repro.mate(p1.genome, p2.genome, self.rng)
             child = self._new_individual(child_genome, parents=[p1.id, p2.id])
             children.append(child)
+        if timer is not None:
+            timer.lap("reproduce")
 
         # keep stable size
         if len(children) < self.population_size:
             while len(children) < self.population_size:
                 if children:
                     clone_of = self.rng.choice(children)
-                    c2 = self._new_individual(
-                        Genome(loci=clone_of.genome.loci, values=list(clone_of.genome.values)),
-                        parents=clone_of.parents,
-                    )
+                    c2 = self._new_individual(clone_of.genome.share(), parents=clone_of.parents)
                     children.append(c2)
                 else:
                     g = Genome.random_init(self.loci, self.rng)
@@ -141,49 +171,47 @@ class World:
                     children.append(c)
 
         self.population = children[: self.population_size]
+        if timer is not None:
+            timer.lap("refill")
 
     # ---------- metrics ----------
-    def _genetic_diversity(self) -> float:
-        floats: List[List[float]] = []
-        for idx, loc in enumerate(self.loci):
-            if loc.type == "float":
-                floats.append([float(ind.genome.values[idx]) for ind in self.population])
-        if not floats:
-            return 0.0
-        spreads = []
-        for column in floats:
-            if len(column) < 2:
-                spreads.append(0.0)
-            else:
-                mean = sum(column) / len(column)
-                var = sum((x - mean) ** 2 for x in column) / (len(column) - 1)
-                spreads.append(var ** 0.5)
-        return sum(spreads) / len(spreads)
-
-    def _avg_energy(self) -> float:
+    def population_stats(self, bins: int = 0) -> PopulationStats:
+        """Per-locus statistics of the current population (one pass; histograms with `bins` > 0)."""
+        return PopulationStats.from_genomes(self.loci, (ind.genome for ind in self.population), bins=bins)
+
+    def _genetic_diversity(self, stats: Optional[PopulationStats] = None) -> float:
+        return (stats or self.population_stats()).genetic_diversity()
+
+    def _avg_energy(self, stats: Optional[PopulationStats] = None) -> float:
+        # energy is the int value at locus 1 (World's convention), other values are ignored
         if not self.population or len(self.population[0].genome.values) < 2:
             return 0.0
-        vals = [int(ind.genome.values[1]) for ind in self.population if isinstance(ind.genome.values[1], int)]
-        return sum(vals) / len(vals) if vals else 0.0
+        stats = stats or self.population_stats()
+        if self.loci[1].type != "int":
+            return 0.0
+        return stats.locus(1).average
 
     def compute_metrics(self, generation: int) -> Dict[str, Any]:
+        stats = self.population_stats()
         return {
             "world": self.name,
             "generation": generation,
             "population": len(self.population),
-            "genetic_diversity": round(self._genetic_diversity(), 6),
-            "avg_energy": round(self._avg_energy(), 3),
+            "genetic_diversity": round(self._genetic_diversity(stats), 6),
+            "avg_energy": round(self._avg_energy(stats), 3),
         }
 
+    def _metrics_row(self, generation: int) -> Dict[str, Any]:
+        """compute_metrics, plus the stage timings of the last step when timings are on."""
+        row = self.compute_metrics(generation)
+        if self.timer is not None:
+            row.update(self.timer.row())
+        return row
+
     # ---------- I/O ----------
     def write_metrics_row(self, csv_path: Path, row: Dict[str, Any]):
-        new = not csv_path.exists()
-        csv_path.parent.mkdir(parents=True, exist_ok=True)
-        with csv_path.open("a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=list(row.keys()))
-            if new:
-                writer.writeheader()
-            writer.writerow(row)
+        with CSVMetricsSink(csv_path, flush_every=1) as sink:
+            sink.write(row)
 
     def dump_lineage(self, path: Path):
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -194,18 +222,176 @@ class World:
     def run(self, out_dir: Path):
         self.out_dir = out_dir
         out_dir.mkdir(parents=True, exist_ok=True)
-        metrics_csv = out_dir / "metrics.csv"
         self.initialize()
-        self.write_metrics_row(metrics_csv, self.compute_metrics(0))
-        for g in range(1, self.generations + 1):
-            self.step_generation(g)
-            self.write_metrics_row(metrics_csv, self.compute_metrics(g))
+        with open_sink(self.metrics_sink, out_dir, flush_every=self.metrics_flush_every) as sink:
+            sink.write(self._metrics_row(0))
+            for g in range(1, self.generations + 1):
+                self.step_generation(g)
+                sink.write(self._metrics_row(g))
         self.dump_lineage(out_dir / "lineage.json")
 
 
+class VectorWorld(World):
+    """
+    World with the population stored as a genome matrix: one row per
+    individual, one float64 column per locus (enums as indices into
+    `Locus.enum`). Each stage of a generation is a handful of array operations;
+    the rules and metrics are those of World, the random draws are NumPy's.
+
+    Like World, it does not mutate children unless `apply_mutation=True`.
+    """
+
+    step_phases = ("policy", "reproduce", "refill")  # no per-individual decode
+
+    def __init__(self, *args, apply_mutation: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.np_rng = np.random.default_rng(self.seed)
+        self.apply_mutation = apply_mutation
+        self.schema = GenomeSchema.of(self.loci)
+        self.genes = np.zeros((0, len(self.loci)), dtype=np.float64)
+        self.ids = np.zeros(0, dtype=np.int64)
+        # lineage as (ids, parent_a, parent_b) chunks; -1 = no parent
+        self._lineage_chunks: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        # the energy update applies only when locus 1 holds ints (World checks the value type)
+        self._energy_col = 1 if len(self.loci) >= 2 and self.loci[1].type == "int" else None
+        self._float_cols = [i for i, loc in enumerate(self.loci) if loc.type == "float"]
+
+    # ---------- genome matrix ----------
+    def _random_rows(self, n: int) -> np.ndarray:
+        return self.schema.random_matrix(n, self.np_rng)
+
+    def _mutate(self, rows: np.ndarray) -> np.ndarray:
+        self.mutation.mutate_batch(rows, self.loci, self.np_rng)
+        return rows
+
+    def _add_individuals(self, rows: np.ndarray, parent_a: np.ndarray, parent_b: np.ndarray) -> np.ndarray:
+        ids = np.arange(self._next_id, self._next_id + len(rows), dtype=np.int64)
+        self._next_id += len(rows)
+        self._lineage_chunks.append((ids, parent_a, parent_b))
+        return ids
+
+    def genome(self, row: int) -> Genome:
+        """One matrix row as a (packed) Genome; rows use the same codes as packed genomes."""
+        return Genome.from_codes(self.loci, self.genes[row].tolist())
+
+    # ---------- initialization ----------
+    def initialize(self):
+        n = self.population_size
+        none = np.full(n, -1, dtype=np.int64)
+        self.genes = self._random_rows(n)
+        self.ids = self._add_individuals(self.genes, none, none)
+
+    # ---------- dynamics ----------
+    def step_generation(self, gen: int):
+        timer = self.timer
+        if timer is not None:
+            timer.start()
+        genes, ids = self.genes, self.ids
+        n = len(genes)
+
+        # toy energy update from the batched policy
+        e = self._energy_col
+        if e is not None and n:
+            energy = genes[:, e]
+            act = self.policy.decide_batch(genes[:, 0], energy)
+            genes[:, e] = np.select(
+                [act == EAT, act == EXPLORE],
+                [np.minimum(energy + 5, 100), np.maximum(energy - 2, 0)],
+                np.minimum(energy + 1, 100),
+            )
+        if timer is not None:
+            timer.lap("policy")
+
+        # reproduction: shuffle, then each consecutive pair has one child
+        perm = self.np_rng.permutation(n)
+        genes, ids = genes[perm], ids[perm]
+        m = n // 2
+        children = self.repro.mate_batch(genes, np.arange(0, 2 * m, 2), np.arange(1, 2 * m, 2), self.np_rng)
+        if self.apply_mutation:
+            children = self._mutate(children)
+        parent_a, parent_b = ids[0:2 * m:2], ids[1:2 * m:2]
+        if timer is not None:
+            timer.lap("reproduce")
+
+        # keep stable size: one random founder if there were no children at all,
+        # then clones picked uniformly from the growing child list
+        need = self.population_size - m
+        if need > 0 and m == 0:
+            children = self._random_rows(1)
+            parent_a = parent_b = np.full(1, -1, dtype=np.int64)
+            m, need = 1, need - 1
+        if need > 0:
+            pick = np.floor(self.np_rng.random(need) * (m + np.arange(need))).astype(np.int64)
+            src = pick
+            while (src >= m).any():  # a clone of a clone resolves to the original child
+                src = np.where(src >= m, src[np.maximum(src - m, 0)], src)
+            children = np.vstack([children, children[src]])
+            parent_a = np.concatenate([parent_a, parent_a[src]])
+            parent_b = np.concatenate([parent_b, parent_b[src]])
+
+        children = children[: self.population_size]
+        self.genes = children
+        self.ids = self._add_individuals(children, parent_a[: len(children)], parent_b[: len(children)])
+        if timer is not None:
+            timer.lap("refill")
+
+    # ---------- metrics ----------
+    def population_stats(self, bins: int = 0) -> PopulationStats:
+        return PopulationStats.from_matrix(self.loci, self.genes, bins=bins)
+
+    def _avg_energy(self, stats: Optional[PopulationStats] = None) -> float:
+        if self._energy_col is None or not len(self.genes):
+            return 0.0
+        return (stats or self.population_stats()).locus(self._energy_col).average
+
+    def compute_metrics(self, generation: int) -> Dict[str, Any]:
+        stats = self.population_stats()
+        return {
+            "world": self.name,
+            "generation": generation,
+            "population": len(self.genes),
+            "genetic_diversity": round(self._genetic_diversity(stats), 6),
+            "avg_energy": round(self._avg_energy(stats), 3),
+        }
+
+    # ---------- I/O ----------
+    def dump_lineage(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data: Dict[int, Any] = {}
+        for ids, pa, pb in self._lineage_chunks:
+            for i, a, b in zip(ids.tolist(), pa.tolist(), pb.tolist()):
+                data[i] = None if a < 0 else [a, b]
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+WORLD_ENGINES = {"objects": World, "vector": VectorWorld}
+
+
 # -------------------------
 # Multiverse wrapper
 # -------------------------
+class MultiverseError(RuntimeError):
+    """One or more worlds failed; the others still ran to completion."""
+
+    def __init__(self, failures: Dict[str, BaseException], outputs: Dict[str, Path]):
+        self.failures = failures
+        self.outputs = outputs
+        detail = "; ".join(f"{name}: {exc!r}" for name, exc in failures.items())
+        super().__init__(f"{len(failures)} world(s) failed: {detail}")
+
+
+def _run_world(world_kwargs: Dict[str, Any], world_dir: Path) -> float:
+    """Build and run one world; returns its wall time in seconds (process-pool entry point)."""
+    world_kwargs = dict(world_kwargs)
+    engine = world_kwargs.pop("engine", "objects")
+    if engine not in WORLD_ENGINES:
+        raise ValueError(f"Unknown world engine: {engine!r}")
+    cls = WORLD_ENGINES[engine]
+    t0 = time.perf_counter()
+    cls(**world_kwargs).run(world_dir)
+    return time.perf_counter() - t0
+
+
 class Multiverse:
     """Runs multiple worlds (scenarios) from a shared base config and seed."""
 
@@ -217,6 +403,9 @@ class Multiverse:
         generations: int,
         mutation_rate: float,
         scenarios: List[Scenario],
+        metrics_sink: str = "csv",
+        workers: int = 1,                # >1 runs worlds in a process pool
+        timings: bool = False,           # per-stage timing columns in every world's metrics
     ):
         self.base_seed = base_seed
         self.loci = loci
@@ -224,21 +413,57 @@ class Multiverse:
         self.generations = generations
         self.mutation_rate = mutation_rate
         self.scenarios = scenarios
+        self.metrics_sink = metrics_sink
+        self.workers = max(1, int(workers))
+        self.timings = bool(timings)
+        self.wall_times: Dict[str, float] = {}   # world name -> seconds, filled by run_all
+
+    def world_kwargs(self, idx: int, sc: Scenario) -> Dict[str, Any]:
+        """World constructor arguments for scenario `idx` (the seed depends only on the index)."""
+        seed = (self.base_seed + (idx + 1) * 1009) & 0x7FFFFFFF
+        return dict(
+            name=sc.name,
+            loci=self.loci,
+            population_size=self.population_size,
+            generations=self.generations,
+            seed=seed,
+            mutation_rate=self.mutation_rate,
+            policy_name=sc.policy,
+            metrics_sink=self.metrics_sink,
+            engine=sc.engine,
+            timings=self.timings,
+        )
 
     def run_all(self, run_root: Path) -> Dict[str, Path]:
+        """
+        Run every scenario and return {world name: output dir}. Worlds that fail
+        do not stop the others; their errors are raised together as a
+        MultiverseError once the rest have finished.
+        """
+        jobs = [(sc.name, self.world_kwargs(idx, sc), run_root / sc.name)
+                for idx, sc in enumerate(self.scenarios)]
         outputs: Dict[str, Path] = {}
-        for idx, sc in enumerate(self.scenarios):
-            seed = (self.base_seed + (idx + 1) * 1009) & 0x7FFFFFFF
-            world = World(
-                name=sc.name,
-                loci=self.loci,
-                population_size=self.population_size,
-                generations=self.generations,
-                seed=seed,
-                mutation_rate=self.mutation_rate,
-                policy_name=sc.policy,
-            )
-            world_dir = run_root / sc.name
-            world.run(world_dir)
-            outputs[sc.name] = world_dir
+        failures: Dict[str, BaseException] = {}
+        self.wall_times = {}
+
+        if self.workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(jobs))) as pool:
+                futures = [(name, world_dir, pool.submit(_run_world, kwargs, world_dir))
+                           for name, kwargs, world_dir in jobs]
+                for name, world_dir, fut in futures:
+                    try:
+                        self.wall_times[name] = fut.result()
+                        outputs[name] = world_dir
+                    except Exception as exc:
+                        failures[name] = exc
+        else:
+            for name, kwargs, world_dir in jobs:
+                try:
+                    self.wall_times[name] = _run_world(kwargs, world_dir)
+                    outputs[name] = world_dir
+                except Exception as exc:
+                    failures[name] = exc
+
+        if failures:
+            raise MultiverseError(failures, outputs) from next(iter(failures.values()))
         return outputs
@@ -23,6 +23,13 @@ class PSAIPolicy:
             self.agents[indiv_id] = SentientAgent(str(indiv_id))
         return self.agents[indiv_id]
 
+    def partner_weights(self, candidates: List) -> List[float]:
+        """
+        Batched scoring hook for the matching engine: one competence weight per
+        candidate, taken once per pairing round instead of once per focal agent.
+        """
+        return [max(0.01, self.ensure_agent(cand.id).execute_task("pairing")) for cand in candidates]
+
     def choose_partner(self, indiv, candidates: List) -> Optional[object]:
         """
         Select a partner from candidate individuals.
@@ -1,11 +1,16 @@
 # lifeos/policy.py
 
 from typing import Literal
+import numpy as np
 from .traits import Traits
 
 # Define allowed actions
 Action = Literal["eat", "rest", "explore"]
 
+# Integer action codes used by the vectorized (batch) policy API
+ACTIONS = ("eat", "rest", "explore")
+EAT, REST, EXPLORE = range(3)
+
 class Policy:
     """A simple decision-making policy based on traits."""
 
@@ -17,3 +22,7 @@ class Policy:
             return "explore"
         else:
             return "rest"
+
+    def decide_batch(self, size: np.ndarray, energy: np.ndarray) -> np.ndarray:
+        """`decide` for a whole population: trait columns in, action codes (EAT/REST/EXPLORE) out."""
+        return np.where(energy < 30, EAT, np.where(size > 2.0, EXPLORE, REST))
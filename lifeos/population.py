@@ -0,0 +1,177 @@
+"""
+Population bookkeeping for the Adam & Eve engine: id -> slot index, couple
+registry and the optional struct-of-arrays (columnar) agent state.
+"""
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .lineage import Individual
+
+NO_ID = -1  # "None" marker for id columns
+
+
+class PopulationIndex:
+    """Maps agent ids to their slot in the engine's population list."""
+
+    def __init__(self, population: Optional[List[Individual]] = None):
+        self._population: List[Individual] = []
+        self._slot: Dict[int, int] = {}
+        self.rebuild(population if population is not None else [])
+
+    def rebuild(self, population: List[Individual]) -> None:
+        """Re-index after the population list was replaced or filtered."""
+        self._population = population
+        self._slot = {ind.id: i for i, ind in enumerate(population)}
+
+    def extend(self, individuals: Iterable[Individual]) -> None:
+        """Index individuals that were appended to the population list."""
+        for ind in individuals:
+            self._slot[ind.id] = len(self._slot)
+
+    def slot(self, agent_id: int) -> Optional[int]:
+        return self._slot.get(agent_id)
+
+    def get(self, agent_id: int) -> Optional[Individual]:
+        idx = self._slot.get(agent_id)
+        return self._population[idx] if idx is not None else None
+
+    def __contains__(self, agent_id: int) -> bool:
+        return agent_id in self._slot
+
+    def __len__(self) -> int:
+        return len(self._slot)
+
+
+class CoupleRegistry:
+    """
+    Couples keyed by id: members, children cap (None => unlimited) and births.
+    Ids come from a counter, so registering a couple never scans existing ones.
+    """
+
+    def __init__(self, first_id: int = 0):
+        self._next_id = int(first_id)
+        self.members: Dict[int, Tuple[int, int]] = {}
+        self.caps: Dict[int, Optional[int]] = {}
+        self.births: Dict[int, int] = {}
+
+    def register(self, a: int, b: int, cap: Optional[int]) -> int:
+        cid = self._next_id
+        self._next_id += 1
+        self.members[cid] = (a, b)
+        self.caps[cid] = cap
+        self.births[cid] = 0
+        return cid
+
+    def discard(self, couple_id: int) -> None:
+        """Forget a couple (both members dead and compacted away)."""
+        self.members.pop(couple_id, None)
+        self.caps.pop(couple_id, None)
+        self.births.pop(couple_id, None)
+
+    def record_birth(self, couple_id: int) -> None:
+        self.births[couple_id] = self.births.get(couple_id, 0) + 1
+
+    def total_children(self, couple_id: int) -> int:
+        """Children counted per parent and summed over both members (PersonState.children_count)."""
+        return 2 * self.births.get(couple_id, 0)
+
+    def at_cap(self, couple_id: int) -> bool:
+        cap = self.caps.get(couple_id)
+        return cap is not None and self.total_children(couple_id) >= cap
+
+    def __contains__(self, couple_id: int) -> bool:
+        return couple_id in self.members
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+
+class ColumnarPopulation:
+    """
+    Struct-of-arrays agent state, one dense slot per agent.
+
+    Slots are handed out in creation order and never reordered, so the live
+    slots in ascending order line up with the engine's population list (which
+    is only ever filtered or appended to). Dead agents keep their slot with
+    `alive` cleared until `compact()` drops them.
+    """
+
+    COLUMNS = {
+        "ids": (np.int64, NO_ID),
+        "phase": (np.int64, 0),
+        "partner_id": (np.int64, NO_ID),
+        "couple_id": (np.int64, NO_ID),
+        "children_count": (np.int64, 0),
+        "born": (np.int64, 0),
+        "energy": (np.float64, 50.0),
+        "alive": (np.bool_, False),
+    }
+
+    def __init__(self, capacity: int = 64):
+        self.size = 0
+        self.capacity = max(1, int(capacity))
+        self.spec: Dict[str, Tuple[type, object]] = dict(self.COLUMNS)
+        for name, (dtype, fill) in self.spec.items():
+            setattr(self, name, np.full(self.capacity, fill, dtype=dtype))
+        self.slot_of: Dict[int, int] = {}
+
+    def add_column(self, name: str, dtype, fill) -> np.ndarray:
+        """Register an extra per-agent column (grown alongside the built-in ones)."""
+        if name not in self.spec:
+            self.spec[name] = (dtype, fill)
+            setattr(self, name, np.full(self.capacity, fill, dtype=dtype))
+        return getattr(self, name)
+
+    def _grow(self, need: int) -> None:
+        cap = self.capacity
+        while cap < need:
+            cap *= 2
+        for name, (dtype, fill) in self.spec.items():
+            old = getattr(self, name)
+            new = np.full(cap, fill, dtype=dtype)
+            new[: self.size] = old[: self.size]
+            setattr(self, name, new)
+        self.capacity = cap
+
+    def add(self, agent_id: int) -> int:
+        """Allocate a live slot for a new agent and return it."""
+        if self.size >= self.capacity:
+            self._grow(self.size + 1)
+        slot = self.size
+        self.size += 1
+        self.ids[slot] = agent_id
+        self.alive[slot] = True
+        self.slot_of[agent_id] = slot
+        return slot
+
+    def live_slots(self) -> np.ndarray:
+        """Slots of living agents, in population order."""
+        return np.flatnonzero(self.alive[: self.size])
+
+    def kill(self, agent_ids: Iterable[int]) -> None:
+        slots = [self.slot_of[i] for i in agent_ids]
+        self.alive[slots] = False
+
+    def compact(self) -> np.ndarray:
+        """
+        Drop dead slots, keeping live agents in creation order. Returns the old
+        slot of each surviving agent (new slot i held old slot `kept[i]`).
+        """
+        kept = self.live_slots()
+        n = len(kept)
+        cap = self.capacity
+        while cap > 64 and 4 * n <= cap:  # give memory back after die-offs
+            cap //= 2
+        for name, (dtype, fill) in self.spec.items():
+            new = np.full(cap, fill, dtype=dtype)
+            new[:n] = getattr(self, name)[kept]
+            setattr(self, name, new)
+        self.capacity = cap
+        self.size = n
+        self.slot_of = {agent_id: i for i, agent_id in enumerate(self.ids[:n].tolist())}
+        return kept
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.alive[: self.size]))
@@ -1,11 +1,228 @@
 """
-Prime-based encoding/decoding stubs.
+Prime-index genome encoding.
+
+Every locus value is quantized to a level q in [0, 2**bits): bounded floats
+to `float_bits` evenly spaced levels over [min, max], ints exactly as
+value - min, enums as their index. Level q stands for the q-th prime
+(2, 3, 5, 7, ...): `to_primes` / `from_primes` convert between level and
+prime symbols. Only the prime index q is stored: the fields of one genome
+are bit-packed into a few uint64 words (a field never straddles two words),
+so a genome of L loci costs about L * bits / 8 bytes instead of 8 * L.
+
+`PrimeCodec` works on whole populations at once: it encodes an (n, loci)
+code matrix (as in packed genomes and VectorWorld) into an (n, words) uint64
+array and decodes it back, and reads/writes a self-describing byte format
+(`to_bytes` / `from_bytes`, `save` / `load`) for disk and wire. Floats come
+back as the centre of their level (error at most half a level); ints and
+enums come back exactly.
 """
-from typing import List, Any
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+import json
+import math
+import struct
+
+import numpy as np
+
+from .genome import Genome, Locus, codes_matrix, genomes_from_matrix
+
+MAGIC = b"LOSP"
+VERSION = 1
+_HEADER = struct.Struct("<4sHII")  # magic, version, genomes, loci-json length
+DEFAULT_FLOAT_BITS = 10
+_LEGACY_BITS = 10  # encode()/decode() of plain [0, 1] floats
+
+
+# -------------------------
+# Primes
+# -------------------------
+_primes = np.array([2, 3, 5, 7, 11, 13], dtype=np.int64)
+
+
+def primes(count: int) -> np.ndarray:
+    """The first `count` primes (sieve, cached and grown on demand)."""
+    global _primes
+    if count > len(_primes):
+        # p_n < n (ln n + ln ln n) for n >= 6
+        limit = max(15, int(count * (math.log(count) + math.log(math.log(count)))) + 1)
+        sieve = np.ones(limit + 1, dtype=bool)
+        sieve[:2] = False
+        for p in range(2, int(limit ** 0.5) + 1):
+            if sieve[p]:
+                sieve[p * p::p] = False
+        _primes = np.flatnonzero(sieve).astype(np.int64)
+    return _primes[:count]
+
+
+def to_primes(levels: np.ndarray) -> np.ndarray:
+    """Prime symbol of each quantization level (level q -> q-th prime, 0-based)."""
+    levels = np.asarray(levels, dtype=np.int64)
+    return primes(int(levels.max()) + 1 if levels.size else 0)[levels]
+
+
+def from_primes(symbols: np.ndarray) -> np.ndarray:
+    """Quantization level of each prime symbol; raises ValueError for non-primes."""
+    symbols = np.asarray(symbols, dtype=np.int64)
+    if not symbols.size:
+        return symbols
+    table = primes(2)
+    while table[-1] < symbols.max():
+        table = primes(2 * len(table))
+    levels = np.searchsorted(table, symbols)
+    if (levels >= len(table)).any() or (table[np.minimum(levels, len(table) - 1)] != symbols).any():
+        raise ValueError("Not a prime symbol")
+    return levels
+
 
 def encode(values: List[Any]) -> List[int]:
-    # Placeholder: map floats in [0,1] to prime indices; expand later.
-    return [2 for _ in values]
+    """Prime symbols of floats in [0, 1] (1024 levels)."""
+    top = (1 << _LEGACY_BITS) - 1
+    q = np.rint(np.clip(np.asarray(values, dtype=np.float64), 0.0, 1.0) * top).astype(np.int64)
+    return to_primes(q).tolist()
+
+
+def decode(primes_: List[int]) -> List[float]:
+    """Inverse of `encode` (to within half a level)."""
+    return (from_primes(primes_) / ((1 << _LEGACY_BITS) - 1)).tolist()
+
+
+# -------------------------
+# Population codec
+# -------------------------
+class PrimeCodec:
+    """Bit-packed prime-index encoding of genome code matrices over one loci list."""
+
+    def __init__(self, loci: Sequence[Locus], float_bits: int = DEFAULT_FLOAT_BITS):
+        if not 1 <= int(float_bits) <= 52:
+            raise ValueError("float_bits must be in [1, 52]")
+        self.loci = list(loci)
+        self.float_bits = int(float_bits)
+        self.bits: List[int] = []
+        self.lo: List[float] = []
+        self.step: List[float] = []  # value per level (floats); 1 for ints and enums
+        for loc in self.loci:
+            if loc.type == "float":
+                bits = self.float_bits if loc.max > loc.min else 0
+                self.lo.append(float(loc.min))
+                self.step.append((loc.max - loc.min) / ((1 << bits) - 1) if bits else 0.0)
+            elif loc.type == "int":
+                bits = (int(loc.max) - int(loc.min)).bit_length()
+                self.lo.append(float(int(loc.min)))
+                self.step.append(1.0)
+            elif loc.type == "enum" and loc.enum:
+                bits = (len(loc.enum) - 1).bit_length()
+                self.lo.append(0.0)
+                self.step.append(1.0)
+            else:
+                raise ValueError(f"Unsupported locus type: {loc.type}")
+            if bits > 63:
+                raise ValueError(f"Locus {loc.name!r} needs {bits} bits (max 63)")
+            self.bits.append(bits)
+
+        # place fields into uint64 words, first fit in order; no field straddles a word
+        self.word: List[int] = []
+        self.offset: List[int] = []
+        used = 0
+        words = 0
+        for bits in self.bits:
+            if words == 0 or used + bits > 64:
+                words += 1
+                used = 0
+            self.word.append(words - 1)
+            self.offset.append(used)
+            used += bits
+        self.words = max(words, 1)
+        self._is_float = np.array([loc.type == "float" for loc in self.loci])
+
+    @property
+    def bytes_per_genome(self) -> int:
+        return 8 * self.words
+
+    # ---------- levels ----------
+    def quantize(self, codes: np.ndarray) -> np.ndarray:
+        """(n, loci) code matrix -> (n, loci) int64 levels (floats clipped to their bounds)."""
+        codes = np.asarray(codes, dtype=np.float64)
+        levels = np.empty(codes.shape, dtype=np.int64)
+        for j, (lo, step, bits) in enumerate(zip(self.lo, self.step, self.bits)):
+            top = (1 << bits) - 1
+            col = codes[:, j]
+            if self._is_float[j]:
+                levels[:, j] = np.rint((col - lo) / step).clip(0, top) if step else 0
+            else:
+                levels[:, j] = (col - lo).astype(np.int64).clip(0, top)
+        return levels
+
+    def dequantize(self, levels: np.ndarray) -> np.ndarray:
+        lo = np.asarray(self.lo)
+        step = np.asarray(self.step)
+        return lo + np.asarray(levels, dtype=np.float64) * step
+
+    def to_primes(self, codes: np.ndarray) -> np.ndarray:
+        """(n, loci) prime symbols of a code matrix."""
+        return to_primes(self.quantize(codes))
+
+    # ---------- bit packing ----------
+    def encode(self, codes: np.ndarray) -> np.ndarray:
+        """(n, loci) code matrix -> (n, words) uint64 packed prime indices."""
+        levels = self.quantize(codes).astype(np.uint64)
+        out = np.zeros((len(levels), self.words), dtype=np.uint64)
+        for j, (w, off) in enumerate(zip(self.word, self.offset)):
+            if self.bits[j]:
+                out[:, w] |= levels[:, j] << np.uint64(off)
+        return out
+
+    def decode_levels(self, packed: np.ndarray) -> np.ndarray:
+        packed = np.asarray(packed, dtype=np.uint64).reshape(-1, self.words)
+        levels = np.zeros((len(packed), len(self.loci)), dtype=np.int64)
+        for j, (w, off, bits) in enumerate(zip(self.word, self.offset, self.bits)):
+            if bits:
+                mask = np.uint64((1 << bits) - 1)
+                levels[:, j] = ((packed[:, w] >> np.uint64(off)) & mask).astype(np.int64)
+        return levels
+
+    def decode(self, packed: np.ndarray) -> np.ndarray:
+        """(n, words) packed array -> (n, loci) float64 code matrix."""
+        return self.dequantize(self.decode_levels(packed))
+
+    def encode_genomes(self, genomes: Sequence[Genome]) -> np.ndarray:
+        return self.encode(codes_matrix(genomes))
+
+    def decode_genomes(self, packed: np.ndarray) -> List[Genome]:
+        """Packed Genome objects over this codec's loci (floats at their level centres)."""
+        return genomes_from_matrix(self.loci, self.decode(packed))
+
+    # ---------- byte format ----------
+    def _schema_json(self) -> bytes:
+        return json.dumps({
+            "float_bits": self.float_bits,
+            "loci": [{"name": l.name, "type": l.type, "min": l.min, "max": l.max, "enum": l.enum}
+                     for l in self.loci],
+        }, separators=(",", ":")).encode("utf-8")
+
+    def to_bytes(self, codes: np.ndarray) -> bytes:
+        """Self-describing blob: header, loci schema (JSON), little-endian uint64 words."""
+        packed = self.encode(codes)
+        meta = self._schema_json()
+        return _HEADER.pack(MAGIC, VERSION, len(packed), len(meta)) + meta + packed.astype("<u8").tobytes()
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> Tuple["PrimeCodec", np.ndarray]:
+        """(codec, (n, loci) code matrix) from a `to_bytes` blob."""
+        magic, version, n, meta_len = _HEADER.unpack_from(blob)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a prime-map genome blob")
+        start = _HEADER.size
+        meta: Dict[str, Any] = json.loads(blob[start:start + meta_len].decode("utf-8"))
+        codec = cls([Locus(**l) for l in meta["loci"]], float_bits=meta["float_bits"])
+        words = np.frombuffer(blob, dtype="<u8", count=n * codec.words, offset=start + meta_len)
+        return codec, codec.decode(words.reshape(n, codec.words))
+
+    def save(self, path: Path, codes: np.ndarray) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.to_bytes(codes))
 
-def decode(primes: List[int]) -> List[float]:
-    return [0.5 for _ in primes]
+    @classmethod
+    def load(cls, path: Path) -> Tuple["PrimeCodec", np.ndarray]:
+        return cls.from_bytes(Path(path).read_bytes())
@@ -1,17 +1,48 @@
 """
 Reproduction engine: crossover model for digital beings.
+
+`mate` makes one child from two genomes. `mate_batch` makes a whole cohort
+from a genome matrix (one row per individual, one float64 code per locus, as in
+packed genomes and VectorWorld) and two parent index arrays, drawing one
+inheritance bitmask for all children at once; `mate_cohort` does the same for
+lists of Genome objects.
+
+Crossover modes:
+  - "uniform": each locus comes from parent a with probability `crossover_rate`,
+  - "k_point": `points` cut points per child, parents alternate between cuts,
+  - "linkage": a cut between loci j and j+1 with probability `linkage[j]`
+    (a linkage map of recombination fractions, one per adjacent pair).
+In the last two modes each child starts from either parent with equal probability.
 """
 
 import random
-from typing import Optional
-from .genome import Genome
+from array import array
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .genome import Genome, _fallback_rng, codes_matrix, genomes_from_matrix
+
+CROSSOVER_MODES = ("uniform", "k_point", "linkage")
 
 
 class ReproductionModel:
     """Handles reproduction between two genomes."""
 
-    def __init__(self, crossover_rate: float = 0.5):
+    def __init__(self, crossover_rate: float = 0.5, mode: str = "uniform", points: int = 1,
+                 linkage: Optional[Sequence[float]] = None):
+        if mode not in CROSSOVER_MODES:
+            raise ValueError(f"Unknown crossover mode: {mode!r}")
+        if mode == "linkage" and linkage is None:
+            raise ValueError('mode="linkage" needs a linkage map')
         self.crossover_rate = crossover_rate
+        self.mode = mode
+        self.points = int(points)
+        self.linkage = None if linkage is None else np.asarray(linkage, dtype=np.float64)
+
+    def _check_linkage(self, n_loci: int) -> None:
+        if self.linkage is not None and len(self.linkage) != n_loci - 1:
+            raise ValueError(f"Linkage map needs {n_loci - 1} recombination fractions, got {len(self.linkage)}")
 
     def mate(self, parent1: Genome, parent2: Genome, rng: Optional[random.Random] = None) -> Genome:
         """
@@ -19,10 +50,20 @@ class ReproductionModel:
         - Each gene is inherited from one parent at random.
         """
         if rng is None:
-            rng = random.Random()
+            rng = _fallback_rng
 
         if len(parent1.loci) != len(parent2.loci):
             raise ValueError("Parents must have the same loci structure for reproduction")
+        if self.mode != "uniform":
+            return self._mate_segments(parent1, parent2, rng)
+
+        rate = self.crossover_rate
+        d1, d2 = parent1._data, parent2._data
+        if isinstance(d1, array) and isinstance(d2, array):
+            # packed parents: pick codes, the child stays packed
+            rand = rng.random
+            codes = array("d", [c1 if rand() < rate else c2 for c1, c2 in zip(d1, d2)])
+            return Genome.from_codes(parent1.loci, codes)
 
         child_values = []
         for v1, v2 in zip(parent1.values, parent2.values):
@@ -31,6 +72,74 @@ class ReproductionModel:
 
         return Genome(loci=parent1.loci, values=child_values)
 
+    def _mate_segments(self, parent1: Genome, parent2: Genome, rng: random.Random) -> Genome:
+        """k-point / linkage crossover of one child with a Python rng."""
+        n = len(parent1.loci)
+        self._check_linkage(n)
+        if self.mode == "k_point":
+            cuts = set(rng.sample(range(1, n), min(max(self.points, 0), n - 1))) if n > 1 else set()
+        else:
+            cuts = {j + 1 for j, r in enumerate(self.linkage.tolist()) if rng.random() < r}
+        from_first = rng.random() < 0.5
+        d1, d2 = parent1._data, parent2._data
+        packed = isinstance(d1, array) and isinstance(d2, array)
+        v1, v2 = (d1, d2) if packed else (list(parent1.values), list(parent2.values))
+        child = []
+        for i in range(n):
+            if i in cuts:
+                from_first = not from_first
+            child.append(v1[i] if from_first else v2[i])
+        if packed:
+            return Genome.from_codes(parent1.loci, array("d", child))
+        return Genome(loci=parent1.loci, values=child)
+
+    # ---------- batch crossover ----------
+    def inheritance_mask(self, n: int, n_loci: int, rng: np.random.Generator) -> np.ndarray:
+        """(n, n_loci) bool mask: True where a child inherits from parent a."""
+        if self.mode == "uniform":
+            return rng.random((n, n_loci)) < self.crossover_rate
+        self._check_linkage(n_loci)
+        if self.mode == "k_point":
+            k = min(max(self.points, 0), n_loci - 1)
+            cuts = np.zeros((n, max(n_loci - 1, 0)), dtype=bool)
+            if k:
+                # k distinct cut positions per child: the k smallest of n_loci - 1 random keys
+                pos = np.argpartition(rng.random((n, n_loci - 1)), k - 1, axis=1)[:, :k]
+                np.put_along_axis(cuts, pos, True, axis=1)
+        else:
+            cuts = rng.random((n, n_loci - 1)) < self.linkage
+        start_a = rng.random(n) < 0.5
+        switched = np.zeros((n, n_loci), dtype=bool)
+        if n_loci > 1:
+            switched[:, 1:] = (np.cumsum(cuts, axis=1) & 1).astype(bool)
+        return switched ^ start_a[:, None]
+
+    def mate_batch(self, genes: np.ndarray, parent_a: np.ndarray, parent_b: np.ndarray,
+                   rng: np.random.Generator) -> np.ndarray:
+        """
+        Children of rows `parent_a[i]` x `parent_b[i]` of the genome matrix
+        `genes`, as a new (len(parent_a), n_loci) matrix.
+        """
+        a, b = genes[parent_a], genes[parent_b]
+        if len(a) == 0:
+            return a
+        return np.where(self.inheritance_mask(len(a), genes.shape[1], rng), a, b)
+
+    def mate_cohort(self, parents_a: Sequence[Genome], parents_b: Sequence[Genome],
+                    rng: np.random.Generator) -> List[Genome]:
+        """One packed child per aligned (parents_a[i], parents_b[i]) pair, in one batch."""
+        n = len(parents_a)
+        if n != len(parents_b):
+            raise ValueError("parents_a and parents_b must have the same length")
+        if n == 0:
+            return []
+        loci = parents_a[0].loci
+        if any(len(g.loci) != len(loci) for g in parents_a) or any(len(g.loci) != len(loci) for g in parents_b):
+            raise ValueError("Parents must have the same loci structure for reproduction")
+        genes = codes_matrix(list(parents_a) + list(parents_b))
+        idx = np.arange(n)
+        return genomes_from_matrix(loci, self.mate_batch(genes, idx, idx + n, rng))
+
 
 # Functional API (legacy support for tests)
 def reproduce(parent1: Genome, parent2: Genome, rng: Optional[random.Random] = None) -> Genome:
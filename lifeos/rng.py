@@ -0,0 +1,196 @@
+"""
+Counter-based random streams (Philox4x32-10).
+
+A stream is identified by (run seed, purpose, agent id, generation): the run
+seed is the Philox key and the rest, plus a draw counter, is the Philox
+counter. Any stream can therefore be re-created from its coordinates alone,
+draws do not depend on the order in which agents are processed, and a stream
+costs a handful of integers instead of a Mersenne Twister state.
+"""
+from __future__ import annotations
+from bisect import bisect
+from itertools import accumulate
+from typing import Any, List, MutableSequence, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Stream purposes (part of the counter, so streams of different purposes never overlap)
+FOUNDERS = 1
+REPRODUCTION = 2
+MIND = 3
+ENVIRONMENT = 4
+PAIRING = 5
+CAPS = 6
+
+_M0, _M1 = 0xD2511F53, 0xCD9E8D57
+_W0, _W1 = 0x9E3779B9, 0xBB67AE85
+_MASK32 = 0xFFFFFFFF
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_ROUNDS = 10
+
+
+def key_schedule(key: Sequence[int]) -> Tuple[Tuple[int, int], ...]:
+    """Per-round Philox keys, computed once per run key."""
+    k0, k1 = key
+    rounds = []
+    for _ in range(_ROUNDS):
+        rounds.append((k0, k1))
+        k0 = (k0 + _W0) & _MASK32
+        k1 = (k1 + _W1) & _MASK32
+    return tuple(rounds)
+
+
+def _philox_block(counter: Sequence[int], schedule: Sequence[Tuple[int, int]]) -> List[int]:
+    c0, c1, c2, c3 = counter
+    for k0, k1 in schedule:
+        p0 = _M0 * c0
+        p1 = _M1 * c2
+        c0, c1, c2, c3 = ((p1 >> 32) ^ c1 ^ k0, p1 & _MASK32, (p0 >> 32) ^ c3 ^ k1, p0 & _MASK32)
+    return [c0, c1, c2, c3]
+
+
+def philox4x32(counter: Sequence[int], key: Sequence[int]) -> List[int]:
+    """One Philox4x32-10 block: four 32-bit words from a 4-word counter and 2-word key."""
+    return _philox_block(counter, key_schedule(key))
+
+
+def philox4x32_array(counter: Sequence[np.ndarray], key: Sequence[int]) -> List[np.ndarray]:
+    """Vectorized philox4x32 over arrays of counters (each word a uint64 array of 32-bit values)."""
+    c0, c1, c2, c3 = (np.asarray(c, dtype=np.uint64) & np.uint64(_MASK32) for c in counter)
+    k0, k1 = int(key[0]), int(key[1])
+    m0, m1, mask, shift = np.uint64(_M0), np.uint64(_M1), np.uint64(_MASK32), np.uint64(32)
+    for _ in range(_ROUNDS):
+        p0 = m0 * c0
+        p1 = m1 * c2
+        c0, c1, c2, c3 = ((p1 >> shift) ^ c1 ^ np.uint64(k0), p1 & mask, (p0 >> shift) ^ c3 ^ np.uint64(k1), p0 & mask)
+        k0 = (k0 + _W0) & _MASK32
+        k1 = (k1 + _W1) & _MASK32
+    return [c0, c1, c2, c3]
+
+
+def _seed_key(seed: int) -> List[int]:
+    """Spread an arbitrary integer seed over the 64-bit Philox key (splitmix64 finaliser)."""
+    z = (int(seed) * 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    z ^= z >> 31
+    return [z & _MASK32, z >> 32]
+
+
+class CounterStream:
+    """
+    One reproducible stream with the subset of the `random.Random` API the
+    engines use (random, getrandbits, randrange, randint, uniform, choice,
+    choices, shuffle). State is the run key schedule (shared), the stream
+    coordinates and a draw counter.
+    """
+
+    __slots__ = ("_schedule", "_c1", "_c2", "_c3", "_n", "_buf")
+
+    def __init__(self, schedule: Sequence[Tuple[int, int]], purpose: int, agent_id: int = 0, generation: int = 0):
+        self._schedule = schedule  # shared key_schedule() of the run key
+        self._c1 = int(purpose) & 0xFFFF
+        self._c2 = int(generation) & _MASK32
+        self._c3 = int(agent_id) & _MASK32
+        self._n = 0          # blocks consumed
+        self._buf: List[int] = []
+
+    def _word(self) -> int:
+        if not self._buf:
+            # draw counter uses the low word plus the top half of c1
+            n = self._n
+            self._n += 1
+            block = _philox_block((n & _MASK32, self._c1 | ((n >> 32) & 0xFFFF) << 16, self._c2, self._c3),
+                                  self._schedule)
+            block.reverse()
+            self._buf = block
+        return self._buf.pop()
+
+    def random(self) -> float:
+        """Float in [0, 1) with 53 random bits (same construction as CPython's Mersenne Twister)."""
+        a = self._word() >> 5
+        b = self._word() >> 6
+        return (a * 67108864.0 + b) * (1.0 / 9007199254740992.0)
+
+    def getrandbits(self, k: int) -> int:
+        if k <= 0:
+            return 0
+        bits, shift = 0, 0
+        while shift < k:
+            bits |= self._word() << shift
+            shift += 32
+        return bits >> (shift - k)
+
+    def _randbelow(self, n: int) -> int:
+        k = n.bit_length()
+        r = self.getrandbits(k)
+        while r >= n:
+            r = self.getrandbits(k)
+        return r
+
+    def randrange(self, start: int, stop: Optional[int] = None) -> int:
+        if stop is None:
+            start, stop = 0, start
+        width = stop - start
+        if width <= 0:
+            raise ValueError("empty range for randrange()")
+        return start + self._randbelow(width)
+
+    def randint(self, a: int, b: int) -> int:
+        return self.randrange(a, b + 1)
+
+    def uniform(self, a: float, b: float) -> float:
+        return a + (b - a) * self.random()
+
+    def choice(self, seq: Sequence[Any]) -> Any:
+        if not seq:
+            raise IndexError("cannot choose from an empty sequence")
+        return seq[self._randbelow(len(seq))]
+
+    def choices(self, population: Sequence[Any], weights=None, *, cum_weights=None, k: int = 1) -> List[Any]:
+        n = len(population)
+        if cum_weights is None:
+            if weights is None:
+                return [population[self._randbelow(n)] for _ in range(k)]
+            cum_weights = list(accumulate(weights))
+        total = cum_weights[-1] + 0.0
+        hi = n - 1
+        return [population[bisect(cum_weights, self.random() * total, 0, hi)] for _ in range(k)]
+
+    def shuffle(self, x: MutableSequence[Any]) -> None:
+        for i in reversed(range(1, len(x))):
+            j = self._randbelow(i + 1)
+            x[i], x[j] = x[j], x[i]
+
+
+class CounterRNG:
+    """Factory for the counter-based streams of one run."""
+
+    def __init__(self, seed: int):
+        self.seed = int(seed)
+        self.key = _seed_key(self.seed)
+        self.schedule = key_schedule(self.key)
+
+    def stream(self, purpose: int, agent_id: int = 0, generation: int = 0) -> CounterStream:
+        return CounterStream(self.schedule, purpose, agent_id, generation)
+
+    def uniforms(self, purpose: int, generation: int, agent_ids: Sequence[int], draw: int = 0) -> np.ndarray:
+        """
+        The `draw`-th uniform in [0, 1) of each agent's (purpose, generation)
+        stream, for many agents at once. Matches `stream(...).random()` for draw 0.
+        """
+        ids = np.asarray(agent_ids, dtype=np.uint64)
+        n = np.full(ids.shape, draw // 2, dtype=np.uint64)
+        c1 = np.full(ids.shape, int(purpose) & 0xFFFF, dtype=np.uint64)
+        c2 = np.full(ids.shape, int(generation) & _MASK32, dtype=np.uint64)
+        w0, w1, w2, w3 = philox4x32_array((n, c1, c2, ids), self.key)
+        hi, lo = (w0, w1) if draw % 2 == 0 else (w2, w3)
+        a = (hi >> np.uint64(5)).astype(np.float64)
+        b = (lo >> np.uint64(6)).astype(np.float64)
+        return (a * 67108864.0 + b) * (1.0 / 9007199254740992.0)
+
+    def numpy_generator(self, purpose: int, agent_id: int = 0, generation: int = 0) -> np.random.Generator:
+        """NumPy generator (Philox4x64 bit generator) keyed by the same stream coordinates."""
+        key = (self.key[1] << 32) | self.key[0]
+        counter = [0, int(purpose), int(generation), int(agent_id)]
+        return np.random.Generator(np.random.Philox(key=[key, 0], counter=counter))
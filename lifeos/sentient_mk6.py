@@ -1,8 +1,11 @@
 # lifeos/sentient_mk6.py
 from __future__ import annotations
 import random
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
 
+import numpy as np
+
 
 class MindConfig:
     """
@@ -29,11 +32,13 @@ class SentientMind:
     - Adds mk7 layered states: curiosity, competence, stress, social_bond, dreams, memory_trace
     """
 
-    def __init__(self, agent_id: int = 0, cfg: Optional[MindConfig] = None):
+    def __init__(self, agent_id: int = 0, cfg: Optional[MindConfig] = None, rng=None):
         self.id = int(agent_id)
         self.cfg = cfg or MindConfig()
-        seed = self.cfg.rng_seed if self.cfg.rng_seed is not None else (self.id * 7919)
-        self.rng = random.Random(seed)
+        if rng is None:
+            seed = self.cfg.rng_seed if self.cfg.rng_seed is not None else (self.id * 7919)
+            rng = random.Random(seed)
+        self.rng = rng  # random.Random or a lightweight CounterStream
 
         # Core states
         self.energy: float = 50.0
@@ -154,3 +159,68 @@ class SentientMind:
 
     def dump_log(self) -> List[Dict[str, Any]]:
         return list(self._log)
+
+
+# --------- batched decisions ----------
+@dataclass
+class MindDecisions:
+    """Per-agent decisions of one MindBatch pass (arrays aligned with the input energies)."""
+    farm_effort: np.ndarray  # float64, 0.0 where the agent does not farm
+    sleep: np.ndarray        # bool
+    share: np.ndarray        # bool
+    dream: np.ndarray        # bool
+
+
+class MindBatch:
+    """
+    Array counterpart of SentientMind.environment_action for a whole population.
+
+    Applies the same rules as the per-agent mind (farm effort from hunger and
+    food shortage plus noise, sleep/share/dream chances) but draws all noise from
+    one NumPy generator, so results follow the same distribution without
+    matching per-agent streams.
+    """
+
+    def __init__(self, cfg: Optional[MindConfig] = None, seed: Optional[int] = None):
+        self.cfg = cfg or MindConfig()
+        self.rng = np.random.default_rng(seed)
+
+    def decide(
+        self,
+        gen: int,
+        energy: np.ndarray,
+        env_snapshot: Dict[str, Any],
+        curiosity: Optional[np.ndarray] = None,
+    ) -> MindDecisions:
+        """
+        Decide actions for every agent. `curiosity`, if given, is raised in place
+        for agents that dream (as SentientMind does).
+        """
+        cfg = self.cfg
+        energy = np.asarray(energy, dtype=np.float64)
+        n = len(energy)
+        pop = max(1, int(env_snapshot.get("population", 1)))
+        food = int(env_snapshot.get("food", 0))
+
+        # Farming decision
+        per_cap = food / float(pop)
+        food_low = per_cap < cfg.low_food_threshold_per_capita
+        farming = (energy < cfg.hunger_energy_threshold) | food_low
+        hunger_scale = np.clip((cfg.hunger_energy_threshold - energy) / cfg.hunger_energy_threshold, 0.0, 1.0)
+        shortage_scale = 0.0
+        if food_low:
+            shortage_scale = max(0.0, min(1.0, (cfg.low_food_threshold_per_capita - per_cap)
+                                          / max(1e-9, cfg.low_food_threshold_per_capita)))
+        effort = 0.5 + 0.3 * hunger_scale + 0.3 * shortage_scale + self.rng.uniform(-0.1, 0.1, n)
+        effort = np.round(np.clip(effort, 0.0, cfg.max_farm_effort_per_tick), 3)
+        effort[~farming] = 0.0
+
+        # Sleep / share / dream
+        u = self.rng.random((3, n))
+        sleep = u[0] < 0.1
+        share = (energy > 70) & (u[1] < 0.2)
+        dream = u[2] < 0.05
+        if curiosity is not None:
+            curiosity[dream] = np.minimum(1.0, curiosity[dream] + 0.05)
+
+        return MindDecisions(farm_effort=effort, sleep=sleep, share=share, dream=dream)
@@ -0,0 +1,199 @@
+"""
+Single-pass population statistics.
+
+`RunningStats` is a Welford accumulator (count, mean, variance, min, max and a
+plain running total) that takes values one at a time or whole NumPy arrays.
+`PopulationStats` keeps one accumulator plus a fixed-bin histogram per locus
+and fills them in one pass over a list of genomes, or with NumPy reductions
+over a genome matrix (one column per locus, enums as integer codes).
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+import math
+
+import numpy as np
+
+from .genome import Locus
+
+Z_95 = 1.959963984540054  # two-sided 95% normal quantile
+
+
+class RunningStats:
+    """Welford mean / variance plus min, max and the plain running total."""
+
+    __slots__ = ("n", "mean", "_m2", "total", "min", "max")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.total = 0          # stays an int while only ints are added
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x) -> None:
+        self.n += 1
+        self.total += x
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    def add_array(self, values: np.ndarray) -> None:
+        """Fold in a whole array with NumPy reductions (Chan et al. parallel update)."""
+        values = np.asarray(values, dtype=np.float64)
+        n_b = len(values)
+        if n_b == 0:
+            return
+        mean_b = float(values.mean())
+        m2_b = float(((values - mean_b) ** 2).sum())
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self._m2 += m2_b + delta * delta * self.n * n_b / n
+        self.n = n
+        self.total += float(values.sum())  # pairwise; exact for integer-valued columns such as energy
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    @property
+    def average(self) -> float:
+        """total / n (exact for integer values, however they were added)."""
+        return self.total / self.n if self.n else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (n - 1 denominator)."""
+        return self._m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def band(self, z: float = Z_95) -> Tuple[float, float]:
+        """Normal-approximation confidence interval of the mean."""
+        half = z * self.std / math.sqrt(self.n) if self.n else 0.0
+        return self.mean - half, self.mean + half
+
+
+class Histogram:
+    """Fixed-width bins over [lo, hi]; values outside fall into the edge bins."""
+
+    __slots__ = ("lo", "hi", "counts", "_scale")
+
+    def __init__(self, lo: float, hi: float, bins: int):
+        self.lo, self.hi = float(lo), float(hi)
+        self.counts = [0] * max(1, int(bins))
+        self._scale = len(self.counts) / (self.hi - self.lo) if self.hi > self.lo else 0.0
+
+    def add(self, x) -> None:
+        i = int((x - self.lo) * self._scale)
+        self.counts[min(max(i, 0), len(self.counts) - 1)] += 1
+
+    def add_array(self, values: np.ndarray) -> None:
+        idx = ((np.asarray(values, dtype=np.float64) - self.lo) * self._scale).astype(np.int64)
+        np.clip(idx, 0, len(self.counts) - 1, out=idx)
+        for i, c in enumerate(np.bincount(idx, minlength=len(self.counts)).tolist()):
+            self.counts[i] += c
+
+
+class PopulationStats:
+    """
+    Per-locus statistics of a population: RunningStats and a histogram for
+    float/int loci, category counts for enum loci. Int loci only count int
+    values (a locus may hold other types after hand edits, as World tolerates).
+    `bins=0` skips histograms and category counts (moments only).
+    """
+
+    def __init__(self, loci: Sequence[Locus], bins: int = 10):
+        self.loci = list(loci)
+        self.stats: Dict[int, RunningStats] = {}
+        self.hists: Dict[int, Histogram] = {}
+        for i, loc in enumerate(self.loci):
+            if loc.type in ("float", "int"):
+                self.stats[i] = RunningStats()
+                if bins:
+                    self.hists[i] = Histogram(loc.min, loc.max, bins)
+            elif loc.type == "enum" and loc.enum and bins:
+                self.hists[i] = Histogram(0, len(loc.enum), len(loc.enum))
+        self._float = [i for i, loc in enumerate(self.loci) if loc.type == "float"]
+        self._int = [i for i, loc in enumerate(self.loci) if loc.type == "int"]
+        self._enum = {i: {v: k for k, v in enumerate(loc.enum)}
+                      for i, loc in enumerate(self.loci) if i in self.hists and loc.type == "enum"}
+
+    @classmethod
+    def from_genomes(cls, loci: Sequence[Locus], genomes: Iterable, bins: int = 10) -> "PopulationStats":
+        """One pass over genome objects (anything with `.values`)."""
+        ps = cls(loci, bins)
+        floats = [(i, ps.stats[i].add, ps.hists[i].add if bins else None) for i in ps._float]
+        ints = [(i, ps.stats[i].add, ps.hists[i].add if bins else None) for i in ps._int]
+        hists = ps.hists
+        enum_items = list(ps._enum.items())
+        for g in genomes:
+            codes = getattr(g, "code_array", None)
+            if codes is not None:
+                # packed genome: floats are stored as-is, ints exactly, enums as their code
+                for i, add, hist in floats:
+                    x = codes[i]
+                    add(x)
+                    if hist:
+                        hist(x)
+                for i, add, hist in ints:
+                    x = int(codes[i])
+                    add(x)
+                    if hist:
+                        hist(x)
+                for i, _ in enum_items:
+                    hists[i].counts[int(codes[i])] += 1
+                continue
+            values = g.values
+            for i, add, hist in floats:
+                x = float(values[i])
+                add(x)
+                if hist:
+                    hist(x)
+            for i, add, hist in ints:
+                x = values[i]
+                if isinstance(x, int):
+                    add(x)
+                    if hist:
+                        hist(x)
+            for i, table in enum_items:
+                code = table.get(values[i])
+                if code is not None:
+                    hists[i].counts[code] += 1
+        return ps
+
+    @classmethod
+    def from_matrix(cls, loci: Sequence[Locus], matrix: np.ndarray, bins: int = 10) -> "PopulationStats":
+        """Column-wise NumPy reductions over an (individuals x loci) genome matrix."""
+        ps = cls(loci, bins)
+        for i in ps.stats:
+            ps.stats[i].add_array(matrix[:, i])
+        for i in ps.hists:
+            ps.hists[i].add_array(matrix[:, i])
+        return ps
+
+    def locus(self, index: int) -> Optional[RunningStats]:
+        return self.stats.get(index)
+
+    def genetic_diversity(self) -> float:
+        """Mean sample standard deviation over the float loci (0.0 without float loci)."""
+        if not self._float:
+            return 0.0
+        return sum(self.stats[i].std for i in self._float) / len(self._float)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        out: Dict[str, Dict[str, Any]] = {}
+        for i, loc in enumerate(self.loci):
+            entry: Dict[str, Any] = {}
+            st = self.stats.get(i)
+            if st is not None and st.n:
+                entry.update(n=st.n, mean=st.mean, std=st.std, min=st.min, max=st.max)
+            if i in self.hists:
+                entry["hist"] = list(self.hists[i].counts)
+            out[loc.name] = entry
+        return out
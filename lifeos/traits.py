@@ -1,9 +1,14 @@
 # lifeos/traits.py
 
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Sequence, Tuple
+import numpy as np
+
 from .genome import Genome
 
+TRAIT_NAMES: Tuple[str, ...] = ("size", "energy", "color")
+
+
 @dataclass
 class Traits:
     """Phenotypic expression of a genome (what the being looks like)."""
@@ -19,13 +24,73 @@ class Traits:
             "color": self.color,
         }
 
+
+# Traits are positional: size is locus 0, energy locus 1 and color locus 2,
+# whatever the loci are named. The engines write energy back to locus 1 and
+# VectorWorld reads the same columns, so every read and write path agrees.
+TRAIT_INDEX: Tuple[int, int, int] = (0, 1, 2)
+
+
+def compile_schema(loci: Sequence[Any]) -> Tuple[int, int, int]:
+    """Locus index of each trait in TRAIT_NAMES for `loci` (positional, see TRAIT_INDEX)."""
+    return TRAIT_INDEX
+
+
 class TraitDecoder:
-    """Converts raw genome values into high-level traits."""
+    """
+    Converts raw genome values into high-level traits.
+
+    Traits are read from fixed loci positions (see TRAIT_INDEX); packed genomes
+    decode just those three codes. Decoded Traits are cached on the genome
+    and reused until its values change (`Genome.set_value`, `Genome.mutate`,
+    or assigning a new `values` list). Writing into a plain values list
+    directly bypasses the cache; go through `set_value` instead.
+    """
+
+    def __init__(self, loci: Sequence[Any] = None, cache: bool = True):
+        self.cache = cache
+        self.index: Dict[str, int] = dict(zip(TRAIT_NAMES, compile_schema(loci or ())))
 
     def decode(self, genome: Genome) -> Traits:
-        # We assume genome.values = [float, int, str] from earlier steps
-        size = genome.values[0]      # e.g., 1.0 → size
-        energy = genome.values[1]    # e.g., 50 → energy
-        color = genome.values[2]     # e.g., "green" → color
+        values = genome.values
+        store = getattr(genome, "_data", values)  # packed genomes: the code array behind the view
+        cached = getattr(genome, "_phenotype", None)
+        if cached is not None and cached[0] is self and cached[1] is store:
+            return cached[2]
+        i_size, i_energy, i_color = TRAIT_INDEX
+        codes = getattr(genome, "code_array", None)
+        if codes is not None:  # packed genome: decode the three codes directly
+            dec = genome.schema.decoders
+            traits = Traits(size=dec[i_size](codes[i_size]), energy=dec[i_energy](codes[i_energy]),
+                            color=dec[i_color](codes[i_color]))
+        else:
+            traits = Traits(size=values[i_size], energy=values[i_energy], color=values[i_color])
+        if self.cache:
+            try:
+                genome._phenotype = (self, store, traits)
+            except AttributeError:
+                pass  # genome-like objects without room for the cache
+        return traits
 
-        return Traits(size=size, energy=energy, color=color)
+    def decode_batch(self, genomes: Iterable[Genome]) -> Dict[str, np.ndarray]:
+        """
+        Columnar decode: {"size": float64, "energy": int64 or float64, "color": object}
+        arrays, one entry per genome, without building Traits objects.
+        """
+        genomes = list(genomes)
+        if not genomes:
+            return {"size": np.empty(0), "energy": np.empty(0, dtype=np.int64),
+                    "color": np.empty(0, dtype=object)}
+        cols: List[List[Any]] = [[], [], []]
+        size_col, energy_col, color_col = cols
+        i_size, i_energy, i_color = TRAIT_INDEX
+        for g in genomes:
+            values = g.values
+            size_col.append(values[i_size])
+            energy_col.append(values[i_energy])
+            color_col.append(values[i_color])
+        color = np.empty(len(color_col), dtype=object)
+        color[:] = color_col
+        return {"size": np.asarray(size_col, dtype=np.float64),
+                "energy": np.asarray(energy_col),
+                "color": color}
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Run a seed ensemble of the Adam & Eve engine from a configs/adam_eve*.yaml file.
+Creates runs/ENS_<timestamp>_<name>/ with combined metrics (seed column) and a
+per-generation summary with 95% confidence bands.
+"""
+from __future__ import annotations
+import argparse, yaml, time
+from pathlib import Path
+
+from lifeos.ensemble import world_kwargs_from_config, replicate_seeds, run_ensemble
+
+
+def load_config(path: Path):
+    with path.open("r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}  # an empty file means "all defaults"
+
+
+def make_run_dir(name: str) -> Path:
+    ts = time.strftime("%Y%m%d_%H%M%S")
+    d = Path("runs") / f"ENS_{ts}_{name}"
+    d.mkdir(parents=True, exist_ok=True)
+    return d
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--config", required=True, help="Path to an Adam & Eve YAML config")
+    group = ap.add_mutually_exclusive_group()
+    group.add_argument("--seeds", default=None, help="Comma-separated seed list")
+    group.add_argument("--replicates", type=int, default=10,
+                       help="Number of seeds derived from the config seed (default: 10)")
+    ap.add_argument("--workers", type=int, default=1, help="Replicates run in parallel processes")
+    ap.add_argument("--metrics-sink", default="columnar", choices=["csv", "columnar", "sqlite"],
+                    help="Combined metrics backend (default: columnar)")
+    args = ap.parse_args()
+
+    cfg_path = Path(args.config)
+    cfg = load_config(cfg_path)
+    name = cfg.get("experiment_name", "adam_eve")
+    if args.seeds:
+        seeds = [int(s) for s in args.seeds.split(",") if s.strip()]
+    else:
+        seeds = replicate_seeds(int(cfg.get("seed", 42)), args.replicates)
+
+    run_root = make_run_dir(name)
+    (run_root / "seeds.txt").write_text("\n".join(map(str, seeds)), encoding="utf-8")
+    (run_root / "config.yaml").write_text(cfg_path.read_text(encoding="utf-8"), encoding="utf-8")
+
+    result = run_ensemble(world_kwargs_from_config(cfg), seeds, run_root,
+                          workers=args.workers, metrics_sink=args.metrics_sink)
+
+    walls = result["wall_times"].values()
+    print(f"Ensemble complete: {len(seeds)} replicates, "
+          f"{sum(walls):.1f}s total replicate time, slowest {max(walls):.1f}s")
+    print(f"Artifacts in: {run_root.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
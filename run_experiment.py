@@ -48,6 +48,7 @@ def parse_scenarios(cfg) -> list[Scenario]:
                 math_injection=bool(sc.get("math_injection", False)),
                 money_system=bool(sc.get("money_system", False)),
                 policy=sc.get("policy", "rational"),
+                engine=sc.get("engine", "objects"),
             )
         )
     # fallback if none provided
@@ -59,6 +60,12 @@ def parse_scenarios(cfg) -> list[Scenario]:
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--config", required=True, help="Path to YAML config")
+    ap.add_argument("--metrics-sink", default=None, choices=["csv", "columnar", "sqlite"],
+                    help="Metrics output backend (default: config 'metrics_sink' or csv)")
+    ap.add_argument("--workers", type=int, default=None,
+                    help="Worlds run in parallel processes (default: config 'workers' or 1)")
+    ap.add_argument("--timings", action="store_true",
+                    help="Add per-stage wall times (t_<stage>_ms) to metrics (default: config 'timings')")
     args = ap.parse_args()
 
     cfg_path = Path(args.config)
@@ -84,12 +91,17 @@ def main():
         generations=gens,
         mutation_rate=mut,
         scenarios=scenarios,
+        metrics_sink=args.metrics_sink or cfg.get("metrics_sink", "csv"),
+        workers=args.workers or int(cfg.get("workers", 1)),
+        timings=args.timings or bool(cfg.get("timings", False)),
     )
     outputs = mv.run_all(run_root)
 
     # print summary
     worlds = ", ".join(outputs.keys())
     print(f"Run complete. Worlds: {worlds}")
+    for wname, secs in mv.wall_times.items():
+        print(f"  {wname}: {secs:.2f}s")
     print(f"Artifacts in: {run_root.resolve()}")
 
 
@@ -103,3 +103,96 @@ def test_adam_eve_with_psai(tmp_path: Path):
 
     repro = json.loads((out / "reproduction_events.json").read_text())
     assert isinstance(repro, list)
+
+
+def test_columnar_backend_matches_objects(tmp_path: Path):
+    """Seeded runs give the same curves with the columnar population backend."""
+
+    loci = [
+        Locus(name="cooperation", type="float", min=0.0, max=1.0),
+        Locus(name="energy", type="int", min=0, max=100),
+    ]
+    outputs = {}
+    for backend in ("objects", "columnar"):
+        world = AdamEveWorld(
+            seed=7,
+            loci=loci,
+            num_couples=15,
+            generations=25,
+            lifespan_phases=5,
+            reproduction_phase=None,
+            children_cap_range=(2, 4),
+            env_cfg={"base_food_per_gen": 60, "base_oxygen_per_gen": 60, "oxygen_decay_per_gen": 1},
+            backend=backend,
+        )
+        world.run(tmp_path / backend)
+        outputs[backend] = (tmp_path / backend / "metrics.csv").read_text(encoding="utf-8")
+
+    assert outputs["objects"] == outputs["columnar"]
+
+
+def test_timings_add_phase_columns(tmp_path: Path):
+    """timings=True appends t_<phase>_ms columns and leaves the other metrics unchanged."""
+    import csv
+
+    loci = [
+        Locus(name="cooperation", type="float", min=0.0, max=1.0),
+        Locus(name="energy", type="int", min=0, max=100),
+    ]
+    rows = {}
+    for timings in (False, True):
+        world = AdamEveWorld(seed=5, loci=loci, num_couples=6, generations=8, timings=timings)
+        world.run(tmp_path / str(timings))
+        with (tmp_path / str(timings) / "metrics.csv").open(encoding="utf-8") as f:
+            rows[timings] = list(csv.DictReader(f))
+
+    phases = [f"t_{p}_ms" for p in ("age", "pair", "minds", "reproduce", "env", "compact", "step")]
+    assert not any(k.startswith("t_") for k in rows[False][0])
+    assert list(rows[True][0])[-len(phases):] == phases
+    assert [{k: v for k, v in r.items() if k not in phases} for r in rows[True]] == rows[False]
+    assert all(float(r["t_step_ms"]) > 0 for r in rows[True][1:])
+
+
+def test_batch_minds_run(tmp_path: Path):
+    """mind_mode="batch" replaces per-agent minds with one MindBatch pass."""
+
+    loci = [Locus(name="cooperation", type="float", min=0.0, max=1.0)]
+    world = AdamEveWorld(seed=11, loci=loci, num_couples=10, generations=15,
+                         backend="columnar", mind_mode="batch")
+    world.run(tmp_path / "batch")
+
+    assert world.minds is not None
+    assert all(world.state[ind.id].mind is None for ind in world.population)
+    shared = json.loads((tmp_path / "batch" / "shared_memory.json").read_text(encoding="utf-8"))
+    assert any(e.get("event") == "farm" for e in shared)
+    assert world.shared_ledger.closed
+
+    with pytest.raises(ValueError):
+        AdamEveWorld(seed=1, loci=loci, mind_mode="batch")
+
+
+def test_compaction_archives_dead_agents(tmp_path: Path):
+    """compact_every moves the dead to the archive without changing the run."""
+
+    loci = [
+        Locus(name="cooperation", type="float", min=0.0, max=1.0),
+        Locus(name="energy", type="int", min=0, max=100),
+    ]
+    outputs = {}
+    for backend in ("objects", "columnar"):
+        for compact_every in (None, 2):
+            world = AdamEveWorld(seed=7, loci=loci, num_couples=15, generations=25, lifespan_phases=5,
+                                 reproduction_phase=None, children_cap_range=(2, 4),
+                                 backend=backend, compact_every=compact_every)
+            out = tmp_path / f"{backend}_{compact_every}"
+            world.run(out)
+            outputs[compact_every] = [(out / name).read_text(encoding="utf-8")
+                                      for name in ("metrics.csv", "lineage.json", "reproduction_events.json")]
+        assert outputs[None] == outputs[2]
+
+        # live state tracks the living; lineage queries still reach the dead
+        assert len(world.state) <= len(world.population) + len(world._dead)
+        assert (out / "lineage_archive.bin").exists()
+        assert len(world.lineage.archive) > 0
+        assert world.lineage.get_individual(0).parents is None
+        assert world.lineage.get_children(0)
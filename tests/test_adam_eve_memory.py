@@ -0,0 +1,111 @@
+import pytest
+
+from lifeos.adam_eve_engine import AdamEveWorld
+from lifeos.adam_eve_memory import SharedLedger, RECORD_SIZE, MemoryStore, NO_ID
+from lifeos.adam_eve_rules import (ledger_recent_events, memory_recent_partner,
+                                   avoid_repeat_pairing, avoid_repeat_pairing_batch)
+from lifeos.genome import Locus
+
+
+def test_shared_ledger_ring_evicts_oldest(tmp_path):
+    for path in (None, tmp_path / "ledger.bin"):
+        ledger = SharedLedger(cap_bytes=4 * RECORD_SIZE, path=path)
+        ledger.add({"gen": 0, "event": "founder_pair", "ids": [0, 1]})
+        ledger.add({"gen": 1, "event": "farm", "id": 0, "effort": 0.5, "yield": 2})
+        assert ledger.used_bytes == 2 * RECORD_SIZE
+        for child in range(2, 6):
+            ledger.add({"gen": 2, "event": "birth", "parents": [0, 1], "child": child})
+
+        assert ledger.used_bytes == ledger.capacity_bytes == 4 * RECORD_SIZE
+        assert ledger.evicted == 2
+        assert [e["child"] for e in ledger.events] == [2, 3, 4, 5]
+        assert ledger_recent_events(ledger, 2) == [
+            {"gen": 2, "event": "birth", "parents": [0, 1], "child": 4},
+            {"gen": 2, "event": "birth", "parents": [0, 1], "child": 5},
+        ]
+        ledger.close()
+
+
+def test_shared_ledger_round_trips_farm_events():
+    ledger = SharedLedger()
+    ev = {"gen": 3, "event": "farm", "id": 7, "effort": 0.123456789, "yield": 4}
+    ledger.add(ev)
+    assert ledger.events == [ev]
+    ledger.add({"gen": 3, "event": "gossip"})  # not a packed layout: kept as a generic record
+    assert ledger.events == [ev, {"gen": 3, "event": "gossip"}]
+
+
+def test_shared_ledger_keeps_generic_events(tmp_path):
+    for path in (None, tmp_path / "ledger.bin"):
+        ledger = SharedLedger(cap_bytes=8 * RECORD_SIZE, path=path)
+        custom = {"gen": 2, "event": "trade", "who": [1, 2], "goods": "grain" * 5}  # JSON fills 2 slots
+        ledger.add({"gen": 1, "event": "pair", "ids": [1, 2]})
+        ledger.add(custom)
+        ledger.add({"event": "note", "text": "no generation"})
+        assert ledger.recent(2) == [custom, {"event": "note", "text": "no generation"}]
+        assert ledger.used_bytes == 6 * RECORD_SIZE  # payloads live in the ring
+
+        # records are evicted whole, oldest first
+        for child in range(3, 7):
+            ledger.add({"gen": 3, "event": "birth", "parents": [1, 2], "child": child})
+        assert [e["event"] for e in ledger.events] == ["note"] + ["birth"] * 4
+        ledger.add(dict(custom, gen=4))
+        assert [e["event"] for e in ledger.events] == ["birth"] * 4 + ["trade"]
+        assert ledger.events[-1] == dict(custom, gen=4)
+        assert ledger.evicted == 3 and ledger.used_bytes == 7 * RECORD_SIZE
+
+        with pytest.raises(ValueError, match="birth"):
+            ledger.add({"gen": 1, "event": "birth", "parents": [1, 2]})  # no child
+        with pytest.raises(ValueError, match="more than the ledger"):
+            ledger.add({"gen": 1, "event": "essay", "text": "x" * 1000})
+        assert len(ledger) == 5
+        ledger.close()
+        ledger.close()
+        assert ledger.closed
+
+    # a payload that wraps around the end of the ring
+    ledger = SharedLedger(cap_bytes=5 * RECORD_SIZE)
+    for child in range(3):
+        ledger.add({"gen": 1, "event": "birth", "parents": [1, 2], "child": child})
+    ledger.add(custom)
+    assert ledger.events == [{"gen": 1, "event": "birth", "parents": [1, 2], "child": 1},
+                             {"gen": 1, "event": "birth", "parents": [1, 2], "child": 2},
+                             custom]
+
+
+def test_memory_store_ring_and_queries():
+    store = MemoryStore(k=3, capacity=1)
+    for agent_id in (10, 11, 12):
+        store.add(agent_id)
+    store.remember_many([10, 11], 0, "founder", [11, 10])
+    store.remember_many([10, 11], 1, "birth", [20, 20])
+    store.remember(10, 2, "birth", 21)
+    store.remember(10, 3, "birth", 22)  # evicts the founder record
+
+    assert store.recent_partner([10, 11, 12]).tolist() == [NO_ID, 10, NO_ID]
+    assert store.recent_births([10, 11, 12], since_gen=2).tolist() == [2, 0, 0]
+    assert store.recall(10) == [{"gen": 1, "event": "birth", "child": 20},
+                                {"gen": 2, "event": "birth", "child": 21},
+                                {"gen": 3, "event": "birth", "child": 22}]
+
+    store.compact([11])
+    assert 10 not in store and store.recall(11)[0] == {"gen": 0, "event": "founder", "partner": 10}
+    assert memory_recent_partner(None, store=store, agent_id=11) == 10
+    assert avoid_repeat_pairing_batch(store, [11, 11], [10, 12]).tolist() == [False, True]
+
+
+def test_engine_memory_backends_agree(tmp_path):
+    loci = [Locus(name="cooperation", type="float", min=0.0, max=1.0)]
+    kwargs = dict(seed=3, loci=loci, num_couples=8, generations=10, lifespan_phases=None,
+                  children_cap_range=(2, 4))
+    ring = AdamEveWorld(**kwargs)
+    ring.run(tmp_path / "ring")
+    cols = AdamEveWorld(memory_backend="columnar", **kwargs)
+    cols.run(tmp_path / "columnar")
+
+    assert all(cols.state[ind.id].memory is None for ind in cols.population)
+    for ind in ring.population:
+        st = ring.state[ind.id]
+        assert cols.memory_store.recall(ind.id) == st.memory.recall()
+        assert memory_recent_partner(st) == memory_recent_partner(None, store=cols.memory_store, agent_id=ind.id)
+        assert avoid_repeat_pairing(st, st.partner_id) is False
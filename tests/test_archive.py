@@ -0,0 +1,41 @@
+from lifeos.archive import LineageArchive
+from lifeos.genome import Genome, Locus
+from lifeos.lineage import Individual, LineageTracker
+
+LOCI = [
+    Locus(name="size", type="float", min=0.0, max=1.0),
+    Locus(name="energy", type="int", min=0, max=100),
+    Locus(name="color", type="enum", enum=["red", "green", "blue"]),
+]
+
+
+def test_archive_round_trip_memory_and_disk(tmp_path):
+    for path in (None, tmp_path / "archive.bin"):
+        archive = LineageArchive(LOCI, path=path, flush_bytes=64)
+        archive.append(Individual(id=0, genome=Genome(LOCI, [0.25, 7, "blue"])), 0, 3)
+        archive.append(Individual(id=4, genome=Genome(LOCI, [0.5, 99, "red"]), parents=[0, 1]), 2, 5)
+
+        rec = archive.get(4)
+        assert (rec.parents, rec.birth_gen, rec.death_gen) == ([0, 1], 2, 5)
+        assert rec.genome.values == [0.5, 99, "red"]
+        assert archive.get(0).parents is None and archive.get(2) is None
+        assert [r.id for r in archive.records()] == [0, 4]
+        assert archive.to_numpy()["death_gen"].tolist() == [3, 5]
+        assert archive.children(0) == [4] and archive.children(1) == [4] and archive.children(4) == []
+
+
+def test_lineage_queries_fall_through_to_archive():
+    tracker = LineageTracker(archive=LineageArchive(LOCI))
+    for ind in (Individual(0, Genome(LOCI, [0.1, 1, "red"])),
+                Individual(1, Genome(LOCI, [0.2, 2, "green"])),
+                Individual(2, Genome(LOCI, [0.3, 3, "blue"]), parents=[0, 1]),
+                Individual(3, Genome(LOCI, [0.4, 4, "red"]), parents=[0, 1])):
+        tracker.add_individual(ind)
+    tracker.archive_individual(0, birth_gen=0, death_gen=2)
+    tracker.archive_individual(2, birth_gen=1, death_gen=2)
+
+    assert 0 not in tracker.individuals
+    assert tracker.get_individual(2).genome.values == [0.3, 3, "blue"]
+    assert tracker.get_parents(2) == [0, 1]
+    assert tracker.get_children(0) == [2, 3]
+    assert tracker.parents_map() == {0: None, 1: None, 2: [0, 1], 3: [0, 1]}
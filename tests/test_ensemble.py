@@ -0,0 +1,86 @@
+import csv
+from pathlib import Path
+from statistics import mean
+
+import pytest
+import yaml
+
+from lifeos.ensemble import world_kwargs_from_config, replicate_kwargs, replicate_seeds, run_ensemble
+
+CONFIGS = Path(__file__).resolve().parents[1] / "configs"
+
+
+def test_world_kwargs_from_configs():
+    # reproduction_phase: [1, 2] with a lifespan of 4 would also need phase 3 to be "phase >= 1"
+    with pytest.warns(UserWarning, match=r"\[1, 2\]"):
+        debug = world_kwargs_from_config(yaml.safe_load((CONFIGS / "adam_eve_debug.yaml").read_text()))
+    assert debug["num_couples"] == 12 and debug["reproduction_phase"] == 1
+    assert debug["children_cap_range"] == (2, 4) and debug["shared_pool_kb"] == 32
+    assert [l.name for l in debug["loci"]] == ["cooperation", "energy"]
+
+    pilot = world_kwargs_from_config(yaml.safe_load((CONFIGS / "adam_eve.yaml").read_text()))
+    assert pilot["lifespan_phases"] == 4 and pilot["children_cap_range"] == (6, 6)
+    assert pilot["shared_pool_kb"] == 2
+    # reproduction.allowed_generations: [2, 3] is exactly "phase >= 2" under a lifespan of 4
+    assert pilot["reproduction_phase"] == 2
+
+    # configs/adam_eve_stress.yaml is empty: every setting takes its default
+    stress = world_kwargs_from_config(yaml.safe_load((CONFIGS / "adam_eve_stress.yaml").read_text()))
+    assert stress["num_couples"] == 12 and stress["generations"] == 60 and stress["loci"] == []
+
+
+def test_run_ensemble_parallel_matches_serial(tmp_path: Path):
+    cfg = yaml.safe_load((CONFIGS / "adam_eve_free.yaml").read_text())
+    cfg["generations"] = 8
+    kwargs = world_kwargs_from_config(cfg)
+    seeds = replicate_seeds(cfg["seed"], 3)
+
+    outputs = {}
+    for workers in (1, 2):
+        out = tmp_path / f"w{workers}"
+        result = run_ensemble(kwargs, seeds, out, workers=workers, metrics_sink="csv")
+        assert set(result["wall_times"]) == set(seeds)
+        outputs[workers] = [(out / name).read_text() for name in ("ensemble_metrics.csv", "ensemble_summary.csv")]
+    assert outputs[1] == outputs[2]
+
+    with (tmp_path / "w1" / "ensemble_metrics.csv").open() as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 3 * 9 and {int(r["seed"]) for r in rows} == set(seeds)
+    with (tmp_path / "w1" / "ensemble_summary.csv").open() as f:
+        last = list(csv.DictReader(f))[-1]
+    alive = [int(r["alive"]) for r in rows if r["generation"] == "8"]
+    assert abs(float(last["alive_mean"]) - mean(alive)) < 1e-6
+    assert last["replicates"] == "3"
+
+
+def test_replicates_get_independent_environment_streams():
+    from lifeos.adam_eve_engine import AdamEveWorld
+
+    cfg = yaml.safe_load((CONFIGS / "adam_eve_free.yaml").read_text())
+    kwargs = world_kwargs_from_config(cfg)
+    assert kwargs["env_cfg"]["rng_seed"] == 999  # one fixed seed for every replicate in the config
+
+    def env_draws(seed):
+        world = AdamEveWorld(seed=seed, **replicate_kwargs(kwargs, seed))
+        return [world.environment.rng.random() for _ in range(4)], world.environment.np_rng.random(4).tolist()
+
+    a, b = replicate_seeds(cfg["seed"], 2)
+    assert env_draws(a) != env_draws(b)
+    assert env_draws(a) == env_draws(a)
+    assert kwargs["env_cfg"]["rng_seed"] == 999  # the shared kwargs are left alone
+
+
+def test_serial_ensemble_streams_rows(tmp_path: Path, monkeypatch):
+    import lifeos.ensemble as ensemble
+
+    def rows(world_kwargs, seed):
+        yield {"generation": 0, "alive": 4}
+        yield {"generation": 1, "alive": 6}
+        raise RuntimeError("replicate died")
+
+    monkeypatch.setattr(ensemble, "_replicate_rows", rows)
+    with pytest.raises(ensemble.EnsembleError):
+        run_ensemble({}, [7], tmp_path, metrics_sink="csv")
+    # rows reach the sink as they are produced, not when the replicate returns
+    lines = (tmp_path / "ensemble_metrics.csv").read_text().splitlines()
+    assert lines == ["seed,generation,alive", "7,0,4", "7,1,6"]
@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from lifeos.environment import Environment, EnvironmentConfig
+
+
+def _legacy_counts(seed, weights, units):
+    rng = random.Random(seed)
+    ids = list(range(len(weights)))
+    counts = [0] * len(weights)
+    for _ in range(units):
+        counts[rng.choices(ids, weights=weights, k=1)[0]] += 1
+    return counts
+
+
+def test_loop_mode_matches_per_unit_draws():
+    weights = [1.0, 1.5, 2.0, 1.2, 1.9]
+    env = Environment(EnvironmentConfig(rng_seed=11))
+    assert env.draw_allocation(weights, 500) == _legacy_counts(11, weights, 500)
+
+
+def test_multinomial_mode_is_seeded_and_conserves_food():
+    weights = [1.0, 3.0, 2.0, 1.0]
+    a = Environment(EnvironmentConfig(rng_seed=5, allocation_mode="multinomial"))
+    b = Environment(EnvironmentConfig(rng_seed=5, allocation_mode="multinomial"))
+    ca = a.draw_allocation(weights, 10_000)
+    assert ca == b.draw_allocation(weights, 10_000)
+    assert sum(ca) == 10_000
+    # heaviest weight should receive roughly 3/7 of the pile
+    assert abs(ca[1] / 10_000 - 3 / 7) < 0.03
+
+
+def test_unknown_allocation_mode_rejected():
+    with pytest.raises(ValueError):
+        Environment(EnvironmentConfig(allocation_mode="bogus"))
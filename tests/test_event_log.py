@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+
+from lifeos.event_log import EventLogWriter, iter_events, load_index
+from lifeos.genome import Locus
+from lifeos.adam_eve_engine import AdamEveWorld
+
+
+def _events():
+    for gen in range(1, 6):
+        for child in range(gen):
+            yield {"generation": gen, "event": "birth", "child_id": 10 * gen + child}
+        yield {"generation": gen, "event": "death_env", "id": gen}
+
+
+def test_writer_round_trip_and_filters(tmp_path: Path):
+    events = list(_events())
+    for background in (False, True):
+        path = tmp_path / f"events_{background}.jsonl"
+        with EventLogWriter(path, buffer_events=3, background=background) as log:
+            for ev in events:
+                log.write(ev)
+
+        assert list(iter_events(path)) == events
+        assert sorted(load_index(path)) == [1, 2, 3, 4, 5]
+        assert list(iter_events(path, generation=3)) == [e for e in events if e["generation"] == 3]
+        assert [e["id"] for e in iter_events(path, event="death_env")] == [1, 2, 3, 4, 5]
+        assert list(iter_events(path, generation=9)) == []
+
+
+def test_engine_streams_events(tmp_path: Path):
+    loci = [Locus(name="cooperation", type="float", min=0.0, max=1.0)]
+    kwargs = dict(seed=5, loci=loci, num_couples=10, generations=12, children_cap_range=(2, 4))
+
+    AdamEveWorld(**kwargs).run(tmp_path / "memory")
+    world = AdamEveWorld(event_log="jsonl", **kwargs)
+    world.run(tmp_path / "jsonl")
+
+    assert world.reproduction_events == []
+    assert not (tmp_path / "jsonl" / "reproduction_events.json").exists()
+    expected = json.loads((tmp_path / "memory" / "reproduction_events.json").read_text())
+    assert list(iter_events(tmp_path / "jsonl" / "reproduction_events.jsonl")) == expected
+
+    # event_log="off": nothing kept or written, metrics unchanged
+    off = AdamEveWorld(event_log="off", **kwargs)
+    off.run(tmp_path / "off")
+    assert off.reproduction_events == []
+    assert not any((tmp_path / "off").glob("reproduction_events*"))
+    assert (tmp_path / "off" / "metrics.csv").read_text() == (tmp_path / "memory" / "metrics.csv").read_text()
+
+
+def test_iter_generations_streams_events(tmp_path: Path):
+    import pytest
+
+    loci = [Locus(name="cooperation", type="float", min=0.0, max=1.0)]
+    kwargs = dict(seed=5, loci=loci, num_couples=10, generations=12, children_cap_range=(2, 4))
+    with pytest.raises(ValueError, match="out_dir"):
+        next(AdamEveWorld(event_log="jsonl", **kwargs).iter_generations())
+
+    AdamEveWorld(**kwargs).run(tmp_path / "memory")
+    world = AdamEveWorld(event_log="jsonl", out_dir=tmp_path / "iter", **kwargs)
+    rows = list(world.iter_generations())
+    assert len(rows) == 13 and world.event_writer is None  # closed at the end of the iteration
+    assert world.shared_ledger.closed
+    expected = json.loads((tmp_path / "memory" / "reproduction_events.json").read_text())
+    assert list(iter_events(tmp_path / "iter" / "reproduction_events.jsonl")) == expected
@@ -25,3 +25,136 @@ def test_random_init_and_mutation():
     assert 1.5 <= new_genome.values[0] <= 2.0
     assert 0 <= new_genome.values[1] <= 100
     assert new_genome.values[2] in ["blue", "green", "brown"]
+
+
+def test_shared_genome_copy_on_write():
+    loci = [Locus(name="size", type="float"), Locus(name="energy", type="int", min=0, max=100)]
+    original = Genome(loci=loci, values=[0.5, 40])
+    clone = original.share()
+    assert clone.values is original.values
+
+    clone.set_value(1, 45)
+    assert original.values == [0.5, 40] and clone.values == [0.5, 45]
+
+    # the last owner writes in place
+    values = original.values
+    original.set_value(1, 41)
+    assert original.values is values and original.values == [0.5, 41]
+
+
+def test_schema_packed_genomes():
+    import pickle
+    from lifeos.genome import GenomeSchema
+    from lifeos.reproduction import ReproductionModel
+
+    loci = [
+        Locus(name="size", type="float", min=0.5, max=3.0),
+        Locus(name="energy", type="int", min=0, max=100),
+        Locus(name="color", type="enum", enum=["red", "green", "blue"]),
+    ]
+    schema = GenomeSchema.of(loci)
+    assert GenomeSchema.of(loci) is schema and schema.packable
+    assert schema.enum_codes[2] == {"red": 0, "green": 1, "blue": 2}
+
+    g = Genome.random_init(loci, random.Random(1))
+    assert g.packed and not hasattr(g, "__dict__")
+    assert isinstance(g.values[1], int) and g.values[2] in loci[2].enum
+    assert g.values == list(g.values) and g.codes().tolist()[2] == loci[2].enum.index(g.values[2])
+
+    # writes encode in place; a value without a code switches the genome to list storage
+    g.values[1] = 55
+    assert g.packed and g.values[1] == 55
+    g.set_value(1, 55.5)
+    assert not g.packed and g.values[1] == 55.5
+
+    # packed and list-backed genomes consume the same draws and produce the same values
+    a = Genome.random_init(loci, random.Random(2))
+    b = Genome.random_init(loci, random.Random(3))
+    plain = [Genome(loci, list(a.values)), Genome(loci, list(b.values))]
+    child = ReproductionModel().mate(a, b, random.Random(4))
+    plain_child = ReproductionModel().mate(*plain, random.Random(4))
+    assert child.packed and child == plain_child
+    mutated = MutationModel(per_locus_rate=0.5).mutate(child, random.Random(5))
+    assert mutated == MutationModel(per_locus_rate=0.5).mutate(plain_child, random.Random(5))
+
+    assert pickle.loads(pickle.dumps(mutated)) == mutated
+
+
+def test_batch_mutation_scales_with_mutations():
+    import numpy as np
+
+    loci = [
+        Locus(name="size", type="float", min=0.5, max=3.0),
+        Locus(name="energy", type="int", min=0, max=100),
+        Locus(name="color", type="enum", enum=["red", "green", "blue"]),
+    ]
+    model = MutationModel(per_locus_rate=0.01)
+    rows, cols, codes = model.sample_mutations(2000, loci, np.random.default_rng(0))
+    assert 20 < len(rows) < 100 and (np.diff(rows) >= 0).all()
+    assert len(set(zip(rows.tolist(), cols.tolist()))) == len(rows)   # distinct positions
+
+    genes = np.zeros((2000, 3))
+    mutated = model.mutate_batch(genes, loci, np.random.default_rng(0))
+    assert set(np.flatnonzero(genes.any(axis=1)).tolist()) <= set(mutated.tolist())
+    assert (genes[:, 1] == np.round(genes[:, 1])).all() and genes[:, 2].max() <= 2
+
+    # unmutated genomes come back as copy-on-write twins of their input
+    rng = random.Random(7)
+    cohort = [Genome.random_init(loci, rng) for _ in range(300)]
+    out = MutationModel(per_locus_rate=0.005).mutate_cohort(cohort, np.random.default_rng(1))
+    changed = [i for i, (a, b) in enumerate(zip(cohort, out)) if a != b]
+    shared = [i for i, (a, b) in enumerate(zip(cohort, out)) if a._data is b._data]
+    assert changed and len(shared) == 300 - len(changed)
+    assert out[changed[0]].packed
+
+
+def test_bulk_random_init():
+    import numpy as np
+    from lifeos.genome import GenomeSchema, random_init
+
+    loci = [
+        Locus(name="size", type="float", min=0.5, max=3.0),
+        Locus(name="energy", type="int", min=0, max=100),
+        Locus(name="color", type="enum", enum=["red", "green", "blue"]),
+    ]
+    schema = GenomeSchema.of(loci)
+
+    # a random.Random gives exactly the draws of one Genome.random_init per genome
+    bulk = random_init(schema, 5, random.Random(9))
+    rng = random.Random(9)
+    assert bulk == [Genome.random_init(loci, rng) for _ in range(5)]
+
+    # a NumPy generator fills the matrix column by column, deterministically
+    a = random_init(schema, 1000, np.random.default_rng(3))
+    b = random_init(schema, 1000, np.random.default_rng(3))
+    assert a == b and all(g.packed for g in a)
+    assert {g.values[2] for g in a} == {"red", "green", "blue"}
+    assert all(0 <= g.values[1] <= 100 and isinstance(g.values[1], int) for g in a)
+
+
+def test_schema_cache_is_bounded_and_tracks_list_changes():
+    from lifeos.genome import GenomeSchema
+
+    loci = [
+        Locus(name="size", type="float", min=0.5, max=3.0),
+        Locus(name="energy", type="int", min=0, max=100),
+    ]
+    rng = random.Random(3)
+    compiled = len(GenomeSchema._compiled)
+    for _ in range(2000):
+        Genome.random_init(list(loci), rng)  # a fresh, equal list every call
+    assert len(GenomeSchema._compiled) <= compiled + 1
+    assert len(GenomeSchema._recent) <= GenomeSchema._RECENT_MAX
+
+    kept = GenomeSchema.of(loci)
+    for hi in range(GenomeSchema._RECENT_MAX + 50):  # distinct loci contents
+        GenomeSchema.of([Locus(name="size", type="float", min=0.0, max=float(hi + 1))])
+        GenomeSchema.of(list(loci))  # an equal, fresh list keeps this compilation in use
+    assert len(GenomeSchema._compiled) <= GenomeSchema._RECENT_MAX
+    assert GenomeSchema.of(list(loci)).kinds is kept.kinds
+
+    grown = list(loci)
+    assert len(GenomeSchema.of(grown)) == 2
+    grown.append(Locus(name="color", type="enum", enum=["red", "blue"]))
+    g = Genome.random_init(grown, rng)
+    assert len(GenomeSchema.of(grown)) == 3 and len(g.values) == 3 and g.values[2] in ("red", "blue")
@@ -0,0 +1,85 @@
+import random
+from collections import Counter
+
+from lifeos.lineage import Individual
+from lifeos.matching import MatchingPool, match_pairs
+
+
+def _agents(parent_pairs):
+    return [Individual(id=i, genome=None, parents=p) for i, p in enumerate(parent_pairs)]
+
+
+def test_pairs_are_disjoint_and_never_full_siblings():
+    # three sibling groups of four plus a few founders
+    parents = [[100, 101]] * 4 + [[102, 103]] * 4 + [[104, 105]] * 4 + [None] * 3
+    agents = _agents(parents)
+    pairs = match_pairs(agents, random.Random(3))
+
+    seen = set()
+    for a, b in pairs:
+        assert a.id not in seen and b.id not in seen
+        seen.update((a.id, b.id))
+        assert not (a.parents and b.parents and set(a.parents) == set(b.parents))
+    # 15 agents with no forced leftovers: everyone but one gets paired
+    assert len(pairs) == 7
+
+
+def test_pool_sibling_index_tracks_removals():
+    agents = _agents([[1, 2], [1, 2], [1, 2], None])
+    pool = MatchingPool(agents)
+    assert pool.eligible_count(agents[0]) == 1
+    pool.remove(agents[3].id)
+    assert pool.eligible_count(agents[0]) == 0
+    assert pool.draw(agents[0], random.Random(0)) is None
+    assert len(pool) == 3 and agents[3].id not in pool
+
+
+def test_uniform_partner_distribution():
+    agents = _agents([None] * 4)
+    counts = Counter()
+    rng = random.Random(9)
+    for _ in range(4000):
+        for a, b in match_pairs(agents, rng):
+            if 0 in (a.id, b.id):
+                counts[b.id if a.id == 0 else a.id] += 1
+    for partner in (1, 2, 3):
+        assert abs(counts[partner] / 4000 - 1 / 3) < 0.04
+
+
+class _Weighted:
+    def partner_weights(self, candidates):
+        return [10.0 if c.id == 1 else 0.01 for c in candidates]
+
+
+def test_batched_chooser_weights_are_used():
+    agents = _agents([None] * 6)
+    rng = random.Random(1)
+    hits = sum(any(1 in (a.id, b.id) for a, b in match_pairs(agents, rng)) for _ in range(200))
+    assert hits == 200  # everyone pairs when nobody is blocked
+    first_pick = Counter()
+    for _ in range(500):
+        pairs = match_pairs(agents, rng, chooser=_Weighted())
+        a, b = pairs[0]
+        if a.id != 1:
+            first_pick[b.id] += 1
+    assert first_pick[1] > 0.9 * sum(first_pick.values())
+
+
+class _Zero:
+    def __init__(self, nonzero=()):
+        self.nonzero = set(nonzero)
+
+    def partner_weights(self, candidates):
+        return [1.0 if c.id in self.nonzero else 0.0 for c in candidates]
+
+
+def test_zero_weights_fall_back_to_uniform():
+    # all-zero weights, and zero weights next to a weighted sibling group
+    for chooser, parents in ((_Zero(), [None] * 6),
+                             (_Zero({0, 1}), [[7, 8], [7, 8], None, None, None])):
+        agents = _agents(parents)
+        for seed in range(20):
+            pairs = match_pairs(agents, random.Random(seed), chooser=chooser)
+            ids = [i for a, b in pairs for i in (a.id, b.id)]
+            assert len(ids) == len(set(ids)) == 2 * (len(agents) // 2)
+            assert not any(a.parents and a.parents == b.parents for a, b in pairs)
@@ -1,5 +1,64 @@
+import numpy as np
+
 from lifeos import metrics
 
 def test_metrics_import():
     # Just check we can import and use something simple
     assert hasattr(metrics, "__file__") or metrics is not None
+
+
+def test_metrics_collector_counts_per_generation():
+    c = metrics.MetricsCollector()
+    c.record(1, "birth")
+    c.record(1, "birth")
+    c.record(2, "death_env", n=3)
+    assert c.count(1, "birth") == 2
+    assert c.count(2, "birth") == 0
+    assert c.count(7, "death_env") == 0
+    assert c.generation_counts(2) == {"death_env": 3}
+    assert c.totals["death_env"] == 3
+
+
+def test_csv_sink_buffers_and_appends(tmp_path):
+    path = tmp_path / "metrics.csv"
+    with metrics.CSVMetricsSink(path, flush_every=3) as sink:
+        sink.write({"generation": 0, "alive": 4})
+        sink.write({"generation": 1, "alive": 5})
+        assert not path.exists()  # still buffered
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines == ["generation,alive", "0,4", "1,5"]
+
+
+def test_sqlite_and_columnar_sinks(tmp_path):
+    import sqlite3
+
+    rows = [{"world": "w", "generation": g, "avg_energy": g * 0.5} for g in range(5)]
+    with metrics.open_sink("sqlite", tmp_path, flush_every=2) as sink:
+        for row in rows:
+            sink.write(row)
+    conn = sqlite3.connect(str(tmp_path / "metrics.sqlite"))
+    assert conn.execute("SELECT COUNT(*), SUM(generation) FROM metrics").fetchone() == (5, 10)
+    conn.close()
+
+    with metrics.open_sink("columnar", tmp_path, flush_every=2) as sink:
+        for row in rows:
+            sink.write(row)
+    assert sink.path.exists()
+    if sink.suffix == ".npz":
+        with np.load(sink.path) as data:
+            assert data["generation"].tolist() == [0, 1, 2, 3, 4]
+            assert data["avg_energy"].tolist() == [0.0, 0.5, 1.0, 1.5, 2.0]
+        assert not sink.path.with_name(sink.path.name + ".parts").exists()  # chunks merged and removed
+
+
+def test_phase_timer_rows():
+    timer = metrics.PhaseTimer(["a", "b"])
+    timer.start()
+    timer.lap("a")
+    timer.lap("a")
+    timer.lap("b")
+    row = timer.row()
+    assert list(row) == ["t_a_ms", "t_b_ms", "t_step_ms"]
+    assert all(v >= 0 for v in row.values())
+    assert row["t_step_ms"] >= row["t_a_ms"]
+    assert timer.row() == {"t_a_ms": 0.0, "t_b_ms": 0.0, "t_step_ms": 0.0}  # cleared by row()
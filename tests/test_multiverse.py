@@ -30,3 +30,116 @@ def test_multiverse_runs(tmp_path: Path):
         assert mfile.exists()
         lines = mfile.read_text(encoding="utf-8").strip().splitlines()
         assert len(lines) >= 2  # header + data row
+
+
+def test_multiverse_parallel_matches_serial(tmp_path: Path):
+    import pytest
+    from lifeos.multiverse_engine import MultiverseError
+
+    loci = [
+        Locus(name="size", type="float", min=0.5, max=3.0),
+        Locus(name="energy", type="int", min=0, max=100),
+        Locus(name="color", type="enum", enum=["red", "green", "blue"]),
+    ]
+    scenarios = [Scenario(name="a", policy="rational"), Scenario(name="b", policy="spiritual")]
+    files = {}
+    for workers in (1, 2):
+        mv = Multiverse(base_seed=7, loci=loci, population_size=20, generations=6,
+                        mutation_rate=0.05, scenarios=scenarios, workers=workers)
+        outputs = mv.run_all(tmp_path / f"w{workers}")
+        assert set(mv.wall_times) == {"a", "b"}
+        files[workers] = {name: (path / "metrics.csv").read_text(encoding="utf-8") for name, path in outputs.items()}
+    assert files[1] == files[2]
+
+    # a failing world is reported after the others finish
+    mv = Multiverse(base_seed=7, loci=loci, population_size=20, generations=3, mutation_rate=0.05,
+                    scenarios=scenarios + [Scenario(name="bad\0name")], workers=2)
+    with pytest.raises(MultiverseError) as err:
+        mv.run_all(tmp_path / "fail")
+    assert set(err.value.failures) == {"bad\0name"}
+    assert set(err.value.outputs) == {"a", "b"}
+
+
+def test_vector_world_matches_world_rules(tmp_path: Path):
+    import csv
+    import json
+    from lifeos.multiverse_engine import World, VectorWorld
+
+    # degenerate loci make every genome identical, so both engines are deterministic
+    loci = [
+        Locus(name="size", type="float", min=1.0, max=1.0),
+        Locus(name="energy", type="int", min=20, max=20),
+        Locus(name="color", type="enum", enum=["red"]),
+    ]
+    metrics = {}
+    for cls in (World, VectorWorld):
+        world = cls(name="w", loci=loci, population_size=9, generations=6, seed=1,
+                    mutation_rate=0.0, policy_name="rational")
+        world.run(tmp_path / cls.__name__)
+        with (tmp_path / cls.__name__ / "metrics.csv").open() as f:
+            metrics[cls] = list(csv.DictReader(f))
+    assert metrics[World] == metrics[VectorWorld]
+    assert [r["avg_energy"] for r in metrics[VectorWorld]][:4] == ["20.0", "25.0", "30.0", "28.0"]
+
+    lineage = json.loads((tmp_path / "VectorWorld" / "lineage.json").read_text())
+    assert len(lineage) == 9 * 7 and lineage["0"] is None
+    assert all(len(p) == 2 for k, p in lineage.items() if int(k) >= 9)
+
+
+def test_multiverse_vector_engine_scenario(tmp_path: Path):
+    loci = [
+        Locus(name="size", type="float", min=0.5, max=3.0),
+        Locus(name="energy", type="int", min=0, max=100),
+        Locus(name="color", type="enum", enum=["red", "green", "blue"]),
+    ]
+    mv = Multiverse(base_seed=3, loci=loci, population_size=40, generations=5, mutation_rate=0.05,
+                    scenarios=[Scenario(name="vec", policy="spiritual", engine="vector")])
+    outputs = mv.run_all(tmp_path)
+    lines = (outputs["vec"] / "metrics.csv").read_text(encoding="utf-8").strip().splitlines()
+    assert len(lines) == 7 and lines[-1].split(",")[2] == "40"
+
+
+def test_world_timings_columns(tmp_path: Path):
+    import csv
+    from lifeos.multiverse_engine import World, VectorWorld
+
+    loci = [
+        Locus(name="size", type="float", min=0.5, max=3.0),
+        Locus(name="energy", type="int", min=0, max=100),
+        Locus(name="color", type="enum", enum=["red", "green", "blue"]),
+    ]
+    for cls in (World, VectorWorld):
+        rows = {}
+        for timings in (False, True):
+            world = cls(name="w", loci=loci, population_size=20, generations=4, seed=2,
+                        mutation_rate=0.05, timings=timings)
+            world.run(tmp_path / f"{cls.__name__}_{timings}")
+            with (tmp_path / f"{cls.__name__}_{timings}" / "metrics.csv").open() as f:
+                rows[timings] = list(csv.DictReader(f))
+        columns = [f"t_{p}_ms" for p in cls.step_phases] + ["t_step_ms"]
+        assert list(rows[True][0])[-len(columns):] == columns
+        assert [{k: v for k, v in r.items() if k not in columns} for r in rows[True]] == rows[False]
+
+
+def test_engines_agree_when_energy_locus_is_not_at_index_1(tmp_path: Path):
+    import csv
+    from lifeos.multiverse_engine import World, VectorWorld
+
+    # traits are positional: locus 1 is read and written as energy whatever the names say
+    loci = [
+        Locus(name="size", type="float", min=1.0, max=1.0),
+        Locus(name="stamina", type="int", min=20, max=20),
+        Locus(name="energy", type="int", min=70, max=70),
+    ]
+    metrics = {}
+    for cls in (World, VectorWorld):
+        world = cls(name="w", loci=loci, population_size=9, generations=4, seed=1,
+                    mutation_rate=0.0, policy_name="rational")
+        world.run(tmp_path / cls.__name__)
+        with (tmp_path / cls.__name__ / "metrics.csv").open() as f:
+            metrics[cls] = list(csv.DictReader(f))
+        if cls is World:
+            assert {ind.genome.values[2] for ind in world.population} == {70}
+            assert all(ind.genome.values[1] != 20 for ind in world.population)
+    assert metrics[World] == metrics[VectorWorld]
+    assert [r["avg_energy"] for r in metrics[World]][:4] == ["20.0", "25.0", "30.0", "28.0"]
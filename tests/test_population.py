@@ -0,0 +1,49 @@
+from lifeos.lineage import Individual
+from lifeos.population import PopulationIndex, CoupleRegistry
+
+
+def test_population_index_lookup_and_rebuild():
+    pop = [Individual(id=i, genome=None) for i in (3, 5, 8)]
+    index = PopulationIndex(pop)
+    assert index.get(5) is pop[1]
+    assert index.get(4) is None
+
+    newborn = Individual(id=9, genome=None)
+    pop.append(newborn)
+    index.extend([newborn])
+    assert index.slot(9) == 3
+
+    survivors = [ind for ind in pop if ind.id != 5]
+    index.rebuild(survivors)
+    assert 5 not in index and index.get(9) is newborn
+
+
+def test_couple_registry_ids_and_caps():
+    reg = CoupleRegistry()
+    c0 = reg.register(0, 1, cap=4)
+    c1 = reg.register(2, 3, cap=None)
+    assert (c0, c1) == (0, 1)
+    assert reg.members[c0] == (0, 1)
+
+    reg.record_birth(c0)
+    assert not reg.at_cap(c0)
+    reg.record_birth(c0)
+    assert reg.total_children(c0) == 4 and reg.at_cap(c0)
+
+    for _ in range(100):
+        reg.record_birth(c1)
+    assert not reg.at_cap(c1)
+
+
+def test_columnar_population_slots_and_growth():
+    from lifeos.population import ColumnarPopulation, NO_ID
+
+    cols = ColumnarPopulation(capacity=2)
+    for agent_id in range(5):
+        assert cols.add(agent_id + 10) == agent_id
+    assert cols.capacity >= 5 and len(cols) == 5
+    assert cols.partner_id[0] == NO_ID and cols.energy[4] == 50.0
+
+    cols.kill([11, 13])
+    assert cols.live_slots().tolist() == [0, 2, 4]
+    assert cols.ids[cols.live_slots()].tolist() == [10, 12, 14]
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from lifeos import prime_map
+from lifeos.genome import Genome, GenomeSchema, Locus
+from lifeos.prime_map import PrimeCodec
+
+LOCI = [
+    Locus(name="size", type="float", min=0.5, max=3.0),
+    Locus(name="energy", type="int", min=0, max=100),
+    Locus(name="color", type="enum", enum=["red", "green", "blue"]),
+]
+
+
+def test_prime_symbols_round_trip():
+    assert prime_map.primes(6).tolist() == [2, 3, 5, 7, 11, 13]
+    levels = np.arange(5000)
+    assert np.array_equal(prime_map.from_primes(prime_map.to_primes(levels)), levels)
+    with pytest.raises(ValueError):
+        prime_map.from_primes([4])
+
+    values = [0.0, 0.25, 1.0]
+    assert prime_map.encode(values)[0] == 2
+    assert np.allclose(prime_map.decode(prime_map.encode(values)), values, atol=0.5 / 1023)
+
+
+def test_codec_packs_and_restores_population(tmp_path):
+    codec = PrimeCodec(LOCI, float_bits=10)
+    assert codec.bits == [10, 7, 2] and codec.bytes_per_genome == 8
+
+    genes = GenomeSchema.of(LOCI).random_matrix(500, np.random.default_rng(0))
+    packed = codec.encode(genes)
+    assert packed.shape == (500, 1) and packed.dtype == np.uint64
+
+    restored = codec.decode(packed)
+    assert np.array_equal(restored[:, 1:], genes[:, 1:])                 # ints and enums exact
+    assert np.abs(restored[:, 0] - genes[:, 0]).max() <= 2.5 / 1023 / 2 + 1e-12
+
+    codec.save(tmp_path / "pop.losp", genes)
+    loaded, matrix = PrimeCodec.load(tmp_path / "pop.losp")
+    assert loaded.bits == codec.bits and np.array_equal(matrix, restored)
+
+    genomes = codec.decode_genomes(codec.encode_genomes([Genome(LOCI, [1.0, 42, "blue"])]))
+    assert genomes[0].values[1:] == [42, "blue"]
@@ -23,3 +23,77 @@ def test_reproduce_creates_child():
         c in (p1, p2)
         for c, p1, p2 in zip(child.values, parent1.values, parent2.values)
     )
+
+
+def test_batch_crossover_modes():
+    import numpy as np
+    import pytest
+    from lifeos.reproduction import ReproductionModel
+
+    L = 12
+    genes = np.vstack([np.zeros(L), np.ones(L)])   # parent a = row 0, parent b = row 1
+    a, b = np.zeros(500, dtype=np.int64), np.ones(500, dtype=np.int64)
+    rng = np.random.default_rng(0)
+
+    uniform = ReproductionModel(crossover_rate=0.5).mate_batch(genes, a, b, rng)
+    assert uniform.shape == (500, L) and 0.4 < uniform.mean() < 0.6
+
+    two_point = ReproductionModel(mode="k_point", points=2).mate_batch(genes, a, b, rng)
+    switches = np.count_nonzero(np.diff(two_point, axis=1), axis=1)
+    assert (switches == 2).all()
+
+    # a linkage map of zeros never recombines; ones recombine at every boundary
+    tight = ReproductionModel(mode="linkage", linkage=[0.0] * (L - 1)).mate_batch(genes, a, b, rng)
+    assert set(tight.sum(axis=1).tolist()) <= {0.0, float(L)}
+    loose = ReproductionModel(mode="linkage", linkage=[1.0] * (L - 1)).mate_batch(genes, a, b, rng)
+    assert (np.count_nonzero(np.diff(loose, axis=1), axis=1) == L - 1).all()
+
+    with pytest.raises(ValueError):
+        ReproductionModel(mode="linkage", linkage=[0.1]).mate_batch(genes, a, b, rng)
+
+
+def test_mate_cohort_and_segment_mate():
+    import numpy as np
+    from lifeos.genome import Genome, Locus
+    from lifeos.reproduction import ReproductionModel
+
+    loci = [Locus(name=f"g{i}", type="int", min=0, max=9) for i in range(6)]
+    pa = [Genome(loci, [0] * 6), Genome.from_codes(loci, [1.0] * 6)]
+    pb = [Genome(loci, [5] * 6), Genome.from_codes(loci, [7.0] * 6)]
+    kids = ReproductionModel(mode="k_point", points=1).mate_cohort(pa, pb, np.random.default_rng(3))
+    assert len(kids) == 2 and all(k.packed for k in kids)
+    assert set(kids[0].values) <= {0, 5} and set(kids[1].values) <= {1, 7}
+
+    child = ReproductionModel(mode="k_point", points=1).mate(pa[0], pb[0], random.Random(1))
+    vals = list(child.values)
+    assert sum(1 for x, y in zip(vals, vals[1:]) if x != y) == 1
+
+
+def test_adam_eve_cohort_reproduction(tmp_path):
+    from lifeos.adam_eve_engine import AdamEveWorld
+    from lifeos.genome import Locus
+
+    loci = [Locus(name="size", type="float", min=0.5, max=3.0),
+            Locus(name="energy", type="int", min=0, max=100)]
+    runs = []
+    for rng_mode in ("mt", "mt", "counter"):
+        world = AdamEveWorld(loci=loci, num_couples=4, generations=6, seed=11,
+                             repro_mode="cohort", rng_mode=rng_mode)
+        world.run(tmp_path / f"{rng_mode}{len(runs)}")
+        assert all(ind.genome is not None for ind in world.lineage.individuals.values())
+        runs.append([list(ind.genome.values) for ind in world.lineage.individuals.values()])
+    assert runs[0] == runs[1] and len(runs[0]) > 8
+
+
+def test_adam_eve_bulk_founders(tmp_path):
+    from lifeos.adam_eve_engine import AdamEveWorld
+    from lifeos.genome import Locus
+
+    loci = [Locus(name="size", type="float", min=0.5, max=3.0),
+            Locus(name="color", type="enum", enum=["red", "blue"])]
+    founders = []
+    for rng_mode in ("mt", "mt", "counter"):
+        world = AdamEveWorld(loci=loci, num_couples=50, generations=1, seed=5, founder_init="bulk", rng_mode=rng_mode)
+        world.initialize_founders()
+        founders.append([list(ind.genome.values) for ind in world.population])
+    assert len(founders[0]) == 100 and founders[0] == founders[1] != founders[2]
@@ -0,0 +1,24 @@
+import numpy as np
+
+from lifeos.sentient_mk6 import MindBatch, MindConfig
+
+
+def test_mind_batch_follows_farming_rules():
+    batch = MindBatch(MindConfig(), seed=3)
+    energy = np.array([10.0, 54.0, 80.0, 90.0])
+    curiosity = np.full(4, 0.5)
+    d = batch.decide(1, energy, {"food": 1000, "population": 4}, curiosity=curiosity)
+
+    # plenty of food: only hungry agents farm, with effort in (0, 1]
+    assert d.farm_effort[0] > 0 and d.farm_effort[1] > 0
+    assert d.farm_effort[2] == 0 and d.farm_effort[3] == 0
+    assert np.all(d.farm_effort <= 1.0)
+    assert d.sleep.dtype == bool and d.share.shape == (4,)
+    assert not d.share[0] and not d.share[1]
+    assert np.all(curiosity[d.dream] == 0.55)
+
+
+def test_mind_batch_food_shortage_makes_everyone_farm():
+    batch = MindBatch(seed=1)
+    d = batch.decide(1, np.full(50, 90.0), {"food": 0, "population": 50})
+    assert np.all(d.farm_effort >= 0.7)
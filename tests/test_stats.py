@@ -0,0 +1,55 @@
+from statistics import mean, stdev
+
+import numpy as np
+
+from lifeos.genome import Genome, Locus
+from lifeos.stats import RunningStats, PopulationStats
+
+LOCI = [
+    Locus(name="size", type="float", min=0.0, max=1.0),
+    Locus(name="energy", type="int", min=0, max=100),
+    Locus(name="color", type="enum", enum=["red", "green", "blue"]),
+]
+
+
+def test_running_stats_scalar_and_array_agree():
+    values = [3.0, 5.5, 4.0, 10.0, 7.25]
+    st = RunningStats()
+    for v in values:
+        st.add(v)
+    assert abs(st.mean - mean(values)) < 1e-12 and abs(st.std - stdev(values)) < 1e-12
+    assert (st.min, st.max, st.total) == (3.0, 10.0, sum(values))
+    lo, hi = st.band()
+    assert lo < st.mean < hi
+
+    merged = RunningStats()
+    merged.add(values[0])
+    merged.add_array(np.array(values[1:]))
+    assert abs(merged.mean - st.mean) < 1e-12 and abs(merged.std - st.std) < 1e-12
+    assert abs(merged.total - st.total) < 1e-9
+
+    ints = RunningStats()
+    ints.add_array(np.arange(1, 1001))
+    assert ints.total == 500500 and ints.average == 500.5
+
+
+def test_population_stats_genomes_and_matrix_agree():
+    genomes = [Genome(LOCI, [0.1, 10, "red"]), Genome(LOCI, [0.5, 55, "blue"]),
+               Genome(LOCI, [0.95, 100, "blue"]), Genome(LOCI, [0.3, 20.5, "green"])]
+    ps = PopulationStats.from_genomes(LOCI, genomes, bins=4)
+    # the non-int energy value is ignored, like World._avg_energy
+    assert ps.locus(1).n == 3 and ps.locus(1).average == 55
+    assert abs(ps.genetic_diversity() - stdev([0.1, 0.5, 0.95, 0.3])) < 1e-12
+    summary = ps.summary()
+    assert summary["size"]["hist"] == [1, 1, 1, 1]
+    assert summary["color"]["hist"] == [1, 1, 2]
+
+    matrix = np.array([[0.1, 10, 0], [0.5, 55, 2], [0.95, 100, 2]])
+    pm = PopulationStats.from_matrix(LOCI, matrix, bins=4)
+    pg = PopulationStats.from_genomes(LOCI, genomes[:3], bins=4)
+    for name, entry in pg.summary().items():
+        other = pm.summary()[name]
+        assert other["hist"] == entry["hist"]
+        for key in ("n", "mean", "std", "min", "max"):
+            if key in entry:
+                assert abs(other[key] - entry[key]) < 1e-9
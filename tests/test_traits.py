@@ -12,3 +12,34 @@ def test_trait_decoder():
     assert traits.energy == 80
     assert traits.color == "blue"
     assert traits.as_dict() == {"size": 1.5, "energy": 80, "color": "blue"}
+
+
+def test_trait_decoder_is_positional_and_caches():
+    from lifeos.genome import Locus
+
+    # names do not move traits: size, energy and color are loci 0, 1 and 2
+    loci = [Locus(name="color", type="float", min=0.5, max=3.0),
+            Locus(name="energy", type="int", min=0, max=100),
+            Locus(name="size", type="enum", enum=["red", "blue"])]
+    decoder = TraitDecoder(loci)
+    assert decoder.index == {"size": 0, "energy": 1, "color": 2}
+
+    genome = Genome(loci=loci, values=[2.0, 40, "red"])
+    first = decoder.decode(genome)
+    assert (first.size, first.energy, first.color) == (2.0, 40, "red")
+    assert decoder.decode(genome) is first          # cached
+
+    twin = genome.share()
+    assert decoder.decode(twin) is first             # clones share the cached decode
+    twin.set_value(1, 45)                            # write invalidates only the writer
+    assert decoder.decode(twin).energy == 45
+    assert decoder.decode(genome) is first
+
+    genome.values = [1.0, 10, "blue"]                # replacing values invalidates too
+    assert decoder.decode(genome).color == "blue"
+
+    cols = decoder.decode_batch([genome, twin])
+    assert cols["size"].tolist() == [1.0, 2.0]
+    assert cols["energy"].tolist() == [10, 45]
+    assert cols["color"].tolist() == ["blue", "red"]
+    assert decoder.decode_batch([])["size"].shape == (0,)